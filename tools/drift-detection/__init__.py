@@ -10,10 +10,24 @@ from docker_inspector import (
     SSHConnectionError,
     DockerConnectionError,
     ContainerInspectionError,
+    parse_container_attrs,
     inspect_host,
     inspect_multiple_hosts,
+    iter_hosts,
 )
 
+from async_inspector import AsyncDockerInspector
+from connection_pool import ConnectionPool, configure_default_pool
+
+from output import ResultWriter, write_results
+from snapshot_store import SnapshotStore
+from snapshot_diff import Change, diff_results
+from history_store import HistoryStore
+from image_cache import ImageConfigCache
+from baseline_loader import BaselineError, BaselineLoader
+from fleet_index import FleetIndex
+from drift_engine import DriftEngine, drift_container
+
 from config import Config, load_config
 
 __version__ = "0.1.0"
@@ -23,8 +37,25 @@ __all__ = [
     "SSHConnectionError",
     "DockerConnectionError",
     "ContainerInspectionError",
+    "parse_container_attrs",
     "inspect_host",
     "inspect_multiple_hosts",
+    "iter_hosts",
+    "AsyncDockerInspector",
+    "ConnectionPool",
+    "configure_default_pool",
+    "ResultWriter",
+    "write_results",
+    "SnapshotStore",
+    "Change",
+    "diff_results",
+    "HistoryStore",
+    "ImageConfigCache",
+    "BaselineLoader",
+    "BaselineError",
+    "FleetIndex",
+    "DriftEngine",
+    "drift_container",
     "Config",
     "load_config",
 ]
@@ -0,0 +1,657 @@
+"""Asyncio Docker container inspection over SSH.
+
+This module mirrors ``docker_inspector`` for use inside an event loop. SSH
+and the Docker Engine HTTP API both run on asyncssh, so one process can scan
+many hosts concurrently without dedicating a thread to each of them. Results
+are the same ``ContainerInfo`` objects the blocking inspector returns.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+try:
+    import asyncssh
+except ImportError:  # pragma: no cover - optional dependency
+    asyncssh = None
+
+from docker.utils import convert_filters
+
+from docker_inspector import (
+    ContainerInfo,
+    ContainerInspectionError,
+    DockerConnectionError,
+    SSHConnectionError,
+    loads_json,
+    parse_inspect_response,
+)
+from ssh_transport import DEFAULT_DOCKER_SOCKET
+
+
+logger = logging.getLogger(__name__)
+
+
+async def _read_response(reader) -> Tuple[int, bytes]:
+    """Read one HTTP/1.1 response from an asyncssh stream.
+    
+    Args:
+        reader: asyncssh SSHReader positioned at a status line
+    
+    Returns:
+        Tuple of (status code, body bytes)
+    
+    Raises:
+        DockerConnectionError: If the response is malformed or truncated
+    """
+    status_line = await reader.readline()
+    parts = status_line.split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith(b'HTTP/'):
+        raise DockerConnectionError(
+            f"Malformed HTTP status line: {status_line!r}"
+        )
+    status = int(parts[1])
+    
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    
+    try:
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(b';', 1)[0].strip(), 16)
+                if size == 0:
+                    # Skip optional trailers up to the terminating blank line
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        else:
+            body = await reader.read()
+    except (asyncio.IncompleteReadError, ValueError) as e:
+        raise DockerConnectionError(f"Truncated HTTP response: {e}")
+    
+    return status, body
+
+
+class AsyncDockerInspector:
+    """Asyncio Docker inspector that connects via SSH to remote hosts.
+    
+    The Docker API is reached through ``direct-streamlocal`` channels to the
+    remote Docker socket on a single asyncssh connection per host.
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        ssh_key_path: Optional[str] = None,
+        ssh_timeout: int = 10,
+        docker_timeout: int = 30,
+        docker_socket: str = DEFAULT_DOCKER_SOCKET
+    ) -> None:
+        """Initialize async Docker inspector.
+        
+        Args:
+            host: Target host IP address or hostname
+            username: SSH username
+            ssh_key_path: Path to SSH private key (None to use SSH agent)
+            ssh_timeout: SSH connection timeout in seconds
+            docker_timeout: Docker API timeout in seconds
+            docker_socket: Path of the Docker socket on the target host
+        """
+        self.host = host
+        self.username = username
+        self.ssh_key_path = ssh_key_path
+        self.ssh_timeout = ssh_timeout
+        self.docker_timeout = docker_timeout
+        self.docker_socket = docker_socket
+        
+        self.ssh_conn = None
+        self.api_version: Optional[str] = None
+        
+        logger.info(f"Initialized AsyncDockerInspector for {username}@{host}")
+    
+    async def connect(self) -> None:
+        """Establish SSH connection to target host.
+        
+        Raises:
+            SSHConnectionError: If SSH connection fails
+        """
+        if asyncssh is None:
+            raise SSHConnectionError(
+                "Install the asyncssh package to use AsyncDockerInspector"
+            )
+        
+        try:
+            logger.info(f"Connecting to {self.host} via SSH...")
+            
+            connect_kwargs = {
+                'username': self.username,
+                'known_hosts': None,
+                'connect_timeout': self.ssh_timeout,
+            }
+            
+            if self.ssh_key_path:
+                connect_kwargs['client_keys'] = [self.ssh_key_path]
+            
+            self.ssh_conn = await asyncssh.connect(self.host, **connect_kwargs)
+            
+            logger.info(f"Successfully connected to {self.host}")
+            
+        except asyncssh.PermissionDenied as e:
+            raise SSHConnectionError(
+                f"Authentication failed for {self.username}@{self.host}: {e}"
+            )
+        except asyncssh.Error as e:
+            raise SSHConnectionError(
+                f"SSH connection error to {self.host}: {e}"
+            )
+        except Exception as e:
+            raise SSHConnectionError(
+                f"Failed to connect to {self.host}: {e}"
+            )
+    
+    async def connect_docker(self) -> None:
+        """Negotiate the Docker API version over the SSH connection.
+        
+        Raises:
+            DockerConnectionError: If Docker connection fails
+        """
+        if not self.ssh_conn:
+            raise DockerConnectionError("SSH connection not established")
+        
+        try:
+            logger.info(f"Connecting to Docker on {self.host}...")
+            
+            [(status, body)] = await self._get_many(['/version'])
+            if status != 200:
+                raise DockerConnectionError(
+                    f"Failed to connect to Docker on {self.host}: HTTP {status}"
+                )
+            self.api_version = loads_json(body)['ApiVersion']
+            
+            logger.info(f"Successfully connected to Docker on {self.host}")
+            
+        except DockerConnectionError:
+            raise
+        except (asyncssh.Error, OSError, asyncio.TimeoutError) as e:
+            raise DockerConnectionError(
+                f"Failed to connect to Docker on {self.host}: {e}"
+            )
+        except (KeyError, ValueError) as e:
+            raise DockerConnectionError(
+                f"Unexpected error connecting to Docker on {self.host}: {e}"
+            )
+    
+    async def _iter_responses(
+        self,
+        paths: List[str]
+    ) -> AsyncIterator[Tuple[int, bytes]]:
+        """Pipeline GET requests on one channel, yielding responses as read.
+        
+        All requests are written up front; ``docker_timeout`` bounds the
+        whole exchange.
+        
+        Args:
+            paths: Request paths, including any API version prefix
+        
+        Yields:
+            (status, body) tuples in request order
+        """
+        if not paths:
+            return
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.docker_timeout
+        
+        reader, writer = await asyncio.wait_for(
+            self.ssh_conn.open_unix_connection(self.docker_socket),
+            self.docker_timeout
+        )
+        
+        async def write_requests() -> None:
+            for path in paths:
+                writer.write(
+                    f"GET {path} HTTP/1.1\r\nHost: docker\r\n\r\n".encode()
+                )
+            await writer.drain()
+        
+        writing = asyncio.ensure_future(write_requests())
+        try:
+            for _ in paths:
+                yield await asyncio.wait_for(
+                    _read_response(reader), max(0.0, deadline - loop.time())
+                )
+            await writing
+        finally:
+            writing.cancel()
+            writer.close()
+    
+    async def _get_many(self, paths: List[str]) -> List[Tuple[int, bytes]]:
+        """Pipeline GET requests on one channel to the Docker socket.
+        
+        Args:
+            paths: Request paths, including any API version prefix
+        
+        Returns:
+            List of (status, body) tuples in request order
+        """
+        return [response async for response in self._iter_responses(paths)]
+    
+    def _api_path(self, path: str) -> str:
+        if not self.api_version:
+            raise DockerConnectionError("Docker client not initialized")
+        return f"/v{self.api_version}{path}"
+    
+    async def list_containers(
+        self,
+        all_containers: bool = False,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """List container IDs on the target host.
+        
+        Args:
+            all_containers: If True, include stopped containers
+            filters: Docker-native filters sent to the daemon
+        
+        Returns:
+            List of container IDs
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+            ContainerInspectionError: If listing fails
+        """
+        query = {'all': 1 if all_containers else 0}
+        if filters:
+            query['filters'] = convert_filters(filters)
+        path = self._api_path(f"/containers/json?{urlencode(query)}")
+        
+        try:
+            [(status, body)] = await self._get_many([path])
+            if status != 200:
+                raise ContainerInspectionError(
+                    f"Failed to list containers on {self.host}: HTTP {status}"
+                )
+            container_ids = [c['Id'] for c in loads_json(body)]
+            
+        except (asyncssh.Error, OSError, asyncio.TimeoutError,
+                DockerConnectionError, ValueError, KeyError) as e:
+            raise ContainerInspectionError(
+                f"Failed to list containers on {self.host}: {e}"
+            )
+        
+        logger.info(f"Found {len(container_ids)} container(s) on {self.host}")
+        
+        return container_ids
+    
+    async def inspect_containers(
+        self,
+        container_ids: List[str]
+    ) -> Tuple[List[ContainerInfo], List[str]]:
+        """Inspect many containers in a single pipelined round trip.
+        
+        Args:
+            container_ids: Container IDs to inspect
+        
+        Returns:
+            Tuple of (ContainerInfo objects, IDs that could not be inspected)
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+            ContainerInspectionError: If the bulk request fails
+        """
+        paths = [
+            self._api_path(f"/containers/{container_id}/json")
+            for container_id in container_ids
+        ]
+        
+        try:
+            responses = await self._get_many(paths)
+        except (asyncssh.Error, OSError, asyncio.TimeoutError,
+                DockerConnectionError) as e:
+            raise ContainerInspectionError(
+                f"Bulk inspection failed on {self.host}: {e}"
+            )
+        
+        results = []
+        failed = []
+        
+        for container_id, (status, body) in zip(container_ids, responses):
+            try:
+                results.append(
+                    parse_inspect_response(self.host, container_id, status, body)
+                )
+            except ContainerInspectionError as e:
+                logger.error(f"Failed to inspect {container_id[:12]}: {e}")
+                failed.append(container_id)
+        
+        return results, failed
+    
+    async def inspect_container(self, container_id: str) -> ContainerInfo:
+        """Inspect a specific container and extract configuration.
+        
+        Args:
+            container_id: Container ID or name
+        
+        Returns:
+            ContainerInfo object with extracted data
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+            ContainerInspectionError: If inspection fails
+        """
+        results, _ = await self.inspect_containers([container_id])
+        if not results:
+            raise ContainerInspectionError(
+                f"Failed to inspect container {container_id} on {self.host}"
+            )
+        return results[0]
+    
+    async def inspect_all_containers(
+        self,
+        all_containers: bool = False,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[ContainerInfo]:
+        """Inspect all containers on the target host.
+        
+        Args:
+            all_containers: If True, include stopped containers
+            filters: Docker-native filters sent to the daemon
+        
+        Returns:
+            List of ContainerInfo objects
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+            ContainerInspectionError: If inspection fails
+        """
+        container_ids = await self.list_containers(
+            all_containers=all_containers, filters=filters
+        )
+        
+        results, failed = await self.inspect_containers(container_ids)
+        
+        if failed:
+            logger.warning(
+                f"Failed to inspect {len(failed)} container(s): "
+                f"{', '.join(c[:12] for c in failed)}"
+            )
+        
+        logger.info(
+            f"Successfully inspected {len(results)} container(s) on {self.host}"
+        )
+        
+        return results
+    
+    async def iter_containers(
+        self,
+        all_containers: bool = False,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Union[ContainerInfo, ContainerInspectionError]]:
+        """Yield containers on the target host as each response is read.
+        
+        Streaming counterpart of ``inspect_all_containers()``. A container
+        that cannot be inspected is yielded as a ContainerInspectionError
+        carrying its ``container_id`` instead of aborting the stream.
+        
+        Args:
+            all_containers: If True, include stopped containers
+            filters: Docker-native filters sent to the daemon
+        
+        Yields:
+            ContainerInfo objects, or ContainerInspectionError instances for
+            containers that failed
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+            ContainerInspectionError: If listing or the bulk request fails
+        """
+        container_ids = await self.list_containers(
+            all_containers=all_containers, filters=filters
+        )
+        paths = [
+            self._api_path(f"/containers/{container_id}/json")
+            for container_id in container_ids
+        ]
+        
+        responses = self._iter_responses(paths)
+        try:
+            for container_id in container_ids:
+                try:
+                    status, body = await responses.__anext__()
+                except (asyncssh.Error, OSError, asyncio.TimeoutError) as e:
+                    raise ContainerInspectionError(
+                        f"Bulk inspection failed on {self.host}: {e}"
+                    )
+                
+                try:
+                    yield parse_inspect_response(
+                        self.host, container_id, status, body
+                    )
+                except ContainerInspectionError as e:
+                    logger.error(f"Failed to inspect {container_id[:12]}: {e}")
+                    yield e
+        finally:
+            await responses.aclose()
+    
+    async def disconnect(self) -> None:
+        """Close the SSH connection."""
+        if self.ssh_conn:
+            try:
+                self.ssh_conn.close()
+                await self.ssh_conn.wait_closed()
+                logger.debug(f"Closed SSH connection to {self.host}")
+            except Exception as e:
+                logger.warning(f"Error closing SSH connection: {e}")
+            finally:
+                self.ssh_conn = None
+                self.api_version = None
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        await self.connect_docker()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
+
+
+async def inspect_host(
+    host: str,
+    username: str,
+    ssh_key_path: Optional[str] = None,
+    ssh_timeout: int = 10,
+    docker_timeout: int = 30,
+    all_containers: bool = False,
+    filters: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Inspect all containers on a single host.
+    
+    Args:
+        host: Target host IP address
+        username: SSH username
+        ssh_key_path: Path to SSH private key
+        ssh_timeout: SSH connection timeout
+        docker_timeout: Docker API timeout
+        all_containers: Include stopped containers
+        filters: Docker-native filters sent to the daemon
+    
+    Returns:
+        Dictionary with host info and container data; a filtered scan
+        also records its ``filters``, since it only saw part of the host
+    
+    Raises:
+        SSHConnectionError: If SSH connection fails
+        DockerConnectionError: If Docker connection fails
+        ContainerInspectionError: If inspection fails
+    """
+    inspector = AsyncDockerInspector(
+        host=host,
+        username=username,
+        ssh_key_path=ssh_key_path,
+        ssh_timeout=ssh_timeout,
+        docker_timeout=docker_timeout
+    )
+    
+    try:
+        await inspector.connect()
+        await inspector.connect_docker()
+        
+        containers = await inspector.inspect_all_containers(
+            all_containers=all_containers, filters=filters
+        )
+        
+        entry = {
+            'host': host,
+            'timestamp': datetime.utcnow().isoformat(),
+            'container_count': len(containers),
+            'containers': [c.to_dict() for c in containers]
+        }
+        if filters:
+            entry['filters'] = filters
+        return entry
+        
+    finally:
+        await inspector.disconnect()
+
+
+async def _scan_host_entry(
+    semaphore: asyncio.Semaphore,
+    host: str,
+    host_timeout: Optional[float],
+    **kwargs: Any
+) -> Dict[str, Any]:
+    """Scan one host under the semaphore, converting errors into an entry."""
+    async with semaphore:
+        try:
+            logger.info(f"Processing host: {host}")
+            return await asyncio.wait_for(
+                inspect_host(host=host, **kwargs), host_timeout
+            )
+            
+        except asyncio.TimeoutError:
+            error = f"Host scan exceeded {host_timeout}s deadline"
+        except (SSHConnectionError, DockerConnectionError,
+                ContainerInspectionError) as e:
+            error = str(e)
+        
+        logger.error(f"Failed to inspect {host}: {error}")
+        return {
+            'host': host,
+            'error': error,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+
+async def inspect_multiple_hosts(
+    hosts: List[str],
+    username: str,
+    ssh_key_path: Optional[str] = None,
+    ssh_timeout: int = 10,
+    docker_timeout: int = 30,
+    all_containers: bool = False,
+    max_workers: int = 16,
+    host_timeout: Optional[float] = None,
+    filters: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Inspect containers on multiple hosts concurrently.
+    
+    Args:
+        hosts: List of target host IP addresses
+        username: SSH username
+        ssh_key_path: Path to SSH private key
+        ssh_timeout: SSH connection timeout
+        docker_timeout: Docker API timeout
+        all_containers: Include stopped containers
+        max_workers: Maximum number of hosts scanned at the same time
+        host_timeout: Seconds a host may take once its scan has started
+            before it is cancelled and reported as failed
+        filters: Docker-native filters sent to every host's daemon
+    
+    Returns:
+        Dictionary with results for all hosts, in the order of ``hosts``
+    """
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+    
+    timestamp = datetime.utcnow().isoformat()
+    host_results = await asyncio.gather(*(
+        _scan_host_entry(
+            semaphore,
+            host,
+            host_timeout,
+            username=username,
+            ssh_key_path=ssh_key_path,
+            ssh_timeout=ssh_timeout,
+            docker_timeout=docker_timeout,
+            all_containers=all_containers,
+            filters=filters
+        )
+        for host in hosts
+    ))
+    
+    return {
+        'timestamp': timestamp,
+        'hosts': list(host_results)
+    }
+
+
+async def iter_hosts(
+    hosts: List[str],
+    username: str,
+    ssh_key_path: Optional[str] = None,
+    ssh_timeout: int = 10,
+    docker_timeout: int = 30,
+    all_containers: bool = False,
+    max_workers: int = 16,
+    host_timeout: Optional[float] = None,
+    filters: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield each host's results as soon as its scan finishes.
+    
+    Streaming counterpart of ``inspect_multiple_hosts()``: entries arrive in
+    completion order, failed hosts as entries with an ``error`` key. Scans
+    still running when the iterator is closed are cancelled.
+    
+    Args:
+        See ``inspect_multiple_hosts()``
+    
+    Yields:
+        Per-host result dictionaries
+    """
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+    
+    tasks = [
+        asyncio.ensure_future(_scan_host_entry(
+            semaphore,
+            host,
+            host_timeout,
+            username=username,
+            ssh_key_path=ssh_key_path,
+            ssh_timeout=ssh_timeout,
+            docker_timeout=docker_timeout,
+            all_containers=all_containers,
+            filters=filters
+        ))
+        for host in hosts
+    ]
+    
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,765 @@
+"""Load the expected container configuration from a homelab-apps checkout.
+
+Every stack under ``stacks/<stack>/`` is a Docker Compose project: a base
+``docker-compose.yml``, an optional ``docker-compose.<endpoint>.yml``
+override, and a ``.env`` file for variable substitution. The loader merges
+the files the way ``docker compose`` does and turns every service into a
+``ContainerInfo`` shaped like the running container it should produce, so
+baselines and scan results can be compared field by field.
+
+Files are read straight from git objects through one long-lived
+``git cat-file --batch`` process, so nothing is checked out and a whole
+repository costs one subprocess. Parsed stacks are cached on disk, keyed by
+the git blob SHAs of their compose files and the content of their ``.env``
+and checked against the content of the ``env_file:`` files they read; only
+stacks that changed since the last run are parsed again.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import posixpath
+import re
+import subprocess
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None
+
+from dotenv import dotenv_values
+
+from docker_inspector import ContainerInfo, canonical_json, loads_json
+from utils import write_atomic
+
+
+logger = logging.getLogger(__name__)
+
+BASELINE_CACHE_VERSION = 4
+
+BASE_COMPOSE_FILES = (
+    'docker-compose.yml', 'docker-compose.yaml', 'compose.yml', 'compose.yaml'
+)
+
+# $$, ${VAR}, ${VAR:-default}, ${VAR-default}, ${VAR:?error}, ${VAR:+alt}, $VAR
+_VARIABLE = re.compile(
+    r'\$(?:(?P<escaped>\$)'
+    r'|\{(?P<braced>[A-Za-z_][A-Za-z0-9_]*)'
+    r'(?:(?P<op>:?[-?+])(?P<arg>(?:\$\{[^}]*\}|[^}])*))?\}'
+    r'|(?P<named>[A-Za-z_][A-Za-z0-9_]*))'
+)
+
+
+class BaselineError(Exception):
+    """Raised when a baseline cannot be read or parsed."""
+    pass
+
+
+class GitObjectReader:
+    """Read objects from a git repository through ``git cat-file --batch``.
+    
+    One reader keeps one git process for its whole lifetime. It is not
+    thread-safe.
+    """
+    
+    def __init__(self, repo_path: Union[str, Path]) -> None:
+        """Start the git process.
+        
+        Args:
+            repo_path: Path to the repository (or any directory inside it)
+        
+        Raises:
+            BaselineError: If git cannot be started
+        """
+        self.repo_path = Path(repo_path).expanduser()
+        try:
+            self._process = subprocess.Popen(
+                ['git', '-C', str(self.repo_path), 'cat-file', '--batch'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            raise BaselineError(f"Failed to run git: {e}")
+    
+    def read(self, spec: str) -> Optional[Tuple[str, str, bytes]]:
+        """Read one object.
+        
+        Args:
+            spec: Object name, e.g. ``HEAD:stacks/plex/docker-compose.yml``
+                or a SHA
+        
+        Returns:
+            Tuple of (SHA, object type, content), or None if the object does
+            not exist
+        
+        Raises:
+            BaselineError: If the git process has exited
+        """
+        try:
+            self._process.stdin.write(spec.encode() + b'\n')
+            self._process.stdin.flush()
+        except (BrokenPipeError, ValueError):
+            pass
+        header = self._process.stdout.readline()
+        if not header:
+            stderr = self._process.stderr.read().decode(errors='replace').strip()
+            raise BaselineError(
+                f"git cat-file exited in {self.repo_path}: {stderr or 'no output'}"
+            )
+        
+        parts = header.split()
+        if len(parts) != 3:
+            # "<spec> missing" or "<spec> ambiguous"
+            return None
+        
+        sha, object_type, size = parts
+        data = self._process.stdout.read(int(size))
+        self._process.stdout.read(1)  # trailing newline
+        return sha.decode(), object_type.decode(), data
+    
+    def tree(self, spec: str) -> Optional[Dict[str, Tuple[str, str]]]:
+        """List a tree object.
+        
+        Args:
+            spec: Tree name, e.g. ``HEAD:stacks``
+        
+        Returns:
+            Mapping of entry name to (mode, SHA), or None if the tree does
+            not exist
+        """
+        obj = self.read(spec)
+        if obj is None or obj[1] != 'tree':
+            return None
+        
+        sha, _, data = obj
+        hash_size = len(sha) // 2
+        entries = {}
+        pos = 0
+        while pos < len(data):
+            space = data.index(b' ', pos)
+            nul = data.index(b'\0', space)
+            end = nul + 1 + hash_size
+            entries[data[space + 1:nul].decode()] = (
+                data[pos:space].decode(), data[nul + 1:end].hex()
+            )
+            pos = end
+        return entries
+    
+    def close(self) -> None:
+        """Stop the git process."""
+        if self._process.poll() is None:
+            self._process.stdin.close()
+            self._process.wait()
+        self._process.stdout.close()
+        self._process.stderr.close()
+    
+    def __enter__(self) -> 'GitObjectReader':
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def interpolate(value: Any, env: Dict[str, str]) -> Any:
+    """Substitute ``${VAR}`` references in every string of a compose value.
+    
+    Follows the compose rules: unset variables become empty strings,
+    ``${VAR:-x}``/``${VAR-x}`` supply defaults, ``${VAR:?msg}``/``${VAR?msg}``
+    require a value and ``$$`` is a literal ``$``.
+    
+    Args:
+        value: Parsed YAML value
+        env: Variables available for substitution
+    
+    Returns:
+        The value with all strings substituted
+    
+    Raises:
+        BaselineError: If a required variable is missing
+    """
+    if isinstance(value, dict):
+        return {key: interpolate(item, env) for key, item in value.items()}
+    if isinstance(value, list):
+        return [interpolate(item, env) for item in value]
+    if not isinstance(value, str) or '$' not in value:
+        return value
+    
+    def substitute(match: re.Match) -> str:
+        if match.group('escaped'):
+            return '$'
+        name = match.group('braced') or match.group('named')
+        op = match.group('op')
+        current = env.get(name)
+        if not op:
+            return current or ''
+        
+        unset = current is None or (op.startswith(':') and current == '')
+        arg = interpolate(match.group('arg'), env)
+        if op.endswith('-'):
+            return arg if unset else current
+        if op.endswith('+'):
+            return '' if unset else arg
+        if unset:
+            raise BaselineError(f"Required variable {name} is not set: {arg}")
+        return current
+    
+    return _VARIABLE.sub(substitute, value)
+
+
+def _as_dict(value: Any, separator: str = '=') -> Dict[str, Any]:
+    """Normalize a compose list-or-mapping (``KEY=VALUE`` items) to a dict."""
+    if isinstance(value, dict):
+        return dict(value)
+    result = {}
+    for item in value or ():
+        key, sep, item_value = str(item).partition(separator)
+        result[key] = item_value if sep else None
+    return result
+
+
+def _volume_spec(volume: Any) -> Dict[str, Any]:
+    """Normalize a short or long volume definition to the long syntax."""
+    if isinstance(volume, dict):
+        return dict(volume)
+    
+    parts = str(volume).split(':')
+    if len(parts) == 1:
+        return {'type': 'volume', 'source': '', 'target': parts[0]}
+    
+    source, target = parts[0], parts[1]
+    mode = parts[2] if len(parts) > 2 else ''
+    is_path = source.startswith(('/', '.', '~'))
+    return {
+        'type': 'bind' if is_path else 'volume',
+        'source': source,
+        'target': target,
+        'read_only': 'ro' in mode.split(','),
+        'mode': mode
+    }
+
+
+def _normalize_service(service: Dict[str, Any]) -> Dict[str, Any]:
+    """Bring a service into one canonical shape so files can be merged."""
+    service = dict(service)
+    for key in ('environment', 'labels'):
+        if key in service:
+            service[key] = _as_dict(service[key])
+    if 'networks' in service:
+        networks = service['networks']
+        service['networks'] = (
+            {name: config or {} for name, config in networks.items()}
+            if isinstance(networks, dict) else {name: {} for name in networks}
+        )
+    if 'volumes' in service:
+        service['volumes'] = [_volume_spec(v) for v in service['volumes']]
+    if 'env_file' in service:
+        env_files = service['env_file']
+        if not isinstance(env_files, list):
+            env_files = [env_files]
+        service['env_file'] = [
+            dict(f) if isinstance(f, dict) else {'path': str(f)} for f in env_files
+        ]
+    return service
+
+
+def _merge_service(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge an override service into a base service the way compose does.
+    
+    Mappings are merged key by key, volumes are merged by target path, ports,
+    exposed ports and env files are concatenated, and everything else is
+    replaced.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if key == 'volumes':
+            volumes = {v['target']: v for v in base.get('volumes', [])}
+            volumes.update((v['target'], v) for v in value)
+            merged[key] = list(volumes.values())
+        elif key in ('ports', 'expose', 'env_file'):
+            merged[key] = list(base.get(key, [])) + [
+                item for item in value if item not in base.get(key, [])
+            ]
+        elif isinstance(value, dict) and isinstance(base.get(key), dict):
+            merged[key] = {**base[key], **value}
+        else:
+            merged[key] = value
+    return merged
+
+
+def merge_compose(*documents: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge compose documents, later ones overriding earlier ones.
+    
+    Args:
+        documents: Parsed and interpolated compose files
+    
+    Returns:
+        Merged document with normalized services
+    """
+    merged: Dict[str, Any] = {'services': {}, 'networks': {}, 'volumes': {}}
+    for document in documents:
+        if document.get('name'):
+            merged['name'] = str(document['name'])
+        for name, service in (document.get('services') or {}).items():
+            service = _normalize_service(service or {})
+            base = merged['services'].get(name)
+            merged['services'][name] = (
+                _merge_service(base, service) if base else service
+            )
+        for key in ('networks', 'volumes'):
+            for name, config in (document.get(key) or {}).items():
+                merged[key][name] = {**merged[key].get(name, {}), **(config or {})}
+    return merged
+
+
+def project_name(stack: str, compose: Dict[str, Any], env: Dict[str, str]) -> str:
+    """Return the project name compose gives a stack.
+    
+    ``COMPOSE_PROJECT_NAME`` from the stack's ``.env`` wins over the
+    top-level ``name:`` of the compose files, which wins over the stack
+    directory name. Like compose, the name is lowercased and stripped of
+    everything but letters, digits, ``_`` and ``-``.
+    
+    Args:
+        stack: Stack directory name
+        compose: Merged compose document
+        env: Variables from the stack's ``.env``
+    """
+    name = env.get('COMPOSE_PROJECT_NAME') or compose.get('name') or stack
+    return re.sub(r'[^a-z0-9_-]', '', name.lower()).lstrip('_-')
+
+
+def _resource_name(project: str, name: str, config: Dict[str, Any]) -> str:
+    """Return the runtime name of a compose network or named volume."""
+    if config.get('name'):
+        return config['name']
+    if config.get('external'):
+        return name
+    return f"{project}_{name}"
+
+
+def _bind_source(source: str) -> str:
+    """Normalize a bind mount source, keeping relative paths relative.
+    
+    Compose resolves relative sources against the project directory on the
+    Docker host, which only the running containers know, so they are kept
+    in ``./path`` form for the drift engine to resolve.
+    """
+    source = posixpath.normpath(source)
+    if source.startswith(('/', '~', '../')) or source in ('.', '..'):
+        return source
+    return f"./{source}"
+
+
+def _port_bindings(ports: List[Any], expose: List[Any]) -> Dict[str, Any]:
+    """Convert compose ports to the ``NetworkSettings.Ports`` format."""
+    bindings: Dict[str, Any] = {}
+    for port in expose:
+        port, _, protocol = str(port).partition('/')
+        bindings.setdefault(f"{port}/{protocol or 'tcp'}", None)
+    
+    for port in ports:
+        if isinstance(port, dict):
+            host_ip = str(port.get('host_ip', ''))
+            published = str(port.get('published', ''))
+            target = str(port['target'])
+            protocol = port.get('protocol', 'tcp')
+        else:
+            spec, _, protocol = str(port).partition('/')
+            host_ip, published, target = '', '', spec
+            if spec.count(':') >= 2:
+                host_ip, published, target = spec.rsplit(':', 2)
+            elif ':' in spec:
+                published, target = spec.split(':')
+            protocol = protocol or 'tcp'
+        
+        targets = _port_range(target)
+        published_ports = _port_range(published) if published else [''] * len(targets)
+        if len(published_ports) != len(targets):
+            published_ports = published_ports[:1] * len(targets)
+        for target_port, host_port in zip(targets, published_ports):
+            key = f"{target_port}/{protocol}"
+            if not host_port:
+                bindings.setdefault(key, None)
+                continue
+            bindings[key] = (bindings.get(key) or []) + [
+                {'HostIp': host_ip, 'HostPort': host_port}
+            ]
+    return bindings
+
+
+def _port_range(spec: str) -> List[str]:
+    start, _, end = spec.partition('-')
+    if not end:
+        return [start]
+    return [str(port) for port in range(int(start), int(end) + 1)]
+
+
+def service_to_container(
+    project: str,
+    name: str,
+    service: Dict[str, Any],
+    compose: Dict[str, Any],
+    env: Dict[str, str]
+) -> ContainerInfo:
+    """Build the ContainerInfo a compose service is expected to produce.
+    
+    Args:
+        project: Compose project name
+        name: Service name
+        service: Merged, normalized service definition
+        compose: Merged compose document (for top-level networks/volumes)
+        env: Variables from the stack's ``.env``
+    
+    Returns:
+        ContainerInfo without runtime-only fields (ID, status, timestamps)
+    """
+    labels = {
+        key: '' if value is None else str(value)
+        for key, value in service.get('labels', {}).items()
+    }
+    labels['com.docker.compose.project'] = project
+    labels['com.docker.compose.service'] = name
+    
+    environment = {}
+    for key, value in service.get('environment', {}).items():
+        if value is None:
+            # A bare KEY passes the variable through from the environment
+            value = env.get(key)
+            if value is None:
+                continue
+        elif isinstance(value, bool):
+            value = 'true' if value else 'false'
+        environment[key] = str(value)
+    
+    network_mode = service.get('network_mode')
+    if network_mode:
+        networks = {} if ':' in network_mode else {network_mode: {}}
+    else:
+        networks = {
+            _resource_name(project, network, compose['networks'].get(network, {})): {}
+            for network in service.get('networks') or {'default': {}}
+        }
+    
+    volumes = []
+    for volume in service.get('volumes', []):
+        source = str(volume.get('source', ''))
+        if volume.get('type', 'volume') == 'volume' and source:
+            source = _resource_name(project, source, compose['volumes'].get(source, {}))
+        elif volume.get('type') == 'bind':
+            source = _bind_source(source)
+        read_only = bool(volume.get('read_only'))
+        volumes.append({
+            'type': volume.get('type', 'volume'),
+            'source': source,
+            'destination': volume['target'],
+            'mode': volume.get('mode', ''),
+            'rw': not read_only
+        })
+    
+    return ContainerInfo(
+        container_id='',
+        name=service.get('container_name') or f"{project}-{name}-1",
+        image=service.get('image') or f"{project}-{name}",
+        status='',
+        labels=labels,
+        networks=networks,
+        volumes=volumes,
+        environment=environment,
+        ports=_port_bindings(service.get('ports', []), service.get('expose', [])),
+        created='',
+        started=None
+    )
+
+
+def _parse_dotenv(text: str) -> Dict[str, str]:
+    """Parse ``KEY=VALUE`` lines the way compose reads ``.env`` files."""
+    return {
+        key: value for key, value in dotenv_values(stream=io.StringIO(text)).items()
+        if value is not None
+    }
+
+
+def _digest(text: Optional[str]) -> Optional[str]:
+    return None if text is None else hashlib.sha256(text.encode()).hexdigest()
+
+
+def _env_file_variables(
+    stack: str,
+    service: str,
+    env_files: List[Dict[str, Any]],
+    read_env_file: Optional[Callable[[str], Optional[str]]]
+) -> Dict[str, str]:
+    """Read a service's ``env_file:`` entries, later files winning."""
+    variables: Dict[str, str] = {}
+    for env_file in env_files:
+        path = posixpath.normpath(str(env_file['path']))
+        text = read_env_file(path) if read_env_file else None
+        if text is None:
+            if env_file.get('required', True):
+                raise BaselineError(
+                    f"env_file {path} of service {service} in stack {stack} not found"
+                )
+            continue
+        variables.update(_parse_dotenv(text))
+    return variables
+
+
+def parse_stack(
+    stack: str,
+    documents: List[bytes],
+    env: Dict[str, str],
+    read_env_file: Optional[Callable[[str], Optional[str]]] = None
+) -> List[ContainerInfo]:
+    """Parse a stack's compose files into expected containers.
+    
+    Variables from a service's ``env_file:`` entries are merged under its
+    ``environment:``, which takes precedence.
+    
+    Args:
+        stack: Stack directory name
+        documents: Raw compose files, base first
+        env: Variables for substitution
+        read_env_file: Returns the text of an ``env_file:`` path relative to
+            the stack directory, or None if it does not exist
+    
+    Returns:
+        One ContainerInfo per service, ordered by service name
+    
+    Raises:
+        BaselineError: If a file is not valid YAML, a required variable is
+            missing or a required env_file cannot be read
+        ValueError: If PyYAML is not installed
+    """
+    if yaml is None:
+        raise ValueError("Install the PyYAML package to load compose baselines")
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    
+    parsed = []
+    for raw in documents:
+        try:
+            document = yaml.load(raw, Loader=loader) or {}
+        except yaml.YAMLError as e:
+            raise BaselineError(f"Invalid compose file in stack {stack}: {e}")
+        parsed.append(interpolate(document, env))
+    
+    compose = merge_compose(*parsed)
+    project = project_name(stack, compose, env)
+    containers = []
+    for name in sorted(compose['services']):
+        service = compose['services'][name]
+        if service.get('env_file'):
+            service = dict(service, environment={
+                **_env_file_variables(stack, name, service['env_file'], read_env_file),
+                **service.get('environment', {})
+            })
+        containers.append(service_to_container(project, name, service, compose, env))
+    return containers
+
+
+class BaselineLoader:
+    """Load compose baselines from a git repository, with a parse cache.
+    
+    Attributes:
+        parsed: Number of stacks parsed since the loader was created
+        cached: Number of stacks served from the cache
+        errors: Stack name to error message for stacks that failed to load
+    """
+    
+    def __init__(
+        self,
+        repo_path: Union[str, Path],
+        endpoint: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        rev: str = 'HEAD',
+        stacks_dir: str = 'stacks'
+    ) -> None:
+        """Initialize the loader.
+        
+        Args:
+            repo_path: Path to the homelab-apps repository
+            endpoint: Endpoint whose ``docker-compose.<endpoint>.yml``
+                overrides are applied (None for the base files only)
+            cache_dir: Directory for parsed stacks (None disables caching)
+            rev: Git revision to read
+            stacks_dir: Directory holding one subdirectory per stack
+        """
+        self.repo_path = Path(repo_path).expanduser()
+        self.endpoint = endpoint
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.rev = rev
+        self.stacks_dir = stacks_dir.strip('/')
+        self.parsed = 0
+        self.cached = 0
+        self.errors: Dict[str, str] = {}
+        self._reader: Optional[GitObjectReader] = None
+    
+    @property
+    def reader(self) -> GitObjectReader:
+        """The git object reader, started on first use."""
+        if self._reader is None:
+            self._reader = GitObjectReader(self.repo_path)
+        return self._reader
+    
+    def stacks(self) -> List[str]:
+        """Return the names of all stacks at the loader's revision.
+        
+        Raises:
+            BaselineError: If the stacks directory does not exist
+        """
+        tree = self.reader.tree(f"{self.rev}:{self.stacks_dir}")
+        if tree is None:
+            raise BaselineError(
+                f"No {self.stacks_dir}/ directory at {self.rev} in {self.repo_path}"
+            )
+        return sorted(name for name, (mode, _) in tree.items() if mode == '40000')
+    
+    def _read_file(self, stack: str, path: str) -> Optional[str]:
+        """Read a file of a stack: the working tree copy, else the committed one.
+        
+        Args:
+            stack: Stack directory name
+            path: Normalized path relative to the stack directory
+        
+        Returns:
+            File text, or None if the file exists in neither place
+        """
+        if posixpath.isabs(path):
+            # Refers to the Docker host, not to this checkout
+            return None
+        local = self.repo_path / self.stacks_dir / stack / path
+        if local.is_file():
+            return local.read_text()
+        git_path = posixpath.normpath(posixpath.join(self.stacks_dir, stack, path))
+        committed = self.reader.read(f"{self.rev}:{git_path}")
+        if committed is None or committed[1] != 'blob':
+            return None
+        return committed[2].decode()
+    
+    def _digest(self, stack: str, path: str) -> Optional[str]:
+        return _digest(self._read_file(stack, path))
+    
+    def _env(self, stack: str) -> Dict[str, str]:
+        """Read a stack's ``.env``: the working tree copy, else the committed one."""
+        text = self._read_file(stack, '.env')
+        return _parse_dotenv(text) if text is not None else {}
+    
+    def _cache_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key[2:]}.json"
+    
+    def load_stack(self, stack: str) -> List[ContainerInfo]:
+        """Load the expected containers of one stack.
+        
+        Args:
+            stack: Stack directory name
+        
+        Returns:
+            One ContainerInfo per service
+        
+        Raises:
+            BaselineError: If the stack has no compose file or cannot be
+                parsed
+        """
+        tree = self.reader.tree(f"{self.rev}:{self.stacks_dir}/{stack}")
+        if tree is None:
+            raise BaselineError(f"Stack {stack} does not exist at {self.rev}")
+        
+        base = next((name for name in BASE_COMPOSE_FILES if name in tree), None)
+        if base is None:
+            raise BaselineError(f"Stack {stack} has no compose file")
+        files = [tree[base][1]]
+        if self.endpoint:
+            for suffix in ('yml', 'yaml'):
+                override = f"docker-compose.{self.endpoint}.{suffix}"
+                if override in tree:
+                    files.append(tree[override][1])
+                    break
+        env = self._env(stack)
+        
+        key = None
+        if self.cache_dir:
+            key = hashlib.sha256(canonical_json(
+                [BASELINE_CACHE_VERSION, stack, files, env]
+            )).hexdigest()
+            try:
+                with open(self._cache_path(key), 'rb') as f:
+                    data = loads_json(f.read())
+                if all(self._digest(stack, path) == digest
+                       for path, digest in data['env_files'].items()):
+                    self.cached += 1
+                    return [ContainerInfo.from_dict(c) for c in data['containers']]
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable baseline cache for {stack}: {e}")
+        
+        # env_file paths are only known once the compose files are parsed;
+        # their digests let a cache hit check they have not changed
+        env_files: Dict[str, Optional[str]] = {}
+        
+        def read_env_file(path: str) -> Optional[str]:
+            text = self._read_file(stack, path)
+            env_files[path] = _digest(text)
+            return text
+        
+        containers = parse_stack(
+            stack, [self.reader.read(sha)[2] for sha in files], env, read_env_file
+        )
+        self.parsed += 1
+        logger.debug(f"Parsed stack {stack}: {len(containers)} service(s)")
+        
+        if key:
+            path = self._cache_path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, json.dumps({
+                'env_files': env_files,
+                'containers': [c.to_dict() for c in containers]
+            }).encode())
+        return containers
+    
+    def load(self) -> Dict[str, List[ContainerInfo]]:
+        """Load every stack.
+        
+        Stacks that fail to load are logged, recorded in ``errors`` and left
+        out of the result.
+        
+        Returns:
+            Stack name to its expected containers
+        
+        Raises:
+            BaselineError: If the repository or stacks directory cannot be
+                read
+        """
+        self.errors = {}
+        baselines = {}
+        for stack in self.stacks():
+            try:
+                baselines[stack] = self.load_stack(stack)
+            except BaselineError as e:
+                logger.error(str(e))
+                self.errors[stack] = str(e)
+        
+        logger.info(
+            f"Loaded {len(baselines)} stack(s) from {self.repo_path} "
+            f"({self.parsed} parsed, {self.cached} cached)"
+        )
+        return baselines
+    
+    def close(self) -> None:
+        """Stop the git process."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+    
+    def __enter__(self) -> 'BaselineLoader':
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark loading compose baselines from git.
+
+Creates a throwaway homelab-apps repository with N stacks (100 by default)
+of 4 services each, plus an endpoint override per stack, then times a cold
+load, a fully cached load, and a load after one stack changed.
+
+Usage:
+    python benchmarks/bench_baseline_loader.py [--stacks N]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from baseline_loader import BaselineLoader  # noqa: E402
+
+
+SERVICE = """
+  app{n}:
+    image: ghcr.io/example/app{n}:${{TAG:-latest}}
+    environment:
+      - TZ=${{TZ}}
+      - PUID=1000
+      - PGID=1000
+    labels:
+      traefik.enable: "true"
+      traefik.http.routers.app{n}.rule: Host(`app{n}.example.com`)
+    volumes:
+      - /opt/appdata/stack/app{n}:/config
+      - /media/tv:/tv
+    ports:
+      - "{port}:8080"
+    networks:
+      - proxy
+"""
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ['git', '-C', str(repo), '-c', 'user.name=bench',
+         '-c', 'user.email=bench@example.com', *args],
+        check=True, capture_output=True
+    )
+
+
+def make_repo(root: Path, stacks: int) -> Path:
+    """Create a repository with ``stacks`` compose stacks."""
+    repo = root / 'homelab-apps'
+    for s in range(stacks):
+        stack = repo / 'stacks' / f"stack{s}"
+        stack.mkdir(parents=True)
+        services = ''.join(
+            SERVICE.format(n=n, port=10000 + s * 10 + n) for n in range(4)
+        )
+        (stack / 'docker-compose.yml').write_text(
+            f"services:{services}\nnetworks:\n  proxy:\n    external: true\n"
+        )
+        (stack / 'docker-compose.ct-docker-01.yml').write_text(
+            "services:\n  app0:\n    environment:\n      - GPU=1\n"
+        )
+        (stack / '.env').write_text("TZ=Europe/Brussels\n")
+    git(repo, 'init', '-q')
+    git(repo, 'add', '.')
+    git(repo, 'commit', '-q', '-m', 'stacks')
+    return repo
+
+
+def timed_load(repo: Path, cache_dir: Path) -> str:
+    start = time.perf_counter()
+    with BaselineLoader(repo, 'ct-docker-01', cache_dir) as loader:
+        loader.load()
+    elapsed = (time.perf_counter() - start) * 1000
+    return f"{elapsed:>8.0f} ms  ({loader.parsed} parsed, {loader.cached} cached)"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--stacks', type=int, default=100)
+    args = parser.parse_args()
+    
+    root = Path(tempfile.mkdtemp())
+    repo = make_repo(root, args.stacks)
+    cache_dir = root / 'cache'
+    
+    print(f"{args.stacks} stacks, {args.stacks * 4} services")
+    print(f"{'cold load:':<18}{timed_load(repo, cache_dir)}")
+    print(f"{'cached load:':<18}{timed_load(repo, cache_dir)}")
+    
+    compose = repo / 'stacks' / 'stack0' / 'docker-compose.yml'
+    compose.write_text(compose.read_text().replace('PUID=1000', 'PUID=1001'))
+    git(repo, 'commit', '-q', '-am', 'change one stack')
+    print(f"{'one stack edited:':<18}{timed_load(repo, cache_dir)}")
+
+
+if __name__ == '__main__':
+    main()
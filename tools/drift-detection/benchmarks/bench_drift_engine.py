@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark incremental drift runs.
+
+Builds a 5k-container fleet (50 hosts x 100 containers by default) where
+every container is a compose service with a baseline that lacks the
+image's own environment variables, then times a first
+drift run, a rerun with nothing changed, and a rerun after 1% of the
+containers changed. Each run reads and writes the on-disk result cache, as
+an hourly audit would.
+
+Usage:
+    python benchmarks/bench_drift_engine.py [--hosts N] [--containers N]
+"""
+
+import argparse
+import copy
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_output_formats import make_results  # noqa: E402
+from docker_inspector import ContainerInfo  # noqa: E402
+from drift_engine import DriftEngine  # noqa: E402
+from fleet_index import FleetIndex  # noqa: E402
+
+
+# Set by the image rather than the compose file, so every container drifts
+IMAGE_ENV = ('PATH', 'NGINX_VERSION', 'PKG_RELEASE')
+
+
+def timed_run(cache_path: Path, results: dict, baselines: dict) -> str:
+    """Time one audit: build the index and run a fresh engine."""
+    start = time.perf_counter()
+    engine = DriftEngine(cache_path)
+    changes = sum(1 for _ in engine.run(FleetIndex.build(results, baselines)))
+    elapsed = (time.perf_counter() - start) * 1000
+    return (f"{elapsed:>8.0f} ms  ({engine.computed} compared, "
+            f"{engine.reused} reused, {changes} change(s))")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hosts', type=int, default=50)
+    parser.add_argument('--containers', type=int, default=100)
+    args = parser.parse_args()
+    
+    results = make_results(args.hosts, args.containers)
+    baselines = {}
+    for entry in results['hosts']:
+        for n, container in enumerate(entry['containers']):
+            container['labels'] = dict(container['labels'], **{
+                'com.docker.compose.project': f"stack{n // 5}",
+                'com.docker.compose.service': f"service{n % 5}"
+            })
+        baselines[entry['host']] = [
+            ContainerInfo.from_dict(dict(container, environment={
+                key: value for key, value in container['environment'].items()
+                if key not in IMAGE_ENV
+            }))
+            for container in entry['containers']
+        ]
+    
+    cache_path = Path(tempfile.mkdtemp()) / 'drift.json'
+    total = args.hosts * args.containers
+    print(f"{total} containers")
+    print(f"{'first run:':<18}{timed_run(cache_path, results, baselines)}")
+    print(f"{'unchanged:':<18}{timed_run(cache_path, results, baselines)}")
+    
+    changed = copy.deepcopy(results)
+    for n in range(0, total, 100):
+        container = changed['hosts'][n // args.containers]['containers'][n % args.containers]
+        container['environment']['TZ'] = 'UTC'
+    print(f"{'1% changed:':<18}{timed_run(cache_path, changed, baselines)}")
+
+
+if __name__ == '__main__':
+    main()
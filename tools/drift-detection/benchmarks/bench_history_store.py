@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark recording and querying a months-long change history.
+
+Records an initial 2000-container scan (20 hosts x 100 containers by
+default) in a ``HistoryStore``, followed by hourly scans for 90 days in
+which 5 containers change one environment variable each. Then times a
+field history lookup and a point-in-time rebuild of one container.
+
+Usage:
+    python benchmarks/bench_history_store.py [--hosts N] [--containers N] [--days N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_output_formats import make_results  # noqa: E402
+from history_store import HistoryStore  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hosts', type=int, default=20)
+    parser.add_argument('--containers', type=int, default=100)
+    parser.add_argument('--days', type=int, default=90)
+    args = parser.parse_args()
+    
+    results = make_results(args.hosts, args.containers)
+    total = args.hosts * args.containers
+    db_path = Path(tempfile.mkdtemp()) / 'history.db'
+    store = HistoryStore(db_path)
+    start_time = datetime(2024, 1, 1)
+    
+    start = time.perf_counter()
+    store.record(results, timestamp=start_time.isoformat())
+    initial = time.perf_counter() - start
+    
+    scans = args.days * 24
+    start = time.perf_counter()
+    for scan in range(1, scans + 1):
+        for n in range(5):
+            index = (scan * 5 + n) % total
+            container = results['hosts'][index // args.containers]['containers'][
+                index % args.containers
+            ]
+            container['environment'] = dict(container['environment'], REV=str(scan))
+        store.record(results, timestamp=(start_time + timedelta(hours=scan)).isoformat())
+    incremental = (time.perf_counter() - start) / scans
+    
+    host = results['hosts'][0]['host']
+    name = results['hosts'][0]['containers'][5]['name']
+    middle = (start_time + timedelta(days=args.days // 2)).isoformat()
+    
+    start = time.perf_counter()
+    history = store.field_history(host, name, 'environment/REV')
+    lookup = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    store.container_at(host, name, middle)
+    rebuild = time.perf_counter() - start
+    store.close()
+    
+    print(f"{total} containers, {scans} hourly scans")
+    print(f"initial scan:         {initial * 1000:.0f} ms")
+    print(f"rescan (5 changes):   {incremental * 1000:.1f} ms")
+    print(f"database size:        {db_path.stat().st_size / 1024 / 1024:.1f} MiB")
+    print(f"field_history:        {lookup * 1000:.2f} ms, {len(history)} value(s)")
+    print(f"container_at:         {rebuild * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Benchmark the CPU cost of turning inspect responses into ContainerInfo.
+
+Compares the docker SDK path used by ``containers.get()`` (stdlib JSON
+decoding plus a ``Container`` model) with the raw path used by
+``DockerInspector.inspect_container()`` (``loads_json`` straight into
+``parse_container_attrs``), with and without orjson.
+
+Usage:
+    python benchmarks/bench_inspect_decode.py [--containers N] [--rounds N]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docker.models.containers import Container  # noqa: E402
+
+import docker_inspector  # noqa: E402
+from docker_inspector import loads_json, parse_container_attrs  # noqa: E402
+
+
+def make_payload(index: int) -> bytes:
+    """Build a realistic ``GET /containers/{id}/json`` response body."""
+    container_id = f"{index:064x}"
+    attrs = {
+        'Id': container_id,
+        'Created': '2024-01-01T00:00:00.000000000Z',
+        'Path': '/docker-entrypoint.sh',
+        'Args': ['nginx', '-g', 'daemon off;'],
+        'State': {
+            'Status': 'running', 'Running': True, 'Paused': False,
+            'Restarting': False, 'OOMKilled': False, 'Dead': False,
+            'Pid': 1000 + index, 'ExitCode': 0, 'Error': '',
+            'StartedAt': '2024-01-01T00:00:01.000000000Z',
+            'FinishedAt': '0001-01-01T00:00:00Z',
+        },
+        'Image': f"sha256:{index:064x}",
+        'Name': f"/app-{index}",
+        'RestartCount': 0,
+        'HostConfig': {
+            'Binds': [f"/srv/app-{index}/data:/data:rw"],
+            'NetworkMode': 'app_default',
+            'PortBindings': {'80/tcp': [{'HostIp': '', 'HostPort': str(8000 + index)}]},
+            'RestartPolicy': {'Name': 'unless-stopped', 'MaximumRetryCount': 0},
+            'LogConfig': {'Type': 'json-file', 'Config': {}},
+        },
+        'Mounts': [
+            {'Type': 'bind', 'Source': f"/srv/app-{index}/data",
+             'Destination': '/data', 'Mode': 'rw', 'RW': True,
+             'Propagation': 'rprivate'},
+            {'Type': 'volume', 'Name': f"app-{index}-cache",
+             'Source': f"/var/lib/docker/volumes/app-{index}-cache/_data",
+             'Destination': '/cache', 'Driver': 'local', 'Mode': 'z',
+             'RW': True, 'Propagation': ''},
+        ],
+        'Config': {
+            'Hostname': container_id[:12],
+            'Image': 'nginx:1.25-alpine',
+            'Env': [
+                f"APP_NAME=app-{index}",
+                'PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin',
+                'NGINX_VERSION=1.25.3',
+                'PKG_RELEASE=1',
+                'TZ=Europe/Paris',
+            ] + [f"SETTING_{n}=value-{n}" for n in range(20)],
+            'Labels': {
+                'com.docker.compose.project': 'app',
+                'com.docker.compose.service': f"app-{index}",
+                'com.docker.compose.version': '2.24.0',
+                'com.docker.compose.config-hash': 'f' * 64,
+                'maintainer': 'NGINX Docker Maintainers',
+            },
+            'ExposedPorts': {'80/tcp': {}},
+            'Cmd': ['nginx', '-g', 'daemon off;'],
+        },
+        'NetworkSettings': {
+            'Ports': {'80/tcp': [{'HostIp': '0.0.0.0', 'HostPort': str(8000 + index)}]},
+            'Networks': {
+                'app_default': {
+                    'Aliases': [f"app-{index}"],
+                    'NetworkID': 'a' * 64,
+                    'EndpointID': 'b' * 64,
+                    'Gateway': '172.18.0.1',
+                    'IPAddress': f"172.18.{index // 250}.{index % 250 + 2}",
+                    'IPPrefixLen': 16,
+                    'MacAddress': '02:42:ac:12:00:02',
+                },
+            },
+        },
+    }
+    return json.dumps(attrs).encode()
+
+
+def sdk_path(raw: bytes) -> None:
+    """Mimic ``containers.get()``: stdlib decode, model, then parse."""
+    container = Container(attrs=json.loads(raw), client=None, collection=None)
+    parse_container_attrs(container.attrs)
+
+
+def raw_path(raw: bytes) -> None:
+    """The raw path used by ``inspect_container()``."""
+    parse_container_attrs(loads_json(raw))
+
+
+def measure(func, payloads, rounds: int) -> float:
+    """Return the best per-container CPU time in microseconds."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.process_time()
+        for raw in payloads:
+            func(raw)
+        best = min(best, time.process_time() - start)
+    return best / len(payloads) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--containers', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+    
+    payloads = [make_payload(i) for i in range(args.containers)]
+    size = sum(map(len, payloads)) / len(payloads)
+    print(f"{args.containers} payloads, {size:.0f} bytes each, "
+          f"best of {args.rounds} rounds")
+    
+    baseline = measure(sdk_path, payloads, args.rounds)
+    with patch.object(docker_inspector, 'orjson', None):
+        stdlib = measure(raw_path, payloads, args.rounds)
+    rows = [('SDK model + json', baseline), ('raw + json', stdlib)]
+    if docker_inspector.orjson is not None:
+        rows.append(('raw + orjson', measure(raw_path, payloads, args.rounds)))
+    
+    print(f"{'path':<20}{'us/container':>14}{'speedup':>10}")
+    for name, cost in rows:
+        print(f"{name:<20}{cost:>14.1f}{baseline / cost:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
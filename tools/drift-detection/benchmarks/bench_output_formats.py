@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark the cost and size of each result output format.
+
+Builds a synthetic fleet scan (hosts x containers from realistic inspect
+payloads) and writes it with ``output.ResultWriter`` in every format, plus
+the previous ``json.dump(indent=2)`` of the whole document as a baseline.
+YAML is measured with libyaml's ``CSafeDumper`` and with the pure-Python
+``SafeDumper``.
+
+Usage:
+    python benchmarks/bench_output_formats.py [--hosts N] [--containers N]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import yaml  # noqa: E402
+
+import output  # noqa: E402
+from bench_inspect_decode import make_payload  # noqa: E402
+from docker_inspector import loads_json, parse_container_attrs  # noqa: E402
+
+
+def make_results(hosts: int, containers: int) -> dict:
+    """Build an ``inspect_multiple_hosts()`` result dictionary."""
+    entries = []
+    for h in range(hosts):
+        infos = [
+            parse_container_attrs(loads_json(make_payload(h * containers + c)))
+            for c in range(containers)
+        ]
+        entries.append({
+            'host': f"192.168.50.{h}",
+            'timestamp': '2024-01-01T00:00:00',
+            'container_count': len(infos),
+            'containers': [info.to_dict() for info in infos]
+        })
+    return {'timestamp': '2024-01-01T00:00:00', 'hosts': entries}
+
+
+def timed(func, *args) -> float:
+    """Return the wall time of one call in milliseconds."""
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hosts', type=int, default=20)
+    parser.add_argument('--containers', type=int, default=100)
+    args = parser.parse_args()
+    
+    results = make_results(args.hosts, args.containers)
+    workdir = Path(tempfile.mkdtemp())
+    
+    def baseline(path):
+        # The previous output path: one indented json.dump of everything
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2)
+    
+    def writer(output_format, compression='none', pretty=False):
+        def run(path):
+            output.write_results(
+                results, path, output_format=output_format,
+                compression=compression, pretty=pretty
+            )
+        return run
+    
+    cases = [
+        ('json.dump(indent=2)', baseline),
+        ('json pretty', writer('json', pretty=True)),
+        ('json compact', writer('json')),
+        ('ndjson', writer('ndjson')),
+        ('ndjson + gzip', writer('ndjson', 'gzip')),
+        ('yaml (CSafeDumper)', writer('yaml')),
+        ('yaml + gzip', writer('yaml', 'gzip')),
+    ]
+    
+    print(f"{args.hosts} hosts x {args.containers} containers, "
+          f"libyaml {'available' if hasattr(yaml, 'CSafeDumper') else 'missing'}")
+    print(f"{'format':<22}{'ms':>10}{'KiB':>12}")
+    
+    def report(name, func):
+        path = workdir / name.replace(' ', '_')
+        elapsed = timed(func, path)
+        print(f"{name:<22}{elapsed:>10.0f}{path.stat().st_size / 1024:>12.0f}")
+    
+    for name, func in cases:
+        report(name, func)
+    
+    # Force the pure-Python emitter for comparison
+    with patch.object(yaml, 'CSafeDumper', yaml.SafeDumper):
+        report('yaml (SafeDumper)', writer('yaml'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Benchmark diffing two fleet snapshots.
+
+Builds two 5k-container snapshots (50 hosts x 100 containers by default)
+where 1% of the containers differ, then times ``diff_results()`` on the
+in-memory results and ``diff_runs()`` on the same two runs recorded in a
+``SnapshotStore``.
+
+Usage:
+    python benchmarks/bench_snapshot_diff.py [--hosts N] [--containers N]
+"""
+
+import argparse
+import copy
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_output_formats import make_results  # noqa: E402
+from snapshot_diff import diff_results, diff_runs  # noqa: E402
+from snapshot_store import SnapshotStore  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hosts', type=int, default=50)
+    parser.add_argument('--containers', type=int, default=100)
+    args = parser.parse_args()
+    
+    old = make_results(args.hosts, args.containers)
+    # A separate copy shares no objects with the old snapshot
+    new = copy.deepcopy(old)
+    total = args.hosts * args.containers
+    for n in range(0, total, 100):
+        container = new['hosts'][n // args.containers]['containers'][n % args.containers]
+        container['environment']['TZ'] = 'UTC'
+    
+    start = time.perf_counter()
+    changes = sum(1 for _ in diff_results(old, new))
+    in_memory = time.perf_counter() - start
+    
+    store = SnapshotStore(tempfile.mkdtemp())
+    old_run = store.save(old)
+    new_run = store.save(new)
+    start = time.perf_counter()
+    stored = sum(1 for _ in diff_runs(store, old_run, new_run))
+    from_store = time.perf_counter() - start
+    
+    print(f"{total} containers, {total // 100} changed")
+    print(f"diff_results: {in_memory * 1000:.0f} ms, {changes} change(s)")
+    print(f"diff_runs:    {from_store * 1000:.0f} ms, {stored} change(s)")
+
+
+if __name__ == '__main__':
+    main()
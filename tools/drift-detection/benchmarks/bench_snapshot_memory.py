@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark the memory held by a fleet snapshot of ContainerInfo objects.
+
+Parses N inspect payloads (10k by default), keeps only the resulting
+objects, and reports the memory they retain as measured by tracemalloc.
+The baseline is the previous representation: a plain ``@dataclass`` with
+per-instance ``__dict__`` and no string interning, serialized with
+``asdict()``.
+
+Usage:
+    python benchmarks/bench_snapshot_memory.py [--containers N]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_inspect_decode import make_payload  # noqa: E402
+from docker_inspector import loads_json, parse_container_attrs  # noqa: E402
+
+
+@dataclass
+class LegacyContainerInfo:
+    """ContainerInfo as it was before slots and interning."""
+    container_id: str
+    name: str
+    image: str
+    status: str
+    labels: Dict[str, str]
+    networks: Dict[str, Any]
+    volumes: List[Dict[str, str]]
+    environment: Dict[str, str]
+    ports: Dict[str, Any]
+    created: str
+    started: Optional[str]
+
+
+def legacy_parse(attrs: Dict[str, Any]) -> LegacyContainerInfo:
+    """Extract fields the way the previous parser did, without interning."""
+    environment = {}
+    for env_var in attrs['Config'].get('Env', []) or []:
+        if '=' in env_var:
+            key, value = env_var.split('=', 1)
+            environment[key] = value
+    return LegacyContainerInfo(
+        container_id=attrs['Id'],
+        name=attrs['Name'].lstrip('/'),
+        image=attrs['Config']['Image'],
+        status=attrs['State']['Status'],
+        labels=attrs['Config'].get('Labels', {}) or {},
+        networks=attrs['NetworkSettings'].get('Networks', {}),
+        volumes=[
+            {
+                'type': mount['Type'],
+                'source': mount.get('Source', ''),
+                'destination': mount['Destination'],
+                'mode': mount.get('Mode', ''),
+                'rw': mount.get('RW', True)
+            }
+            for mount in attrs.get('Mounts') or []
+        ],
+        environment=environment,
+        ports=attrs['NetworkSettings'].get('Ports', {}) or {},
+        created=attrs['Created'],
+        started=attrs['State'].get('StartedAt') or None
+    )
+
+
+def retained(parse, payloads) -> int:
+    """Return bytes still allocated after parsing every payload."""
+    gc.collect()
+    tracemalloc.start()
+    snapshot = [parse(loads_json(raw)) for raw in payloads]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del snapshot
+    return size
+
+
+def serialize_time(to_dict, snapshot) -> float:
+    """Return the CPU seconds spent serializing a snapshot."""
+    start = time.process_time()
+    for info in snapshot:
+        to_dict(info)
+    return time.process_time() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--containers', type=int, default=10000)
+    args = parser.parse_args()
+    
+    payloads = [make_payload(i) for i in range(args.containers)]
+    
+    legacy = retained(legacy_parse, payloads)
+    compact = retained(parse_container_attrs, payloads)
+    
+    legacy_snapshot = [legacy_parse(loads_json(raw)) for raw in payloads]
+    compact_snapshot = [parse_container_attrs(loads_json(raw)) for raw in payloads]
+    legacy_dump = serialize_time(asdict, legacy_snapshot)
+    compact_dump = serialize_time(lambda info: info.to_dict(), compact_snapshot)
+    
+    mib = 1024 * 1024
+    print(f"{args.containers} containers")
+    print(f"{'representation':<28}{'retained MiB':>14}{'to_dict ms':>12}")
+    print(f"{'dataclass + asdict':<28}{legacy / mib:>14.1f}"
+          f"{legacy_dump * 1000:>12.1f}")
+    print(f"{'slots + interning + shallow':<28}{compact / mib:>14.1f}"
+          f"{compact_dump * 1000:>12.1f}")
+    print(f"memory saved: {(1 - compact / legacy) * 100:.0f}%")
+
+
+if __name__ == '__main__':
+    main()
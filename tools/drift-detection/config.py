@@ -6,7 +6,7 @@ and .env files using python-dotenv.
 
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
 
@@ -16,11 +16,44 @@ class Config:
     Attributes:
         ssh_key_path: Path to SSH private key file
         target_hosts: List of target host IP addresses
+        proxmox_host: Proxmox node reached over SSH for ``pct exec`` scans
+        proxmox_ctids: LXC container IDs on the Proxmox node running Docker
         ssh_username: Username for SSH connections
+        jump_host: Bastion (``[user@]host[:port]``) all hosts are reached
+            through, or None to connect directly
         ssh_timeout: SSH connection timeout in seconds
         docker_timeout: Docker API timeout in seconds
-        output_format: Format for output data (json, yaml)
+        max_parallel_hosts: Maximum number of hosts scanned concurrently
+        host_timeout: Per-host scan deadline in seconds (None for no limit)
+        container_workers: Concurrent container inspections per host
+        container_timeout: Per-container inspection deadline in seconds
+        container_filters: Docker-native listing filters, e.g.
+            ``{'label': ['com.docker.compose.project=media']}``
+        collector: Container collection mode (api, exec)
+        fingerprint_ignore: Extra '/'-separated field paths left out of
+            container fingerprints, on top of the built-in defaults
+        ssh_pool_size: Idle SSH connections kept for reuse (0 disables)
+        ssh_pool_idle_timeout: Seconds an idle pooled connection is kept
+        ssh_pool_max_lifetime: Seconds after which a pooled connection is
+            retired
+        output_format: Format for output data (json, ndjson, yaml)
         output_dir: Directory for output files
+        output_compression: Output file compression (none, gzip, zstd)
+        output_pretty: Indent JSON output instead of writing it compact
+        cache_dir: Directory for the incremental inspection cache
+            (None to disable caching)
+        strip_image_defaults: Leave out environment variables and labels
+            whose value comes from the container's image
+        image_cache_size: Image configurations kept in the image cache
+        snapshot_dir: Directory for the deduplicating snapshot store
+            (None to disable snapshot history)
+        snapshot_keep: Number of snapshot runs kept (0 keeps all)
+        history_db: SQLite database for the field change history
+            (None to disable it)
+        homelab_apps_path: Local clone of the homelab-apps repository
+            holding the compose baselines
+        endpoint: Endpoint whose ``docker-compose.<endpoint>.yml``
+            overrides apply to the baselines (None for base files only)
         log_level: Logging level
     """
     
@@ -48,16 +81,93 @@ class Config:
             host.strip() for host in hosts_str.split(',') if host.strip()
         ]
         
+        # Proxmox node proxying to LXC containers via pct exec
+        self.proxmox_host: Optional[str] = os.getenv('PROXMOX_HOST') or None
+        ctids_str = os.getenv('PROXMOX_CTIDS', '')
+        self.proxmox_ctids: List[int] = [
+            int(ctid) for ctid in ctids_str.split(',') if ctid.strip()
+        ]
+        
         # SSH settings
         self.ssh_username: str = os.getenv('SSH_USERNAME', 'root')
         self.ssh_timeout: int = int(os.getenv('SSH_TIMEOUT', '10'))
+        self.jump_host: Optional[str] = os.getenv('JUMP_HOST') or None
         
         # Docker settings
         self.docker_timeout: int = int(os.getenv('DOCKER_TIMEOUT', '30'))
         
+        # Scan concurrency
+        self.max_parallel_hosts: int = int(os.getenv('MAX_PARALLEL_HOSTS', '4'))
+        host_timeout = os.getenv('HOST_TIMEOUT')
+        self.host_timeout: Optional[float] = (
+            float(host_timeout) if host_timeout else None
+        )
+        self.container_workers: int = int(os.getenv('CONTAINER_WORKERS', '1'))
+        container_timeout = os.getenv('CONTAINER_TIMEOUT')
+        self.container_timeout: Optional[float] = (
+            float(container_timeout) if container_timeout else None
+        )
+        
+        # Daemon-side container filters: comma-separated key=value pairs
+        filters_str = os.getenv('CONTAINER_FILTERS', '')
+        self.container_filters: Dict[str, List[str]] = {}
+        for item in filters_str.split(','):
+            key, sep, value = item.strip().partition('=')
+            if key and sep and value:
+                self.container_filters.setdefault(key, []).append(value)
+        
+        # Extra ephemeral fields excluded from container fingerprints
+        self.fingerprint_ignore: List[str] = [
+            path.strip()
+            for path in os.getenv('FINGERPRINT_IGNORE', '').split(',')
+            if path.strip()
+        ]
+        
+        # Collection mode: Docker API tunnel or one remote docker command
+        self.collector: str = os.getenv('COLLECTOR', 'api')
+        
+        # SSH connection pool
+        self.ssh_pool_size: int = int(os.getenv('SSH_POOL_SIZE', '16'))
+        self.ssh_pool_idle_timeout: float = float(
+            os.getenv('SSH_POOL_IDLE_TIMEOUT', '300')
+        )
+        self.ssh_pool_max_lifetime: float = float(
+            os.getenv('SSH_POOL_MAX_LIFETIME', '3600')
+        )
+        
         # Output settings
         self.output_format: str = os.getenv('OUTPUT_FORMAT', 'json')
         self.output_dir: str = os.getenv('OUTPUT_DIR', './output')
+        self.output_compression: str = os.getenv('OUTPUT_COMPRESSION', 'none')
+        self.output_pretty: bool = (
+            os.getenv('OUTPUT_PRETTY', 'false').lower() in ('1', 'true', 'yes')
+        )
+        
+        # Inspection cache
+        self.cache_dir: Optional[str] = os.getenv('CACHE_DIR') or None
+        if self.cache_dir:
+            self.cache_dir = os.path.expanduser(self.cache_dir)
+        
+        # Image default subtraction
+        self.strip_image_defaults: bool = (
+            os.getenv('STRIP_IMAGE_DEFAULTS', 'false').lower() in ('1', 'true', 'yes')
+        )
+        self.image_cache_size: int = int(os.getenv('IMAGE_CACHE_SIZE', '1024'))
+        
+        # Snapshot history
+        self.snapshot_dir: Optional[str] = os.getenv('SNAPSHOT_DIR') or None
+        if self.snapshot_dir:
+            self.snapshot_dir = os.path.expanduser(self.snapshot_dir)
+        self.snapshot_keep: int = int(os.getenv('SNAPSHOT_KEEP', '0'))
+        self.history_db: Optional[str] = os.getenv('HISTORY_DB') or None
+        if self.history_db:
+            self.history_db = os.path.expanduser(self.history_db)
+        
+        # Compose baselines
+        self.homelab_apps_path: Optional[str] = os.getenv('HOMELAB_APPS_PATH') or None
+        if self.homelab_apps_path:
+            self.homelab_apps_path = os.path.expanduser(self.homelab_apps_path)
+        self.endpoint: Optional[str] = os.getenv('ENDPOINT') or None
         
         # Logging
         self.log_level: str = os.getenv('LOG_LEVEL', 'INFO')
@@ -68,9 +178,12 @@ class Config:
         Raises:
             ValueError: If required configuration is missing or invalid
         """
-        if not self.target_hosts:
+        if not self.target_hosts and not self.proxmox_ctids:
             raise ValueError("TARGET_HOSTS must be specified")
         
+        if self.proxmox_ctids and not self.proxmox_host:
+            raise ValueError("PROXMOX_HOST must be specified with PROXMOX_CTIDS")
+        
         if self.ssh_key_path and not Path(self.ssh_key_path).exists():
             raise ValueError(f"SSH key not found: {self.ssh_key_path}")
         
@@ -80,8 +193,52 @@ class Config:
         if self.docker_timeout <= 0:
             raise ValueError("DOCKER_TIMEOUT must be positive")
         
-        if self.output_format not in ['json', 'yaml']:
-            raise ValueError("OUTPUT_FORMAT must be 'json' or 'yaml'")
+        if self.max_parallel_hosts <= 0:
+            raise ValueError("MAX_PARALLEL_HOSTS must be positive")
+        
+        if self.host_timeout is not None and self.host_timeout <= 0:
+            raise ValueError("HOST_TIMEOUT must be positive")
+        
+        if self.container_workers <= 0:
+            raise ValueError("CONTAINER_WORKERS must be positive")
+        
+        if self.container_timeout is not None and self.container_timeout <= 0:
+            raise ValueError("CONTAINER_TIMEOUT must be positive")
+        
+        if self.collector not in ['api', 'exec']:
+            raise ValueError("COLLECTOR must be 'api' or 'exec'")
+        
+        if self.ssh_pool_size < 0:
+            raise ValueError("SSH_POOL_SIZE must not be negative")
+        
+        if self.ssh_pool_idle_timeout <= 0:
+            raise ValueError("SSH_POOL_IDLE_TIMEOUT must be positive")
+        
+        if self.ssh_pool_max_lifetime <= 0:
+            raise ValueError("SSH_POOL_MAX_LIFETIME must be positive")
+        
+        if self.output_format not in ['json', 'ndjson', 'yaml']:
+            raise ValueError("OUTPUT_FORMAT must be 'json', 'ndjson' or 'yaml'")
+        
+        if self.image_cache_size <= 0:
+            raise ValueError("IMAGE_CACHE_SIZE must be positive")
+        
+        if self.snapshot_keep < 0:
+            raise ValueError("SNAPSHOT_KEEP must not be negative")
+        
+        if self.jump_host:
+            from connection_pool import parse_jump_host
+            from docker_inspector import SSHConnectionError
+            
+            try:
+                parse_jump_host(self.jump_host)
+            except SSHConnectionError as e:
+                raise ValueError(f"JUMP_HOST is invalid: {e}")
+        
+        if self.output_compression not in ['none', 'gzip', 'zstd']:
+            raise ValueError(
+                "OUTPUT_COMPRESSION must be 'none', 'gzip' or 'zstd'"
+            )
     
     def __repr__(self) -> str:
         """Return string representation of configuration."""
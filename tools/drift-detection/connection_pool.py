@@ -0,0 +1,408 @@
+"""Process-wide pool of connected Docker inspectors.
+
+Opening an SSH session costs a TCP handshake, key exchange and
+authentication. The pool keeps connected ``DockerInspector`` instances
+after a scan so that the next scan of the same host in this process reuses
+the warm session. Idle connections expire after ``idle_timeout``, every
+connection is retired after ``max_lifetime``, connections are health-checked
+before reuse, and the least recently used idle connection is closed when the
+pool is full.
+
+Targets behind a bastion (``jump_host``) are reached through ``direct-tcpip``
+channels on one shared connection to the bastion, so a scan of many hosts
+pays the bastion handshake once.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import paramiko
+
+from docker_inspector import DockerInspector, SSHConnectionError
+from ssh_transport import DEFAULT_DOCKER_SOCKET
+
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, str, Optional[str], str, Optional[str]]
+
+
+def parse_jump_host(spec: str) -> Tuple[Optional[str], str, Optional[int]]:
+    """Split a ProxyJump-style ``[user@]host[:port]`` specification.
+    
+    Args:
+        spec: Jump host specification
+    
+    Returns:
+        Tuple of (username or None, host, port or None)
+    
+    Raises:
+        SSHConnectionError: If the host is empty or the port is not a number
+    """
+    user, _, hostport = spec.rpartition('@')
+    host, sep, port = hostport.partition(':')
+    if not host or (sep and not port.isdigit()):
+        raise SSHConnectionError(
+            f"Invalid jump host {spec!r}: expected [user@]host[:port]"
+        )
+    return user or None, host, int(port) if sep else None
+
+
+class _PoolEntry:
+    """A pooled inspector with its bookkeeping timestamps."""
+    
+    __slots__ = ('key', 'inspector', 'created', 'last_used')
+    
+    def __init__(self, key: PoolKey, inspector: DockerInspector) -> None:
+        self.key = key
+        self.inspector = inspector
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+
+class ConnectionPool:
+    """Pool of connected DockerInspector instances keyed by SSH identity.
+    
+    Connections are checked out exclusively: a pooled inspector is never
+    used by two scans at once. Use ``connection()`` to borrow one.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 16,
+        idle_timeout: float = 300.0,
+        max_lifetime: float = 3600.0
+    ) -> None:
+        """Initialize an empty pool.
+        
+        Args:
+            max_size: Maximum number of idle connections kept (0 disables
+                pooling; every connection is closed after use)
+            idle_timeout: Seconds an idle connection is kept before closing
+            max_lifetime: Seconds after which a connection is retired
+                regardless of use
+        """
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        
+        self._lock = threading.Lock()
+        # Idle entries, least recently used first
+        self._idle: 'OrderedDict[int, _PoolEntry]' = OrderedDict()
+        # Checked-out inspectors and their entries
+        self._in_use: Dict[int, _PoolEntry] = {}
+        # Shared bastion connections, keyed like targets; never checked out
+        self._jumps: Dict[Tuple[str, str, Optional[str], Optional[int]],
+                          DockerInspector] = {}
+        self._jump_lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(
+        host: str,
+        username: str,
+        ssh_key_path: Optional[str] = None,
+        docker_socket: str = DEFAULT_DOCKER_SOCKET,
+        jump_host: Optional[str] = None
+    ) -> PoolKey:
+        """Build the pool key for an SSH identity and route."""
+        return (host, username, ssh_key_path, docker_socket, jump_host)
+    
+    def _expired(self, entry: _PoolEntry, now: float) -> bool:
+        return (
+            now - entry.last_used > self.idle_timeout
+            or now - entry.created > self.max_lifetime
+        )
+    
+    def _prune(self, now: float) -> List[_PoolEntry]:
+        """Drop expired and surplus idle entries; caller holds the lock."""
+        dropped = [
+            entry for entry in self._idle.values() if self._expired(entry, now)
+        ]
+        for entry in dropped:
+            del self._idle[id(entry)]
+        
+        while len(self._idle) > self.max_size:
+            dropped.append(self._idle.popitem(last=False)[1])
+        
+        return dropped
+    
+    @staticmethod
+    def _close(entries: List[_PoolEntry]) -> None:
+        for entry in entries:
+            logger.debug(f"Closing pooled connection to {entry.key[0]}")
+            entry.inspector.disconnect()
+    
+    @staticmethod
+    def _healthy(inspector: DockerInspector) -> bool:
+        """Check a pooled connection is still usable."""
+        transport = (
+            inspector.ssh_client.get_transport()
+            if inspector.ssh_client else None
+        )
+        if transport is None or not transport.is_active():
+            return False
+        
+        if inspector.docker_client is not None:
+            try:
+                inspector.docker_client.ping()
+            except Exception:
+                return False
+        
+        return True
+    
+    def _jump_client(
+        self,
+        jump_host: str,
+        username: str,
+        ssh_key_path: Optional[str],
+        ssh_timeout: int
+    ) -> paramiko.SSHClient:
+        """Return the shared connection to a bastion, connecting if needed.
+        
+        Raises:
+            SSHConnectionError: If the bastion connection fails
+        """
+        jump_user, jump_hostname, jump_port = parse_jump_host(jump_host)
+        jump_user = jump_user or username
+        key = (jump_hostname, jump_user, ssh_key_path, jump_port)
+        
+        # Serialize bastion handshakes so concurrent scans share one
+        with self._jump_lock:
+            jump = self._jumps.get(key)
+            if jump is not None and not self._healthy(jump):
+                logger.info(
+                    f"Jump host {jump_host} connection is dead, reconnecting"
+                )
+                jump.disconnect()
+                jump = None
+            
+            if jump is None:
+                jump = DockerInspector(
+                    host=jump_hostname,
+                    username=jump_user,
+                    ssh_key_path=ssh_key_path,
+                    ssh_timeout=ssh_timeout,
+                    ssh_port=jump_port,
+                    collector='exec'
+                )
+                try:
+                    jump.connect()
+                except Exception:
+                    jump.disconnect()
+                    raise
+                self._jumps[key] = jump
+            
+            return jump.ssh_client
+    
+    def acquire(
+        self,
+        host: str,
+        username: str,
+        ssh_key_path: Optional[str] = None,
+        docker_socket: str = DEFAULT_DOCKER_SOCKET,
+        connect_docker: bool = True,
+        jump_host: Optional[str] = None,
+        **inspector_kwargs: Any
+    ) -> DockerInspector:
+        """Check out a connected inspector, reusing an idle one if possible.
+        
+        Args:
+            host: Target host
+            username: SSH username
+            ssh_key_path: Path to SSH private key
+            docker_socket: Path of the Docker socket on the target host
+            connect_docker: Ensure the Docker API client is connected
+            jump_host: Bastion as ``[user@]host[:port]``; the target is
+                reached through the pool's shared connection to it
+            **inspector_kwargs: Other DockerInspector arguments; they are
+                applied to reused inspectors as well
+        
+        Returns:
+            Connected DockerInspector, to be handed back with ``release()``
+        
+        Raises:
+            SSHConnectionError: If a new SSH connection fails
+            DockerConnectionError: If the Docker connection fails
+        """
+        key = self.make_key(
+            host, username, ssh_key_path, docker_socket, jump_host
+        )
+        now = time.monotonic()
+        
+        entry = None
+        with self._lock:
+            stale = self._prune(now)
+            # Prefer the most recently used connection
+            for candidate in reversed(self._idle.values()):
+                if candidate.key == key:
+                    entry = self._idle.pop(id(candidate))
+                    break
+        self._close(stale)
+        
+        if entry is not None and not self._healthy(entry.inspector):
+            logger.info(f"Pooled connection to {host} is dead, reconnecting")
+            self._close([entry])
+            entry = None
+        
+        if entry is None:
+            if jump_host:
+                inspector_kwargs['jump_client'] = self._jump_client(
+                    jump_host,
+                    username,
+                    ssh_key_path,
+                    inspector_kwargs.get('ssh_timeout', 10)
+                )
+            inspector = DockerInspector(
+                host=host,
+                username=username,
+                ssh_key_path=ssh_key_path,
+                docker_socket=docker_socket,
+                **inspector_kwargs
+            )
+            try:
+                inspector.connect()
+            except Exception:
+                inspector.disconnect()
+                raise
+            entry = _PoolEntry(key, inspector)
+        else:
+            logger.debug(f"Reusing pooled connection to {host}")
+            for name, value in inspector_kwargs.items():
+                setattr(entry.inspector, name, value)
+        
+        try:
+            if connect_docker and entry.inspector.docker_client is None:
+                entry.inspector.connect_docker()
+        except Exception:
+            self._close([entry])
+            raise
+        
+        with self._lock:
+            self._in_use[id(entry.inspector)] = entry
+        
+        return entry.inspector
+    
+    def release(self, inspector: DockerInspector, discard: bool = False) -> None:
+        """Return a checked-out inspector to the pool.
+        
+        Args:
+            inspector: Inspector obtained from ``acquire()``
+            discard: Close the connection instead of keeping it
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._in_use.pop(id(inspector), None)
+            if entry is None:
+                stale = []
+            else:
+                entry.last_used = now
+                if discard or self._expired(entry, now):
+                    stale = [entry]
+                else:
+                    self._idle[id(entry)] = entry
+                    stale = self._prune(now)
+        
+        if entry is None:
+            inspector.disconnect()
+        self._close(stale)
+    
+    @contextmanager
+    def connection(
+        self,
+        host: str,
+        username: str,
+        **kwargs: Any
+    ) -> Iterator[DockerInspector]:
+        """Borrow a connected inspector for the duration of a ``with`` block.
+        
+        The connection is discarded instead of pooled if the block raises.
+        
+        Args:
+            host: Target host
+            username: SSH username
+            **kwargs: Arguments for ``acquire()``
+        
+        Yields:
+            Connected DockerInspector
+        """
+        inspector = self.acquire(host, username, **kwargs)
+        try:
+            yield inspector
+        except BaseException:
+            self.release(inspector, discard=True)
+            raise
+        else:
+            self.release(inspector)
+    
+    def close_all(self) -> None:
+        """Close all idle connections and bastion connections.
+        
+        Checked-out connections are closed when they are released.
+        """
+        with self._lock:
+            stale = list(self._idle.values())
+            self._idle.clear()
+        self._close(stale)
+        
+        with self._jump_lock:
+            jumps = list(self._jumps.values())
+            self._jumps.clear()
+        for jump in jumps:
+            jump.disconnect()
+    
+    def __len__(self) -> int:
+        """Return the number of idle connections."""
+        with self._lock:
+            return len(self._idle)
+
+
+_default_pool: Optional[ConnectionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> ConnectionPool:
+    """Return the process-wide pool used by ``inspect_host()``.
+    
+    Returns:
+        Shared ConnectionPool, created on first use
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ConnectionPool()
+            atexit.register(_default_pool.close_all)
+        return _default_pool
+
+
+def configure_default_pool(
+    max_size: int = 16,
+    idle_timeout: float = 300.0,
+    max_lifetime: float = 3600.0
+) -> ConnectionPool:
+    """Replace the process-wide pool, closing the previous pool's connections.
+    
+    Args:
+        max_size: Maximum number of idle connections (0 disables pooling)
+        idle_timeout: Seconds an idle connection is kept
+        max_lifetime: Seconds after which a connection is retired
+    
+    Returns:
+        The new default ConnectionPool
+    """
+    global _default_pool
+    pool = ConnectionPool(
+        max_size=max_size,
+        idle_timeout=idle_timeout,
+        max_lifetime=max_lifetime
+    )
+    with _default_pool_lock:
+        previous, _default_pool = _default_pool, pool
+        atexit.register(pool.close_all)
+    if previous is not None:
+        previous.close_all()
+    return pool
@@ -4,16 +4,43 @@ This module provides functionality to connect to remote Docker hosts via SSH
 and extract container configuration data for drift analysis.
 """
 
+import copy
+import hashlib
+import http.client
 import json
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+import sys
+from typing import (
+    TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Any, Tuple, Union
+)
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
+from functools import lru_cache
 
 import paramiko
 import docker
 from docker.errors import DockerException
 
+from docker.constants import DEFAULT_MAX_POOL_SIZE
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from ssh_transport import (
+    DEFAULT_DOCKER_SOCKET,
+    create_docker_client,
+    pipelined_get,
+)
+from utils import TIMED_OUT, iter_bounded
+
+if TYPE_CHECKING:
+    from connection_pool import ConnectionPool
+    from image_cache import ImageConfigCache, ImageDefaults
+    from inspection_cache import InspectionCache
+    from watcher import ContainerWatcher
+
 
 # Configure logging
 logging.basicConfig(
@@ -22,11 +49,113 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Container collection strategies accepted by DockerInspector
+COLLECTORS = ('api', 'exec')
+
+# Fields that change on every redeploy without any configuration change.
+# Paths are '/'-separated; '*' matches any key at that level.
+DEFAULT_FINGERPRINT_IGNORE = frozenset({
+    'container_id',
+    'created',
+    'started',
+    'status',
+    'networks/*/EndpointID',
+    'networks/*/NetworkID',
+    'networks/*/IPAddress',
+    'networks/*/MacAddress',
+    'networks/*/Gateway',
+    'networks/*/GlobalIPv6Address',
+    'networks/*/IPv6Gateway',
+    'networks/*/DNSNames',
+})
+
+
+def _merge_rules(
+    rule: Optional[Dict[str, Any]],
+    other: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Combine two ignore subtrees; ``None`` (drop the key) wins."""
+    if rule is None or other is None:
+        return None
+    merged = dict(rule)
+    for key, child in other.items():
+        merged[key] = (
+            _merge_rules(merged[key], child) if key in merged else copy.deepcopy(child)
+        )
+    return merged
+
+
+def _spread_wildcards(node: Dict[str, Any]) -> None:
+    """Merge each level's ``*`` rule into the rules of its named keys."""
+    wildcard = node.get('*', {})
+    for key, child in node.items():
+        if key != '*' and child is not None:
+            node[key] = child = _merge_rules(child, wildcard)
+        if child:
+            _spread_wildcards(child)
+
+
+@lru_cache(maxsize=32)
+def compile_ignore(ignore: frozenset) -> Dict[str, Any]:
+    """Turn '/'-separated ignore paths into a nested lookup tree.
+    
+    A path's last segment maps to ``None``, meaning "drop this key". The
+    ``*`` rule of a level also applies to keys that have rules of their own,
+    so ``networks/media/Aliases`` does not undo ``networks/*/IPAddress``.
+    """
+    tree: Dict[str, Any] = {}
+    for path in ignore:
+        node = tree
+        *parents, leaf = path.split('/')
+        for part in parents:
+            child = node.setdefault(part, {})
+            if child is None:
+                break
+            node = child
+        else:
+            node[leaf] = None
+    _spread_wildcards(tree)
+    return tree
+
+
+def _canonicalize(value: Any, ignore: Optional[Dict[str, Any]]) -> Any:
+    """Drop ignored keys and put lists in a stable order, recursively."""
+    if isinstance(value, dict):
+        result = {}
+        wildcard = ignore.get('*', {}) if ignore else {}
+        for key, item in value.items():
+            rule = ignore.get(key, wildcard) if ignore else {}
+            if rule is None:
+                continue
+            result[key] = _canonicalize(item, rule)
+        return result
+    if isinstance(value, list):
+        items = [_canonicalize(item, ignore) for item in value]
+        return sorted(items, key=canonical_json)
+    return value
+
+
+def _intern_strings(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a mapping with its keys and string values interned."""
+    intern = sys.intern
+    return {
+        intern(key): intern(value) if type(value) is str else value
+        for key, value in mapping.items()
+    }
+
 
-@dataclass
+@dataclass(slots=True)
 class ContainerInfo:
     """Structured container information.
     
+    Instances use ``__slots__``. ``parse_container_attrs()`` and
+    ``from_dict()`` intern strings that repeat across a fleet (image, status,
+    label and environment keys and values, network names and settings, mount
+    fields) so thousands of containers share one copy of each.
+    
+    Instances are treated as immutable once built: ``fingerprint()`` caches
+    its result on the object.
+    
     Attributes:
         container_id: Full container ID
         name: Container name
@@ -39,6 +168,9 @@ class ContainerInfo:
         ports: Port mapping configuration
         created: Container creation timestamp
         started: Container start timestamp
+        image_id: ID of the image the container runs (empty for baselines)
+        defaults_stripped: Whether the image's default environment and
+            labels were subtracted
     """
     container_id: str
     name: str
@@ -51,10 +183,77 @@ class ContainerInfo:
     ports: Dict[str, Any]
     created: str
     started: Optional[str]
+    image_id: str = ''
+    defaults_stripped: bool = False
+    _fingerprint: Optional[Tuple[frozenset, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary.
+        
+        The copy is shallow: nested label, network, volume, environment and
+        port structures are shared with the instance, not deep-copied.
+        """
+        return {name: getattr(self, name) for name in _INFO_FIELDS}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ContainerInfo':
+        """Create from a dictionary produced by ``to_dict()``.
+        
+        Fields with a default may be missing, e.g. in data written before
+        they were added.
+        """
+        intern = sys.intern
+        values = {
+            name: data[name] for name in _INFO_FIELDS
+            if name in data or name not in _INFO_DEFAULTS
+        }
+        values['image'] = intern(values['image'])
+        values['status'] = intern(values['status'])
+        values['labels'] = _intern_strings(values['labels'])
+        values['environment'] = _intern_strings(values['environment'])
+        values['networks'] = {
+            intern(name): _intern_strings(network)
+            for name, network in values['networks'].items()
+        }
+        values['volumes'] = [_intern_strings(v) for v in values['volumes']]
+        return cls(**values)
+    
+    def fingerprint(self, ignore: Optional[frozenset] = None) -> str:
+        """Return a stable hash of the container's configuration.
+        
+        Two containers deployed from the same configuration share a
+        fingerprint even if they were created at different times or on
+        different hosts: ignored fields are dropped, dictionaries are hashed
+        with sorted keys and lists (volumes, aliases, port bindings) are
+        hashed in sorted order. The result is cached on the object.
+        
+        Args:
+            ignore: '/'-separated field paths to leave out, e.g.
+                ``'labels/com.docker.compose.config-hash'`` or
+                ``'networks/*/IPAddress'`` (defaults to
+                ``DEFAULT_FINGERPRINT_IGNORE``)
+        
+        Returns:
+            Hex SHA-256 of the canonical configuration
+        """
+        ignore = DEFAULT_FINGERPRINT_IGNORE if ignore is None else frozenset(ignore)
+        cached = self._fingerprint
+        if cached is not None and (cached[0] is ignore or cached[0] == ignore):
+            return cached[1]
+        
+        canonical = _canonicalize(self.to_dict(), compile_ignore(ignore))
+        digest = hashlib.sha256(canonical_json(canonical)).hexdigest()
+        self._fingerprint = (ignore, digest)
+        return digest
+
+
+# Data fields of ContainerInfo, without private caches
+_INFO_FIELDS = tuple(f.name for f in fields(ContainerInfo) if f.init)
+_INFO_DEFAULTS = frozenset(
+    f.name for f in fields(ContainerInfo) if f.init and f.default is not MISSING
+)
 
 
 class SSHConnectionError(Exception):
@@ -68,8 +267,174 @@ class DockerConnectionError(Exception):
 
 
 class ContainerInspectionError(Exception):
-    """Raised when container inspection fails."""
-    pass
+    """Raised when container inspection fails.
+    
+    Attributes:
+        container_id: ID of the container that failed, when the error is
+            about a single container (e.g. yielded by ``iter_containers()``)
+    """
+    
+    def __init__(self, message: str = '', container_id: Optional[str] = None):
+        super().__init__(message)
+        self.container_id = container_id
+
+
+def loads_json(data: bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed.
+    
+    Args:
+        data: Raw JSON bytes
+    
+    Returns:
+        Decoded document
+    
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def canonical_json(obj: Any) -> bytes:
+    """Encode a value as canonical JSON for hashing.
+    
+    Keys are sorted and whitespace removed, so equal values always encode to
+    the same bytes. The stdlib encoder is used even when orjson is installed
+    so that hashes do not depend on which JSON library a machine has.
+    
+    Args:
+        obj: JSON-serializable value
+    
+    Returns:
+        UTF-8 encoded canonical JSON
+    """
+    return json.dumps(
+        obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+    ).encode()
+
+
+def parse_container_attrs(
+    attrs: Dict[str, Any],
+    image_defaults: Optional['ImageDefaults'] = None
+) -> ContainerInfo:
+    """Extract a ContainerInfo from a raw container inspect payload.
+    
+    Fields are read straight from the decoded payload; no SDK model objects
+    are built. Strings that repeat across containers are interned.
+    
+    Args:
+        attrs: Decoded ``GET /containers/{id}/json`` response
+        image_defaults: Defaults of the container's image (see
+            ``image_cache.parse_image_config()``); environment variables and
+            labels with the same value as in the image are left out
+    
+    Returns:
+        ContainerInfo object with extracted data
+    
+    Raises:
+        ContainerInspectionError: If an expected field is missing
+    """
+    intern = sys.intern
+    try:
+        config = attrs['Config']
+        network_settings = attrs['NetworkSettings']
+        state = attrs['State']
+        
+        # Extract volumes
+        volumes = [
+            {
+                'type': intern(mount['Type']),
+                'source': intern(mount.get('Source', '')),
+                'destination': intern(mount['Destination']),
+                'mode': intern(mount.get('Mode', '')),
+                'rw': mount.get('RW', True)
+            }
+            for mount in attrs.get('Mounts') or ()
+        ]
+        
+        # Extract environment variables (parse into dict)
+        image_env = image_defaults['env'] if image_defaults else {}
+        environment = {}
+        for env_var in config.get('Env') or ():
+            key, sep, value = env_var.partition('=')
+            if sep and image_env.get(key) != value:
+                environment[intern(key)] = intern(value)
+        
+        labels = config.get('Labels') or {}
+        if image_defaults:
+            image_labels = image_defaults['labels']
+            labels = {
+                key: value for key, value in labels.items()
+                if image_labels.get(key) != value
+            }
+        
+        # Network IDs, gateways and MACs repeat for every container on a
+        # network
+        networks = {
+            intern(name): _intern_strings(network)
+            for name, network in (network_settings.get('Networks') or {}).items()
+        }
+        
+        return ContainerInfo(
+            container_id=attrs['Id'],
+            # Container name without the leading slash
+            name=attrs['Name'].lstrip('/'),
+            image=intern(config['Image']),
+            status=intern(state['Status']),
+            labels=_intern_strings(labels),
+            networks=networks,
+            volumes=volumes,
+            environment=environment,
+            ports=network_settings.get('Ports') or {},
+            created=attrs['Created'],
+            started=state.get('StartedAt') or None,
+            image_id=intern(attrs.get('Image', '')),
+            defaults_stripped=image_defaults is not None
+        )
+        
+    except KeyError as e:
+        raise ContainerInspectionError(
+            f"Missing expected field in container data: {e}"
+        )
+
+
+def parse_inspect_response(
+    host: str,
+    container_id: str,
+    status: int,
+    body: bytes,
+    image_cache: Optional['ImageConfigCache'] = None
+) -> ContainerInfo:
+    """Turn one raw inspect response into a ContainerInfo.
+    
+    With an ``image_cache``, the defaults of the container's image are
+    subtracted when the cache holds them.
+    
+    Raises:
+        ContainerInspectionError: If the response is an error or malformed
+    """
+    if status == 404:
+        raise ContainerInspectionError(
+            f"Container {container_id} not found on {host}",
+            container_id=container_id
+        )
+    if status != 200:
+        raise ContainerInspectionError(
+            f"Failed to inspect container {container_id}: HTTP {status}",
+            container_id=container_id
+        )
+    try:
+        attrs = loads_json(body)
+        image_defaults = (
+            image_cache.get(attrs.get('Image', '')) if image_cache else None
+        )
+        return parse_container_attrs(attrs, image_defaults)
+    except (ContainerInspectionError, ValueError) as e:
+        raise ContainerInspectionError(
+            f"Failed to inspect container {container_id}: {e}",
+            container_id=container_id
+        )
 
 
 class DockerInspector:
@@ -85,7 +450,13 @@ class DockerInspector:
         username: str,
         ssh_key_path: Optional[str] = None,
         ssh_timeout: int = 10,
-        docker_timeout: int = 30
+        docker_timeout: int = 30,
+        docker_socket: str = DEFAULT_DOCKER_SOCKET,
+        container_workers: int = 1,
+        container_timeout: Optional[float] = None,
+        collector: str = 'api',
+        ssh_port: Optional[int] = None,
+        jump_client: Optional[paramiko.SSHClient] = None
     ) -> None:
         """Initialize Docker inspector.
         
@@ -95,12 +466,38 @@ class DockerInspector:
             ssh_key_path: Path to SSH private key (None to use SSH agent)
             ssh_timeout: SSH connection timeout in seconds
             docker_timeout: Docker API timeout in seconds
+            docker_socket: Path of the Docker socket on the target host
+            container_workers: Concurrent container inspections in
+                ``inspect_all_containers()`` (1 uses a single pipelined batch)
+            container_timeout: Per-container inspection deadline in seconds
+                when inspecting concurrently (None for no deadline)
+            collector: ``'api'`` to use the Docker API over the SSH tunnel,
+                ``'exec'`` to run one batched ``docker inspect`` command over
+                an SSH exec channel (no Docker API connection needed)
+            ssh_port: SSH port of the target host (None for 22)
+            jump_client: Connected SSH client of a bastion host; the target
+                is reached through a ``direct-tcpip`` channel on it instead of
+                being dialled directly
+        
+        Raises:
+            ValueError: If the collector is unknown
         """
+        if collector not in COLLECTORS:
+            raise ValueError(
+                f"Unknown collector {collector!r}, expected one of {COLLECTORS}"
+            )
+        
         self.host = host
         self.username = username
         self.ssh_key_path = ssh_key_path
         self.ssh_timeout = ssh_timeout
         self.docker_timeout = docker_timeout
+        self.docker_socket = docker_socket
+        self.container_workers = container_workers
+        self.container_timeout = container_timeout
+        self.collector = collector
+        self.ssh_port = ssh_port
+        self.jump_client = jump_client
         
         self.ssh_client: Optional[paramiko.SSHClient] = None
         self.docker_client: Optional[docker.DockerClient] = None
@@ -129,6 +526,13 @@ class DockerInspector:
             if self.ssh_key_path:
                 connect_kwargs['key_filename'] = self.ssh_key_path
             
+            if self.ssh_port:
+                connect_kwargs['port'] = self.ssh_port
+            
+            if self.jump_client is not None:
+                # Tunnel through the bastion's existing session
+                connect_kwargs['sock'] = self._open_jump_channel()
+            
             # Attempt connection
             self.ssh_client.connect(**connect_kwargs)
             
@@ -147,9 +551,35 @@ class DockerInspector:
                 f"Failed to connect to {self.host}: {e}"
             )
     
+    def _open_jump_channel(self) -> paramiko.Channel:
+        """Open a ``direct-tcpip`` channel to the target through the bastion.
+        
+        Returns:
+            Channel connected to the target's SSH port
+        
+        Raises:
+            SSHConnectionError: If the bastion session is not active
+            paramiko.ChannelException: If the bastion refuses the channel
+        """
+        transport = self.jump_client.get_transport()
+        if transport is None or not transport.is_active():
+            raise SSHConnectionError(
+                f"Jump host session for {self.host} is not active"
+            )
+        
+        return transport.open_channel(
+            'direct-tcpip',
+            (self.host, self.ssh_port or 22),
+            ('127.0.0.1', 0),
+            timeout=self.ssh_timeout
+        )
+    
     def connect_docker(self) -> None:
         """Connect to Docker daemon over SSH.
         
+        The Docker API is tunnelled through the SSH session opened by
+        ``connect()``, so no second handshake is made.
+        
         Raises:
             DockerConnectionError: If Docker connection fails
         """
@@ -159,12 +589,14 @@ class DockerInspector:
         try:
             logger.info(f"Connecting to Docker on {self.host}...")
             
-            # Create Docker client using SSH connection
-            docker_url = f"ssh://{self.username}@{self.host}"
-            self.docker_client = docker.DockerClient(
-                base_url=docker_url,
+            # Create Docker client on top of the existing SSH transport
+            self.docker_client = create_docker_client(
+                self.ssh_client.get_transport(),
+                socket_path=self.docker_socket,
                 timeout=self.docker_timeout,
-                use_ssh_client=True
+                max_pool_size=max(
+                    self.container_workers, DEFAULT_MAX_POOL_SIZE
+                )
             )
             
             # Test connection by pinging Docker daemon
@@ -181,14 +613,23 @@ class DockerInspector:
                 f"Unexpected error connecting to Docker on {self.host}: {e}"
             )
     
-    def list_containers(self, all_containers: bool = False) -> List[str]:
-        """List container IDs on the target host.
+    def list_container_entries(
+        self,
+        all_containers: bool = False,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """List containers on the target host as raw listing entries.
+        
+        Filtering happens on the daemon, so a narrow filter costs one small
+        request however many containers the host runs.
         
         Args:
             all_containers: If True, include stopped containers
+            filters: Docker-native filters sent to the daemon, e.g.
+                ``{'label': ['com.docker.compose.project=media']}``
         
         Returns:
-            List of container IDs
+            List of ``/containers/json`` entries
         
         Raises:
             DockerConnectionError: If not connected to Docker
@@ -198,25 +639,60 @@ class DockerInspector:
             raise DockerConnectionError("Docker client not initialized")
         
         try:
-            containers = self.docker_client.containers.list(all=all_containers)
-            container_ids = [c.id for c in containers]
+            # Sparse listing: one request, no per-container inspect
+            entries = self.docker_client.api.containers(
+                all=all_containers, filters=filters
+            )
             
             logger.info(
-                f"Found {len(container_ids)} container(s) on {self.host}"
+                f"Found {len(entries)} container(s) on {self.host}"
             )
             
-            return container_ids
+            return entries
             
         except DockerException as e:
             raise ContainerInspectionError(
                 f"Failed to list containers on {self.host}: {e}"
             )
     
-    def inspect_container(self, container_id: str) -> ContainerInfo:
+    def list_containers(
+        self,
+        all_containers: bool = False,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """List container IDs on the target host.
+        
+        Args:
+            all_containers: If True, include stopped containers
+            filters: Docker-native filters sent to the daemon (label, name,
+                status, ancestor, network, ...)
+        
+        Returns:
+            List of container IDs
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+            ContainerInspectionError: If listing fails
+        """
+        entries = self.list_container_entries(
+            all_containers=all_containers, filters=filters
+        )
+        return [entry['Id'] for entry in entries]
+    
+    def inspect_container(
+        self,
+        container_id: str,
+        image_cache: Optional['ImageConfigCache'] = None
+    ) -> ContainerInfo:
         """Inspect a specific container and extract configuration.
         
+        The raw inspect response is decoded directly (with orjson when
+        available) instead of building a docker SDK ``Container`` model.
+        
         Args:
             container_id: Container ID or name
+            image_cache: Subtract the defaults of the container's image,
+                inspecting the image first if it is not cached
         
         Returns:
             ContainerInfo object with extracted data
@@ -231,63 +707,16 @@ class DockerInspector:
         try:
             logger.debug(f"Inspecting container {container_id[:12]}...")
             
-            container = self.docker_client.containers.get(container_id)
-            attrs = container.attrs
-            
-            # Extract container name (remove leading slash)
-            name = attrs['Name'].lstrip('/')
-            
-            # Extract image name
-            image = attrs['Config']['Image']
-            
-            # Extract labels
-            labels = attrs['Config'].get('Labels', {}) or {}
-            
-            # Extract networks
-            networks = attrs['NetworkSettings'].get('Networks', {})
-            
-            # Extract volumes
-            volumes = []
-            if attrs.get('Mounts'):
-                for mount in attrs['Mounts']:
-                    volumes.append({
-                        'type': mount['Type'],
-                        'source': mount.get('Source', ''),
-                        'destination': mount['Destination'],
-                        'mode': mount.get('Mode', ''),
-                        'rw': mount.get('RW', True)
-                    })
+            api = self.docker_client.api
+            response = api._get(api._url('/containers/{0}/json', container_id))
+            api._raise_for_status(response)
+            attrs = loads_json(response.content)
+            image_defaults = None
+            if image_cache is not None and attrs.get('Image'):
+                image_defaults = self._image_defaults(attrs['Image'], image_cache)
+            container_info = parse_container_attrs(attrs, image_defaults)
             
-            # Extract environment variables (parse into dict)
-            env_list = attrs['Config'].get('Env', []) or []
-            environment = {}
-            for env_var in env_list:
-                if '=' in env_var:
-                    key, value = env_var.split('=', 1)
-                    environment[key] = value
-            
-            # Extract ports
-            ports = attrs['NetworkSettings'].get('Ports', {}) or {}
-            
-            # Extract timestamps
-            created = attrs['Created']
-            started = attrs['State'].get('StartedAt', '')
-            
-            container_info = ContainerInfo(
-                container_id=attrs['Id'],
-                name=name,
-                image=image,
-                status=attrs['State']['Status'],
-                labels=labels,
-                networks=networks,
-                volumes=volumes,
-                environment=environment,
-                ports=ports,
-                created=created,
-                started=started if started else None
-            )
-            
-            logger.debug(f"Successfully inspected container {name}")
+            logger.debug(f"Successfully inspected container {container_info.name}")
             
             return container_info
             
@@ -295,23 +724,367 @@ class DockerInspector:
             raise ContainerInspectionError(
                 f"Container {container_id} not found on {self.host}"
             )
-        except DockerException as e:
+        except (DockerException, ValueError) as e:
             raise ContainerInspectionError(
                 f"Failed to inspect container {container_id}: {e}"
             )
-        except KeyError as e:
+    
+    def _image_defaults(
+        self,
+        image_id: str,
+        image_cache: 'ImageConfigCache'
+    ) -> Optional['ImageDefaults']:
+        """Return an image's defaults, inspecting the image on a cache miss.
+        
+        Returns:
+            The defaults, or None if the image cannot be inspected
+        """
+        image_defaults = image_cache.get(image_id)
+        if image_defaults is not None:
+            return image_defaults
+        
+        from image_cache import parse_image_config
+        
+        api = self.docker_client.api
+        try:
+            response = api._get(api._url('/images/{0}/json', image_id))
+            api._raise_for_status(response)
+            image_defaults = parse_image_config(loads_json(response.content))
+        except (DockerException, ValueError) as e:
+            logger.warning(f"Failed to inspect image {image_id} on {self.host}: {e}")
+            return None
+        
+        image_cache.put(image_id, image_defaults)
+        return image_defaults
+    
+    def fetch_image_configs(
+        self,
+        image_ids: List[str],
+        image_cache: 'ImageConfigCache'
+    ) -> int:
+        """Inspect the images missing from a cache in one pipelined batch.
+        
+        Images that cannot be inspected (e.g. removed since their container
+        was created) are logged and skipped; their containers keep the full
+        environment and labels.
+        
+        Args:
+            image_ids: Image IDs, e.g. the ``ImageID`` of listing entries
+            image_cache: Cache to look up and fill
+        
+        Returns:
+            Number of images inspected
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+        """
+        missing = image_cache.missing(image_ids)
+        if not missing:
+            return 0
+        if not self.docker_client or not self.ssh_client:
+            raise DockerConnectionError("Docker client not initialized")
+        
+        from image_cache import parse_image_config
+        
+        api_version = self.docker_client.api.api_version
+        paths = [f"/v{api_version}/images/{image_id}/json" for image_id in missing]
+        fetched = 0
+        try:
+            responses = pipelined_get(
+                self.ssh_client.get_transport(),
+                paths,
+                socket_path=self.docker_socket,
+                timeout=self.docker_timeout
+            )
+            for image_id, (_, status, body) in zip(missing, responses):
+                if status != 200:
+                    logger.warning(
+                        f"Failed to inspect image {image_id} on {self.host}: "
+                        f"HTTP {status}"
+                    )
+                    continue
+                image_cache.put(image_id, parse_image_config(loads_json(body)))
+                fetched += 1
+                
+        except (paramiko.SSHException, http.client.HTTPException, OSError,
+                ValueError) as e:
+            logger.warning(f"Image inspection failed on {self.host}: {e}")
+        
+        logger.debug(f"Inspected {fetched} new image(s) on {self.host}")
+        return fetched
+    
+    def _iter_pipelined(
+        self,
+        container_ids: List[str],
+        image_cache: Optional['ImageConfigCache'] = None
+    ) -> Iterator[Union[ContainerInfo, ContainerInspectionError]]:
+        """Yield inspection results from one pipelined batch as they arrive.
+        
+        Per-container failures are yielded as ContainerInspectionError
+        instances rather than raised.
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+            ContainerInspectionError: If the bulk request fails
+        """
+        if not self.docker_client or not self.ssh_client:
+            raise DockerConnectionError("Docker client not initialized")
+        
+        api_version = self.docker_client.api.api_version
+        paths = [
+            f"/v{api_version}/containers/{container_id}/json"
+            for container_id in container_ids
+        ]
+        
+        try:
+            responses = pipelined_get(
+                self.ssh_client.get_transport(),
+                paths,
+                socket_path=self.docker_socket,
+                timeout=self.docker_timeout
+            )
+            for container_id, (_, status, body) in zip(container_ids, responses):
+                try:
+                    yield parse_inspect_response(
+                        self.host, container_id, status, body, image_cache
+                    )
+                except ContainerInspectionError as e:
+                    logger.error(f"Failed to inspect {container_id[:12]}: {e}")
+                    yield e
+                    
+        except (paramiko.SSHException, http.client.HTTPException, OSError) as e:
             raise ContainerInspectionError(
-                f"Missing expected field in container data: {e}"
+                f"Bulk inspection failed on {self.host}: {e}"
             )
     
+    def inspect_containers(
+        self,
+        container_ids: List[str],
+        image_cache: Optional['ImageConfigCache'] = None
+    ) -> Tuple[List[ContainerInfo], List[str]]:
+        """Inspect many containers in a single pipelined round trip.
+        
+        All ``GET /containers/{id}/json`` requests are written to one SSH
+        channel before any response is read, so the cost is close to one
+        round trip regardless of the number of containers.
+        
+        Args:
+            container_ids: Container IDs to inspect
+            image_cache: Subtract the image defaults held by this cache
+                (fill it first with ``fetch_image_configs()``)
+        
+        Returns:
+            Tuple of (ContainerInfo objects, IDs that could not be inspected)
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+            ContainerInspectionError: If the bulk request fails
+        """
+        results = []
+        failed = []
+        
+        for item in self._iter_pipelined(container_ids, image_cache):
+            if isinstance(item, ContainerInspectionError):
+                failed.append(item.container_id)
+            else:
+                results.append(item)
+        
+        return results, failed
+    
+    def _iter_concurrent(
+        self,
+        container_ids: List[str],
+        image_cache: Optional['ImageConfigCache'] = None
+    ) -> Iterator[Tuple[int, Union[ContainerInfo, ContainerInspectionError]]]:
+        """Yield ``(index, result)`` from the worker pool in completion order.
+        
+        Per-container failures and timeouts are yielded as
+        ContainerInspectionError instances rather than raised.
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+        """
+        if not self.docker_client:
+            raise DockerConnectionError("Docker client not initialized")
+        
+        outcomes = iter_bounded(
+            lambda container_id: self.inspect_container(container_id, image_cache),
+            container_ids,
+            max_workers=self.container_workers,
+            item_timeout=self.container_timeout,
+            thread_name_prefix=f'inspect-{self.host}'
+        )
+        
+        for index, outcome in outcomes:
+            container_id = container_ids[index]
+            if outcome is TIMED_OUT:
+                outcome = ContainerInspectionError(
+                    f"Inspection of {container_id} exceeded "
+                    f"{self.container_timeout}s deadline",
+                    container_id=container_id
+                )
+            elif isinstance(outcome, ContainerInspectionError):
+                outcome.container_id = container_id
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            
+            if isinstance(outcome, ContainerInspectionError):
+                logger.error(f"Failed to inspect {container_id[:12]}: {outcome}")
+            yield index, outcome
+    
+    def inspect_containers_concurrently(
+        self,
+        container_ids: List[str],
+        image_cache: Optional['ImageConfigCache'] = None
+    ) -> Tuple[List[ContainerInfo], List[str]]:
+        """Inspect containers on a bounded pool of worker threads.
+        
+        Each worker issues its own inspect request; requests share the host's
+        SSH transport, each on its own channel. Up to ``container_workers``
+        inspections run at once, and any that run past ``container_timeout``
+        are reported as failed.
+        
+        Args:
+            container_ids: Container IDs to inspect
+            image_cache: Subtract image defaults, inspecting images missing
+                from this cache
+        
+        Returns:
+            Tuple of (ContainerInfo objects, IDs that could not be inspected)
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+        """
+        outcomes = dict(self._iter_concurrent(container_ids, image_cache))
+        
+        results = []
+        failed = []
+        
+        for index, container_id in enumerate(container_ids):
+            outcome = outcomes[index]
+            if isinstance(outcome, ContainerInspectionError):
+                failed.append(container_id)
+            else:
+                results.append(outcome)
+        
+        return results, failed
+    
+    def iter_containers(
+        self,
+        all_containers: bool = False,
+        cache: Optional['InspectionCache'] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        image_cache: Optional['ImageConfigCache'] = None
+    ) -> Iterator[Union[ContainerInfo, ContainerInspectionError]]:
+        """Yield containers on the target host as soon as each is inspected.
+        
+        Streaming counterpart of ``inspect_all_containers()``: cached
+        containers come first, then fresh results in arrival order (listing
+        order for the pipelined batch, completion order on the worker pool).
+        A container that cannot be inspected is yielded as a
+        ContainerInspectionError carrying its ``container_id`` instead of
+        aborting the stream. The cache is updated once the stream has been
+        consumed to the end.
+        
+        Args:
+            all_containers: If True, include stopped containers
+            cache: Optional InspectionCache to reuse unchanged containers
+            filters: Docker-native filters sent to the daemon
+            image_cache: Optional ImageConfigCache; when given, only the
+                environment variables and labels a container sets on top of
+                its image are returned
+        
+        Yields:
+            ContainerInfo objects, or ContainerInspectionError instances for
+            containers that failed
+        
+        Raises:
+            DockerConnectionError: If not connected to Docker
+            ContainerInspectionError: If listing or the bulk request fails
+        """
+        if self.collector == 'exec':
+            if cache is not None:
+                logger.debug("Inspection cache is not used by the exec collector")
+            if image_cache is not None:
+                logger.debug("Image defaults are not subtracted by the exec collector")
+            from exec_collector import collect_containers
+            
+            results, failed = collect_containers(
+                self.ssh_client,
+                self.host,
+                all_containers=all_containers,
+                filters=filters,
+                timeout=self.docker_timeout
+            )
+            yield from results
+            for container_id in failed:
+                yield ContainerInspectionError(
+                    f"Failed to parse container {container_id} on {self.host}",
+                    container_id=container_id
+                )
+            return
+        
+        entries = self.list_container_entries(
+            all_containers=all_containers, filters=filters
+        )
+        
+        container_ids = [entry['Id'] for entry in entries]
+        results: List[ContainerInfo] = []
+        if cache is not None:
+            cached, container_ids = cache.lookup(
+                self.host, entries, strip_image_defaults=image_cache is not None
+            )
+            results.extend(cached.values())
+            yield from cached.values()
+        
+        if container_ids and image_cache is not None:
+            self._fetch_listed_images(entries, container_ids, image_cache)
+        
+        if not container_ids:
+            stream = iter(())
+        elif self.container_workers > 1:
+            stream = (
+                item for _, item in self._iter_concurrent(container_ids, image_cache)
+            )
+        else:
+            stream = self._iter_pipelined(container_ids, image_cache)
+        
+        for item in stream:
+            if not isinstance(item, ContainerInspectionError):
+                results.append(item)
+            yield item
+        
+        if cache is not None:
+            cache.update(self.host, entries, results, prune=not filters)
+    
     def inspect_all_containers(
         self,
-        all_containers: bool = False
+        all_containers: bool = False,
+        cache: Optional['InspectionCache'] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        image_cache: Optional['ImageConfigCache'] = None
     ) -> List[ContainerInfo]:
         """Inspect all containers on the target host.
         
+        Containers are fetched in one pipelined batch, or on a worker pool
+        when ``container_workers`` is greater than 1. With a cache, only
+        containers whose listing fingerprint changed since the last scan are
+        inspected; on a stable host the scan is a single list request. With
+        the ``'exec'`` collector the whole scan is one remote command and the
+        caches are not consulted.
+        
+        With an image cache, the images of the inspected containers that are
+        not cached yet are inspected first, in one pipelined batch, and every
+        container's environment and labels are reduced to what it sets on
+        top of its image.
+        
         Args:
             all_containers: If True, include stopped containers
+            cache: Optional InspectionCache to reuse unchanged containers
+            filters: Docker-native filters sent to the daemon (label, name,
+                status, ancestor, network, ...)
+            image_cache: Optional ImageConfigCache, shared across hosts, used
+                to subtract image defaults
         
         Returns:
             List of ContainerInfo objects
@@ -320,18 +1093,50 @@ class DockerInspector:
             DockerConnectionError: If not connected to Docker
             ContainerInspectionError: If inspection fails
         """
-        container_ids = self.list_containers(all_containers=all_containers)
+        if self.collector == 'exec':
+            if cache is not None:
+                logger.debug("Inspection cache is not used by the exec collector")
+            if image_cache is not None:
+                logger.debug("Image defaults are not subtracted by the exec collector")
+            return self.collect_containers(
+                all_containers=all_containers, filters=filters
+            )
         
-        results = []
-        failed = []
+        entries = self.list_container_entries(
+            all_containers=all_containers, filters=filters
+        )
         
-        for container_id in container_ids:
-            try:
-                info = self.inspect_container(container_id)
-                results.append(info)
-            except ContainerInspectionError as e:
-                logger.error(f"Failed to inspect {container_id[:12]}: {e}")
-                failed.append(container_id)
+        cached: Dict[str, ContainerInfo] = {}
+        container_ids = [entry['Id'] for entry in entries]
+        if cache is not None:
+            cached, container_ids = cache.lookup(
+                self.host, entries, strip_image_defaults=image_cache is not None
+            )
+            logger.info(
+                f"Reusing {len(cached)} cached container(s) on {self.host}, "
+                f"inspecting {len(container_ids)}"
+            )
+        
+        if container_ids and image_cache is not None:
+            self._fetch_listed_images(entries, container_ids, image_cache)
+        
+        if not container_ids:
+            inspected, failed = [], []
+        elif self.container_workers > 1:
+            inspected, failed = self.inspect_containers_concurrently(
+                container_ids, image_cache
+            )
+        else:
+            inspected, failed = self.inspect_containers(container_ids, image_cache)
+        
+        # Keep the daemon's listing order across cached and fresh results
+        by_id = dict(cached)
+        by_id.update((info.container_id, info) for info in inspected)
+        results = [by_id[e['Id']] for e in entries if e['Id'] in by_id]
+        
+        if cache is not None:
+            # A filtered scan only sees part of the host; keep the rest
+            cache.update(self.host, entries, results, prune=not filters)
         
         if failed:
             logger.warning(
@@ -345,6 +1150,84 @@ class DockerInspector:
         
         return results
     
+    def _fetch_listed_images(
+        self,
+        entries: List[Dict[str, Any]],
+        container_ids: List[str],
+        image_cache: 'ImageConfigCache'
+    ) -> None:
+        """Cache the images of the listed containers about to be inspected."""
+        wanted = set(container_ids)
+        self.fetch_image_configs(
+            [entry.get('ImageID', '') for entry in entries if entry['Id'] in wanted],
+            image_cache
+        )
+    
+    def collect_containers(
+        self,
+        all_containers: bool = False,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[ContainerInfo]:
+        """Inspect all containers with a single remote ``docker`` command.
+        
+        Runs ``docker ps`` and one batched ``docker inspect`` over an SSH exec
+        channel and parses the (gzip-compressed) output. Only the SSH session
+        from ``connect()`` is needed.
+        
+        Args:
+            all_containers: If True, include stopped containers
+            filters: Docker-native filters passed as ``--filter key=value``
+        
+        Returns:
+            List of ContainerInfo objects
+        
+        Raises:
+            DockerConnectionError: If not connected via SSH
+            ContainerInspectionError: If the remote command fails
+        """
+        from exec_collector import collect_containers
+        
+        results, failed = collect_containers(
+            self.ssh_client,
+            self.host,
+            all_containers=all_containers,
+            filters=filters,
+            timeout=self.docker_timeout
+        )
+        
+        if failed:
+            logger.warning(
+                f"Failed to parse {len(failed)} container(s): "
+                f"{', '.join(c[:12] for c in failed)}"
+            )
+        
+        return results
+    
+    def watch(
+        self,
+        all_containers: bool = False,
+        on_change: Optional[Callable[[str, str, Optional[ContainerInfo]], None]] = None
+    ) -> 'ContainerWatcher':
+        """Start watching the host's containers via the Docker event stream.
+        
+        Args:
+            all_containers: If True, keep stopped containers in the map
+            on_change: Optional callback invoked as
+                ``on_change(action, container_id, info)`` after each event
+        
+        Returns:
+            Started ContainerWatcher exposing the live container map
+        
+        Raises:
+            DockerConnectionError: If not connected or subscription fails
+            ContainerInspectionError: If the initial snapshot fails
+        """
+        from watcher import ContainerWatcher
+        
+        return ContainerWatcher(
+            self, all_containers=all_containers, on_change=on_change
+        ).start()
+    
     def disconnect(self) -> None:
         """Close SSH and Docker connections."""
         if self.docker_client:
@@ -368,7 +1251,8 @@ class DockerInspector:
     def __enter__(self):
         """Context manager entry."""
         self.connect()
-        self.connect_docker()
+        if self.collector == 'api':
+            self.connect_docker()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -382,12 +1266,21 @@ def inspect_host(
     ssh_key_path: Optional[str] = None,
     ssh_timeout: int = 10,
     docker_timeout: int = 30,
-    all_containers: bool = False
+    all_containers: bool = False,
+    container_workers: int = 1,
+    container_timeout: Optional[float] = None,
+    cache: Optional['InspectionCache'] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    collector: str = 'api',
+    pool: Optional['ConnectionPool'] = None,
+    jump_host: Optional[str] = None,
+    image_cache: Optional['ImageConfigCache'] = None
 ) -> Dict[str, Any]:
     """Inspect all containers on a single host.
     
     This is a convenience function that handles connection and inspection
-    in a single call.
+    in a single call. The connection is borrowed from a connection pool, so
+    repeated scans of the same host in one process reuse the SSH session.
     
     Args:
         host: Target host IP address
@@ -396,40 +1289,158 @@ def inspect_host(
         ssh_timeout: SSH connection timeout
         docker_timeout: Docker API timeout
         all_containers: Include stopped containers
+        container_workers: Concurrent container inspections (1 uses a
+            single pipelined batch)
+        container_timeout: Per-container inspection deadline in seconds
+        cache: Optional InspectionCache to reuse unchanged containers
+        filters: Docker-native filters sent to the daemon
+        collector: ``'api'`` (Docker API) or ``'exec'`` (one remote command)
+        pool: ConnectionPool to borrow the connection from (None uses the
+            process-wide default pool)
+        jump_host: Bastion as ``[user@]host[:port]`` to reach the host
+            through (the pool shares one bastion connection)
+        image_cache: Optional ImageConfigCache to subtract image defaults
+            from environment variables and labels
     
     Returns:
-        Dictionary with host info and container data
+        Dictionary with host info and container data; a filtered scan
+        also records its ``filters``, since it only saw part of the host
     
     Raises:
         SSHConnectionError: If SSH connection fails
         DockerConnectionError: If Docker connection fails
         ContainerInspectionError: If inspection fails
     """
-    inspector = DockerInspector(
-        host=host,
-        username=username,
+    if pool is None:
+        from connection_pool import get_default_pool
+        pool = get_default_pool()
+    
+    with pool.connection(
+        host,
+        username,
         ssh_key_path=ssh_key_path,
+        connect_docker=collector == 'api',
+        jump_host=jump_host,
         ssh_timeout=ssh_timeout,
-        docker_timeout=docker_timeout
-    )
-    
-    try:
-        inspector.connect()
-        inspector.connect_docker()
-        
+        docker_timeout=docker_timeout,
+        container_workers=container_workers,
+        container_timeout=container_timeout,
+        collector=collector
+    ) as inspector:
         containers = inspector.inspect_all_containers(
-            all_containers=all_containers
+            all_containers=all_containers,
+            cache=cache,
+            filters=filters,
+            image_cache=image_cache
         )
+    
+    entry = {
+        'host': host,
+        'timestamp': datetime.utcnow().isoformat(),
+        'container_count': len(containers),
+        'containers': [c.to_dict() for c in containers]
+    }
+    if filters:
+        entry['filters'] = filters
+    return entry
+
+
+def _inspect_host_entry(host: str, **kwargs: Any) -> Dict[str, Any]:
+    """Inspect one host, converting inspection errors into an error entry."""
+    try:
+        logger.info(f"Processing host: {host}")
+        return inspect_host(host=host, **kwargs)
         
+    except (SSHConnectionError, DockerConnectionError, ContainerInspectionError) as e:
+        logger.error(f"Failed to inspect {host}: {e}")
         return {
             'host': host,
-            'timestamp': datetime.utcnow().isoformat(),
-            'container_count': len(containers),
-            'containers': [c.to_dict() for c in containers]
+            'error': str(e),
+            'timestamp': datetime.utcnow().isoformat()
         }
-        
-    finally:
-        inspector.disconnect()
+
+
+def _iter_host_entries(
+    hosts: List[str],
+    max_workers: int,
+    host_timeout: Optional[float],
+    host_kwargs: Dict[str, Any]
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield ``(index, host entry)`` for each host in completion order."""
+    outcomes = iter_bounded(
+        lambda host: _inspect_host_entry(host, **host_kwargs),
+        hosts,
+        max_workers=max_workers,
+        item_timeout=host_timeout,
+        thread_name_prefix='inspect-host'
+    )
+    
+    for index, outcome in outcomes:
+        host = hosts[index]
+        if outcome is TIMED_OUT:
+            logger.error(
+                f"Failed to inspect {host}: exceeded {host_timeout}s deadline"
+            )
+            outcome = {
+                'host': host,
+                'error': f"Host scan exceeded {host_timeout}s deadline",
+                'timestamp': datetime.utcnow().isoformat()
+            }
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        yield index, outcome
+
+
+def iter_hosts(
+    hosts: List[str],
+    username: str,
+    ssh_key_path: Optional[str] = None,
+    ssh_timeout: int = 10,
+    docker_timeout: int = 30,
+    all_containers: bool = False,
+    max_workers: int = 1,
+    host_timeout: Optional[float] = None,
+    container_workers: int = 1,
+    container_timeout: Optional[float] = None,
+    cache: Optional['InspectionCache'] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    collector: str = 'api',
+    jump_host: Optional[str] = None,
+    image_cache: Optional['ImageConfigCache'] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield each host's results as soon as its scan finishes.
+    
+    Streaming counterpart of ``inspect_multiple_hosts()``: entries have the
+    same format but arrive in completion order, so slow hosts do not hold
+    back fast ones. Failed and timed-out hosts are yielded as entries with an
+    ``error`` key. Closing the generator early stops scans that have not
+    started yet.
+    
+    Args:
+        See ``inspect_multiple_hosts()``
+    
+    Yields:
+        Per-host result dictionaries
+    """
+    host_kwargs = {
+        'username': username,
+        'ssh_key_path': ssh_key_path,
+        'ssh_timeout': ssh_timeout,
+        'docker_timeout': docker_timeout,
+        'all_containers': all_containers,
+        'container_workers': container_workers,
+        'container_timeout': container_timeout,
+        'cache': cache,
+        'filters': filters,
+        'collector': collector,
+        'jump_host': jump_host,
+        'image_cache': image_cache,
+    }
+    
+    for _, entry in _iter_host_entries(
+        hosts, max_workers, host_timeout, host_kwargs
+    ):
+        yield entry
 
 
 def inspect_multiple_hosts(
@@ -438,10 +1449,22 @@ def inspect_multiple_hosts(
     ssh_key_path: Optional[str] = None,
     ssh_timeout: int = 10,
     docker_timeout: int = 30,
-    all_containers: bool = False
+    all_containers: bool = False,
+    max_workers: int = 1,
+    host_timeout: Optional[float] = None,
+    container_workers: int = 1,
+    container_timeout: Optional[float] = None,
+    cache: Optional['InspectionCache'] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    collector: str = 'api',
+    jump_host: Optional[str] = None,
+    image_cache: Optional['ImageConfigCache'] = None
 ) -> Dict[str, Any]:
     """Inspect containers on multiple hosts.
     
+    Hosts are scanned on a pool of up to ``max_workers`` threads. Results are
+    always returned in the order of ``hosts``, whatever order they finish in.
+    
     Args:
         hosts: List of target host IP addresses
         username: SSH username
@@ -449,6 +1472,18 @@ def inspect_multiple_hosts(
         ssh_timeout: SSH connection timeout
         docker_timeout: Docker API timeout
         all_containers: Include stopped containers
+        max_workers: Maximum number of hosts scanned at the same time
+        host_timeout: Seconds a host may take once its scan has started
+            before it is reported as failed (None for no deadline)
+        container_workers: Concurrent container inspections per host
+        container_timeout: Per-container inspection deadline in seconds
+        cache: Optional InspectionCache shared by all hosts
+        filters: Docker-native filters sent to every host's daemon
+        collector: ``'api'`` (Docker API) or ``'exec'`` (one remote command)
+        jump_host: Bastion as ``[user@]host[:port]``; every host is reached
+            through ``direct-tcpip`` channels on one shared connection to it
+        image_cache: Optional ImageConfigCache shared by all hosts, so each
+            image is inspected once per fleet
     
     Returns:
         Dictionary with results for all hosts
@@ -458,25 +1493,24 @@ def inspect_multiple_hosts(
         'hosts': []
     }
     
-    for host in hosts:
-        try:
-            logger.info(f"Processing host: {host}")
-            host_data = inspect_host(
-                host=host,
-                username=username,
-                ssh_key_path=ssh_key_path,
-                ssh_timeout=ssh_timeout,
-                docker_timeout=docker_timeout,
-                all_containers=all_containers
-            )
-            results['hosts'].append(host_data)
-            
-        except (SSHConnectionError, DockerConnectionError, ContainerInspectionError) as e:
-            logger.error(f"Failed to inspect {host}: {e}")
-            results['hosts'].append({
-                'host': host,
-                'error': str(e),
-                'timestamp': datetime.utcnow().isoformat()
-            })
+    host_kwargs = {
+        'username': username,
+        'ssh_key_path': ssh_key_path,
+        'ssh_timeout': ssh_timeout,
+        'docker_timeout': docker_timeout,
+        'all_containers': all_containers,
+        'container_workers': container_workers,
+        'container_timeout': container_timeout,
+        'cache': cache,
+        'filters': filters,
+        'collector': collector,
+        'jump_host': jump_host,
+        'image_cache': image_cache,
+    }
+    
+    entries = dict(_iter_host_entries(
+        hosts, max_workers, host_timeout, host_kwargs
+    ))
+    results['hosts'] = [entries[index] for index in range(len(hosts))]
     
     return results
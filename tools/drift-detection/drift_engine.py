@@ -0,0 +1,336 @@
+"""Configuration drift between running containers and their baselines.
+
+``drift_container()`` compares one running container with the baseline it
+was deployed from and returns the differences as ``Change`` records, with
+the expected value in ``old`` and the running value in ``new``. Fields that
+compose or the Docker runtime set on their own (``com.docker.compose.*``
+labels, volume paths of named volumes, exposed but unpublished ports, the
+wildcard addresses of published ports) are left out. Relative bind sources
+in a baseline are resolved against the running container's compose working
+directory (``com.docker.compose.project.working_dir``), as compose does on
+the host. Bind sources starting with ``~`` depend on the home directory of
+the user who ran compose, so only their type and mode are compared. Given
+the defaults of the running container's image, environment variables and
+labels equal to them are left out on both sides: a scan taken with
+``image_cache`` no longer holds them, and a baseline setting ``TZ`` to the
+image's own value is not drift. Without image defaults, settings that
+images commonly bake in (``PATH``, ``LANG``, OCI labels; see
+``DEFAULT_RUNTIME_ONLY``) are not reported when only the running container
+has them.
+
+``DriftEngine`` runs the comparison for every pair matched by a
+``FleetIndex`` and remembers each result under the pair's fingerprints:
+SHA-256 hashes of exactly the fields drift is measured on, for the running
+container and for its baseline. A pair whose fingerprints are unchanged
+since the last run reuses the stored result, so an audit of a stable fleet
+only hashes containers and compares nothing. Restarts and redeploys, which
+change IDs, timestamps and addresses but no compared field, keep their
+fingerprints.
+"""
+
+import hashlib
+import logging
+import posixpath
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from docker_inspector import ContainerInfo, loads_json
+from fleet_index import Container, FleetIndex
+from output import dumps_json
+from snapshot_diff import Change, diff_values
+from utils import write_atomic
+
+if TYPE_CHECKING:
+    from image_cache import ImageConfigCache, ImageDefaults
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the comparison rules change so stored results are recomputed
+DRIFT_CACHE_VERSION = 2
+
+COMPOSE_LABEL_PREFIX = 'com.docker.compose.'
+WORKING_DIR_LABEL = 'com.docker.compose.project.working_dir'
+
+# Settings images set on their own. Matched against '/'-joined change paths
+# with fnmatch, and only for settings the baseline does not have.
+DEFAULT_RUNTIME_ONLY = frozenset({
+    'environment/PATH',
+    'environment/HOME',
+    'environment/LANG',
+    'environment/LANGUAGE',
+    'environment/LC_*',
+    'environment/TERM',
+    'labels/maintainer',
+    'labels/org.opencontainers.image.*',
+    'labels/org.label-schema.*',
+})
+
+# Host addresses Docker reports for ports published on all interfaces
+_ANY_ADDRESSES = frozenset({'', '0.0.0.0', '::'})
+
+
+def _working_dir(container: Container) -> str:
+    """Return the directory compose resolved relative paths against."""
+    labels = (container.labels if isinstance(container, ContainerInfo)
+              else container['labels'])
+    return labels.get(WORKING_DIR_LABEL, '')
+
+
+def _image_id(container: Container) -> str:
+    if isinstance(container, ContainerInfo):
+        return container.image_id
+    return container.get('image_id', '')
+
+
+def _home_mounts(baseline: ContainerInfo) -> frozenset:
+    """Return the destinations of bind mounts whose source starts with ``~``.
+    
+    Compose expands ``~`` with the home directory of whoever ran it on the
+    Docker host, which a scan cannot tell, so these sources are not compared.
+    """
+    return frozenset(
+        volume['destination'] for volume in baseline.volumes
+        if volume.get('type') == 'bind' and volume.get('source', '').startswith('~')
+    )
+
+
+def _without(values: Dict[str, str], defaults: Dict[str, str]) -> Dict[str, str]:
+    """Drop the items whose value equals the default."""
+    return {key: value for key, value in values.items() if defaults.get(key) != value}
+
+
+def _comparable(
+    container: Container,
+    working_dir: str = '',
+    image_defaults: Optional['ImageDefaults'] = None,
+    home_mounts: frozenset = frozenset()
+) -> Dict[str, Any]:
+    """Reduce a container to the fields drift is measured on.
+    
+    Relative bind sources are resolved against ``working_dir``, if given;
+    the sources of bind mounts at ``home_mounts`` are left out. Environment
+    variables and labels equal to ``image_defaults`` are left out.
+    """
+    if isinstance(container, ContainerInfo):
+        container = container.to_dict()
+    
+    volumes = {}
+    for volume in container['volumes']:
+        entry = {'type': volume.get('type', ''), 'rw': volume.get('rw', True)}
+        if entry['type'] == 'bind' and volume['destination'] not in home_mounts:
+            source = volume.get('source', '')
+            if working_dir and not source.startswith(('/', '~')):
+                source = posixpath.normpath(posixpath.join(working_dir, source))
+            entry['source'] = source
+        volumes[volume['destination']] = entry
+    
+    ports = {}
+    for port, bindings in (container['ports'] or {}).items():
+        # Ports the image EXPOSEs without publishing them have no bindings
+        if not bindings:
+            continue
+        ports[port] = sorted({
+            binding.get('HostPort', '') if binding.get('HostIp', '') in _ANY_ADDRESSES
+            else f"{binding['HostIp']}:{binding.get('HostPort', '')}"
+            for binding in bindings or ()
+        })
+    
+    environment = container['environment']
+    labels = container['labels']
+    if image_defaults is not None:
+        environment = _without(environment, image_defaults['env'])
+        labels = _without(labels, image_defaults['labels'])
+    
+    return {
+        'image': container['image'],
+        'environment': environment,
+        'labels': {
+            key: value for key, value in labels.items()
+            if not key.startswith(COMPOSE_LABEL_PREFIX)
+        },
+        'volumes': volumes,
+        'ports': ports,
+        'networks': {name: {} for name in container['networks']}
+    }
+
+
+def _fingerprint(comparable: Dict[str, Any]) -> str:
+    # Fast rather than canonical: a key that differs only by key order
+    # costs one recomputation, never a wrong result
+    return hashlib.sha256(dumps_json(comparable)).hexdigest()
+
+
+def _drift(
+    host: str,
+    name: str,
+    expected: Dict[str, Any],
+    actual: Dict[str, Any],
+    runtime_only: Iterable[str] = DEFAULT_RUNTIME_ONLY
+) -> List[Change]:
+    return [
+        Change(host, name, kind, path, old, new)
+        for kind, path, old, new in diff_values((), expected, actual, None)
+        if kind != 'added' or not any(
+            fnmatchcase('/'.join(path), pattern) for pattern in runtime_only
+        )
+    ]
+
+
+def drift_container(
+    running: Container,
+    baseline: ContainerInfo,
+    host: str = '',
+    image_defaults: Optional['ImageDefaults'] = None,
+    runtime_only: Iterable[str] = DEFAULT_RUNTIME_ONLY
+) -> List[Change]:
+    """Compare a running container with its baseline.
+    
+    Args:
+        running: Running container (ContainerInfo or its ``to_dict()`` form)
+        baseline: Expected container from ``BaselineLoader``
+        host: Host name recorded on the changes
+        image_defaults: Defaults of the running container's image (see
+            ``image_cache.parse_image_config()``), left out on both sides
+        runtime_only: Path patterns, e.g. ``'environment/LC_*'``, of
+            settings not reported when only the running container has them
+    
+    Returns:
+        Change records ordered by field path: ``added`` for settings only
+        present at runtime, ``removed`` for expected settings that are
+        missing, ``changed`` for different values
+    """
+    name = running.name if isinstance(running, ContainerInfo) else running['name']
+    home_mounts = _home_mounts(baseline)
+    expected = _comparable(baseline, _working_dir(running), image_defaults, home_mounts)
+    actual = _comparable(running, '', image_defaults, home_mounts)
+    return _drift(host, name, expected, actual, runtime_only)
+
+
+class DriftEngine:
+    """Compute drift for matched pairs, reusing results of unchanged pairs.
+    
+    Attributes:
+        reused: Pairs whose stored result was reused in the last run
+        computed: Pairs compared in the last run
+    """
+    
+    def __init__(
+        self,
+        cache_path: Optional[Union[str, Path]] = None,
+        image_cache: Optional['ImageConfigCache'] = None,
+        runtime_only: Optional[Iterable[str]] = None
+    ) -> None:
+        """Initialize the engine.
+        
+        Args:
+            cache_path: JSON file keeping results between runs (None keeps
+                them in memory only)
+            image_cache: Image defaults to leave out of both sides; pass
+                the cache the scan used to subtract them
+            runtime_only: Path patterns of settings not reported when only
+                the running container has them (defaults to
+                ``DEFAULT_RUNTIME_ONLY``)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.image_cache = image_cache
+        self.runtime_only = sorted(
+            DEFAULT_RUNTIME_ONLY if runtime_only is None else runtime_only
+        )
+        self.reused = 0
+        self.computed = 0
+        self._results: Dict[str, List[list]] = self._load()
+    
+    def _load(self) -> Dict[str, List[list]]:
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = loads_json(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable drift cache {self.cache_path}: {e}")
+            return {}
+        
+        # Stored results were filtered with the patterns they were saved with
+        if (data.get('version') != DRIFT_CACHE_VERSION
+                or data.get('runtime_only') != self.runtime_only):
+            return {}
+        return data.get('results', {})
+    
+    def run(self, index: FleetIndex) -> Iterator[Change]:
+        """Yield the drift of every matched service.
+        
+        Results are stored for the next run once the generator is
+        exhausted; only pairs seen in this run are kept.
+        
+        Args:
+            index: Fleet index of the current scan and baselines
+        
+        Yields:
+            Change records, service by service in ``index.matches()`` order
+        """
+        self.reused = 0
+        self.computed = 0
+        results: Dict[str, List[list]] = {}
+        
+        for match in index.matches():
+            # Replicas of a service share a working directory and image
+            expected_by_key: Dict[tuple, tuple] = {}
+            home_mounts = _home_mounts(match.baseline)
+            for container in match.containers:
+                image_defaults = None
+                if self.image_cache is not None and _image_id(container):
+                    image_defaults = self.image_cache.get(_image_id(container))
+                group = (
+                    _working_dir(container),
+                    _image_id(container) if image_defaults is not None else ''
+                )
+                if group not in expected_by_key:
+                    expected = _comparable(
+                        match.baseline, group[0], image_defaults, home_mounts
+                    )
+                    expected_by_key[group] = (expected, _fingerprint(expected))
+                expected, baseline_key = expected_by_key[group]
+                actual = _comparable(container, '', image_defaults, home_mounts)
+                key = f"{_fingerprint(actual)}:{baseline_key}"
+                name = (container.name if isinstance(container, ContainerInfo)
+                        else container['name'])
+                
+                stored = self._results.get(key)
+                if stored is None:
+                    changes = _drift(
+                        match.host, name, expected, actual, self.runtime_only
+                    )
+                    stored = [
+                        [c.kind, list(c.path), c.old, c.new] for c in changes
+                    ]
+                    self.computed += 1
+                else:
+                    changes = [
+                        Change(match.host, name, kind, tuple(path), old, new)
+                        for kind, path, old, new in stored
+                    ]
+                    self.reused += 1
+                results[key] = stored
+                yield from changes
+        
+        self._results = results
+        self.save()
+        logger.info(
+            f"Drift computed for {self.computed} pair(s), "
+            f"reused for {self.reused}"
+        )
+    
+    def save(self) -> None:
+        """Write the stored results to ``cache_path``, if set."""
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.cache_path, dumps_json({
+            'version': DRIFT_CACHE_VERSION,
+            'runtime_only': self.runtime_only,
+            'results': self._results
+        }))
@@ -5,14 +5,24 @@ This script demonstrates how to use the docker_inspector module to
 connect to remote hosts and extract container configurations.
 """
 
-import json
 import logging
 from pathlib import Path
 
 from config import load_config
+from connection_pool import configure_default_pool
+from inspection_cache import InspectionCache
+from image_cache import ImageConfigCache
+from output import ResultWriter, output_path
+from snapshot_store import SnapshotStore
+from snapshot_diff import diff_runs
+from history_store import HistoryStore
+from baseline_loader import BaselineLoader
+from proxmox_proxy import inspect_proxmox_containers
 from docker_inspector import (
+    DEFAULT_FINGERPRINT_IGNORE,
     inspect_host,
     inspect_multiple_hosts,
+    iter_hosts,
     DockerInspector,
     SSHConnectionError,
     DockerConnectionError,
@@ -47,7 +57,7 @@ def example_single_host():
             if container['labels']:
                 print(f"    Labels: {len(container['labels'])} label(s)")
             print()
-        
+            
     except (SSHConnectionError, DockerConnectionError, ContainerInspectionError) as e:
         print(f"Error: {e}")
 
@@ -105,7 +115,7 @@ def example_context_manager():
                 print(f"  Volumes: {len(info.volumes)} volume(s)")
                 print(f"  Environment vars: {len(info.environment)}")
                 print()
-        
+                
     except (SSHConnectionError, DockerConnectionError, ContainerInspectionError) as e:
         print(f"Error: {e}")
 
@@ -119,34 +129,130 @@ def example_with_config():
         config = load_config()
         print(f"Configuration loaded: {config}\n")
         
-        # Inspect all configured hosts
-        results = inspect_multiple_hosts(
-            hosts=config.target_hosts,
-            username=config.ssh_username,
-            ssh_key_path=config.ssh_key_path,
-            ssh_timeout=config.ssh_timeout,
-            docker_timeout=config.docker_timeout
+        configure_default_pool(
+            max_size=config.ssh_pool_size,
+            idle_timeout=config.ssh_pool_idle_timeout,
+            max_lifetime=config.ssh_pool_max_lifetime
         )
         
-        # Save results to file
         output_dir = Path(config.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = output_path(
+            output_dir,
+            "container_inspection",
+            output_format=config.output_format,
+            compression=config.output_compression
+        )
+        
+        store = SnapshotStore(config.snapshot_dir) if config.snapshot_dir else None
+        snapshot = store.open_run() if store else None
+        history = HistoryStore(config.history_db) if config.history_db else None
+        changes = 0
+        
+        image_cache = None
+        if config.strip_image_defaults:
+            image_cache = ImageConfigCache(
+                Path(config.cache_dir) / "images" if config.cache_dir else None,
+                max_entries=config.image_cache_size
+            )
         
-        output_file = output_dir / "container_inspection.json"
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        def record(entries):
+            nonlocal changes
+            for entry in entries:
+                writer.write_host(entry)
+                if snapshot:
+                    snapshot.write_host(entry)
+                if history:
+                    changes += history.record_host(entry)
+        
+        # Write each host as soon as its scan finishes
+        with ResultWriter(
+            output_file,
+            output_format=config.output_format,
+            compression=config.output_compression,
+            pretty=config.output_pretty
+        ) as writer:
+            record(iter_hosts(
+                hosts=config.target_hosts,
+                username=config.ssh_username,
+                ssh_key_path=config.ssh_key_path,
+                ssh_timeout=config.ssh_timeout,
+                docker_timeout=config.docker_timeout,
+                max_workers=config.max_parallel_hosts,
+                host_timeout=config.host_timeout,
+                container_workers=config.container_workers,
+                container_timeout=config.container_timeout,
+                cache=InspectionCache(config.cache_dir) if config.cache_dir else None,
+                filters=config.container_filters or None,
+                collector=config.collector,
+                jump_host=config.jump_host,
+                image_cache=image_cache
+            ))
+            
+            # Scan Docker hosts behind the Proxmox node, if configured
+            if config.proxmox_ctids:
+                proxmox_results = inspect_proxmox_containers(
+                    proxmox_host=config.proxmox_host,
+                    username=config.ssh_username,
+                    ctids=config.proxmox_ctids,
+                    ssh_key_path=config.ssh_key_path,
+                    ssh_timeout=config.ssh_timeout,
+                    docker_timeout=config.docker_timeout,
+                    ct_timeout=config.host_timeout,
+                    filters=config.container_filters or None,
+                    jump_host=config.jump_host
+                )
+                record(proxmox_results['hosts'])
         
         print(f"Results saved to: {output_file}")
-        print(f"Total hosts inspected: {len(results['hosts'])}")
+        print(f"Total hosts inspected: {writer.hosts_written}")
+        print(f"Total containers found: {writer.containers_written}")
         
-        # Count total containers across all hosts
-        total_containers = sum(
-            host_data.get('container_count', 0)
-            for host_data in results['hosts']
-            if 'container_count' in host_data
-        )
-        print(f"Total containers found: {total_containers}")
+        if snapshot:
+            snapshot.close()
+            runs = store.runs()
+            if len(runs) > 1:
+                ignore = DEFAULT_FINGERPRINT_IGNORE | set(config.fingerprint_ignore)
+                drift = sum(1 for _ in diff_runs(store, runs[-2], runs[-1], ignore))
+                print(f"{drift} change(s) since snapshot {runs[-2]}")
+            if config.snapshot_keep:
+                store.prune(keep=config.snapshot_keep)
+            print(f"Snapshot {snapshot.run_id} stored "
+                  f"({snapshot.new_blobs} new container(s))")
+        if history:
+            history.close()
+            print(f"History updated with {changes} field change(s)")
+            
+    except ValueError as e:
+        print(f"Configuration error: {e}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def example_baselines():
+    """Example: Load expected containers from the homelab-apps repository."""
+    print("\n=== Example 5: Compose Baselines ===\n")
+    
+    try:
+        config = load_config()
+        if not config.homelab_apps_path:
+            print("Set HOMELAB_APPS_PATH to load compose baselines")
+            return
         
+        cache_dir = Path(config.cache_dir) / "baselines" if config.cache_dir else None
+        with BaselineLoader(
+            config.homelab_apps_path,
+            endpoint=config.endpoint,
+            cache_dir=cache_dir
+        ) as loader:
+            baselines = loader.load()
+        
+        for stack, containers in baselines.items():
+            print(f"{stack}: {', '.join(c.name for c in containers)}")
+        print(f"{loader.parsed} stack(s) parsed, {loader.cached} from cache")
+        for stack, error in loader.errors.items():
+            print(f"{stack} - FAILED: {error}")
+            
     except ValueError as e:
         print(f"Configuration error: {e}")
     except Exception as e:
@@ -171,6 +277,7 @@ def main():
     
     # This one requires a .env file:
     # example_with_config()
+    # example_baselines()
     
     print("\nNote: Uncomment examples in main() to run them.")
     print("Make sure you have:")
@@ -0,0 +1,190 @@
+"""One-shot container collection over an SSH exec channel.
+
+Instead of talking to the Docker API, this collector runs a single shell
+command on the target host that lists the containers with ``docker ps`` and
+inspects them all with one ``docker inspect`` call, gzip-compressing the
+output when ``gzip`` is available. On high-latency links the whole scan is a
+single round trip, and it works on hosts where only the docker CLI is
+reachable.
+"""
+
+import logging
+import shlex
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import paramiko
+
+from docker_inspector import (
+    ContainerInfo,
+    ContainerInspectionError,
+    DockerConnectionError,
+    loads_json,
+    parse_container_attrs,
+)
+
+
+logger = logging.getLogger(__name__)
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Read size for the exec channel's stdout
+_CHUNK_SIZE = 65536
+
+
+def build_collect_command(
+    all_containers: bool = False,
+    filters: Optional[Dict[str, Any]] = None,
+    compress: bool = True,
+    docker_command: str = 'docker'
+) -> str:
+    """Build the remote shell command for a one-shot collection.
+    
+    Args:
+        all_containers: If True, include stopped containers
+        filters: Docker-native filters, passed as ``--filter key=value``
+        compress: Pipe the output through ``gzip`` when the host has it
+        docker_command: Docker CLI invocation on the target host
+    
+    Returns:
+        POSIX shell command printing a JSON array of inspect payloads
+    """
+    ps_args = ['ps', '-q', '--no-trunc']
+    if all_containers:
+        ps_args.append('-a')
+    for key, values in (filters or {}).items():
+        if isinstance(values, (str, bool, int)):
+            values = [values]
+        for value in values:
+            ps_args += ['--filter', f"{key}={value}"]
+    
+    ps = ' '.join([docker_command] + [shlex.quote(arg) for arg in ps_args])
+    script = (
+        f"ids=$({ps}) && "
+        f"if [ -n \"$ids\" ]; then {docker_command} inspect $ids; "
+        f"else echo '[]'; fi"
+    )
+    
+    if not compress:
+        return script
+    
+    return (
+        "if command -v gzip >/dev/null 2>&1; then z='gzip -c'; else z=cat; fi; "
+        f"{{ {script}; }} | $z"
+    )
+
+
+def _read_stdout(channel: paramiko.Channel) -> bytes:
+    """Read an exec channel's stdout, gunzipping it if it is compressed."""
+    data = channel.recv(_CHUNK_SIZE)
+    # The magic bytes may straddle the first two reads
+    while data and len(data) < len(GZIP_MAGIC):
+        more = channel.recv(_CHUNK_SIZE)
+        if not more:
+            break
+        data += more
+    
+    chunks = []
+    if not data.startswith(GZIP_MAGIC):
+        while data:
+            chunks.append(data)
+            data = channel.recv(_CHUNK_SIZE)
+        return b''.join(chunks)
+    
+    # wbits=31: expect a gzip header and trailer
+    decompressor = zlib.decompressobj(wbits=31)
+    while data:
+        chunks.append(decompressor.decompress(data))
+        data = channel.recv(_CHUNK_SIZE)
+    chunks.append(decompressor.flush())
+    if not decompressor.eof:
+        raise ContainerInspectionError("Truncated gzip stream from collector")
+    
+    return b''.join(chunks)
+
+
+def collect_containers(
+    ssh_client: paramiko.SSHClient,
+    host: str,
+    all_containers: bool = False,
+    filters: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = 30,
+    compress: bool = True,
+    docker_command: str = 'docker'
+) -> Tuple[List[ContainerInfo], List[str]]:
+    """Collect all containers on a host with one remote command.
+    
+    Args:
+        ssh_client: Connected SSH client for the host
+        host: Target host, for messages
+        all_containers: If True, include stopped containers
+        filters: Docker-native filters, e.g.
+            ``{'label': ['com.docker.compose.project=media']}``
+        timeout: Channel read timeout in seconds
+        compress: Ask the host to gzip the output
+        docker_command: Docker CLI invocation on the target host, e.g.
+            ``pct exec 101 -- docker`` to reach a Proxmox container
+    
+    Returns:
+        Tuple of (ContainerInfo list in ``docker ps`` order, IDs of
+        payloads that could not be parsed)
+    
+    Raises:
+        DockerConnectionError: If the SSH session is not connected
+        ContainerInspectionError: If the command fails or prints no JSON
+    """
+    transport = ssh_client.get_transport() if ssh_client else None
+    if transport is None or not transport.is_active():
+        raise DockerConnectionError("SSH session not connected")
+    
+    command = build_collect_command(
+        all_containers=all_containers,
+        filters=filters,
+        compress=compress,
+        docker_command=docker_command
+    )
+    
+    try:
+        channel = transport.open_session(timeout=timeout)
+        try:
+            channel.settimeout(timeout)
+            channel.exec_command(command)
+            stdout = _read_stdout(channel)
+            stderr = channel.makefile_stderr('rb').read().decode(
+                errors='replace'
+            ).strip()
+            exit_status = channel.recv_exit_status()
+        finally:
+            channel.close()
+    except (paramiko.SSHException, OSError, zlib.error) as e:
+        raise ContainerInspectionError(
+            f"Exec collection failed on {host}: {e}"
+        )
+    
+    try:
+        payloads = loads_json(stdout)
+    except ValueError:
+        raise ContainerInspectionError(
+            f"Exec collection on {host} exited with status {exit_status}: "
+            f"{stderr or 'no JSON output'}"
+        )
+    
+    if exit_status != 0:
+        # docker inspect still prints the containers it found when some
+        # vanished between ps and inspect
+        logger.warning(
+            f"Collector on {host} exited with status {exit_status}: {stderr}"
+        )
+    
+    results = []
+    failed = []
+    for attrs in payloads:
+        try:
+            results.append(parse_container_attrs(attrs))
+        except ContainerInspectionError as e:
+            logger.warning(f"Skipping unparseable payload on {host}: {e}")
+            failed.append(attrs.get('Id', '?'))
+    
+    logger.info(f"Collected {len(results)} container(s) from {host} via exec")
+    
+    return results, failed
@@ -0,0 +1,238 @@
+"""Match running containers to their compose baselines.
+
+Compose labels every container it creates with its project and service
+(``com.docker.compose.project`` / ``com.docker.compose.service``), and
+``BaselineLoader`` puts the same labels on the containers it expects. The
+fleet index files both sides under ``(host, project, service)`` keys, so
+every running container finds its baseline with one hash lookup instead of a
+search by name. Whatever is left over on either side is reported:
+
+* ``missing``: baselines with no running container on a scanned host, e.g.
+  a stack that was removed by hand or a stale compose file in git (hosts
+  scanned with ``filters`` are left out: they only saw part of the host)
+* ``unexpected``: compose containers with no baseline, e.g. a stack deployed
+  from files that are not in the repository
+* ``unmanaged``: containers that were not started by compose at all
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from docker_inspector import ContainerInfo
+
+
+PROJECT_LABEL = 'com.docker.compose.project'
+SERVICE_LABEL = 'com.docker.compose.service'
+CONFIG_FILES_LABEL = 'com.docker.compose.project.config_files'
+
+# (host, project, service)
+ServiceKey = Tuple[str, str, str]
+Container = Union[ContainerInfo, Dict[str, Any]]
+
+
+def _labels(container: Container) -> Dict[str, str]:
+    if isinstance(container, ContainerInfo):
+        return container.labels
+    return container.get('labels') or {}
+
+
+def _name(container: Container) -> str:
+    if isinstance(container, ContainerInfo):
+        return container.name
+    return container.get('name', '')
+
+
+@dataclass(slots=True)
+class ServiceMatch:
+    """A compose service found on both sides.
+    
+    Attributes:
+        host: Host the service runs on
+        project: Compose project (stack) name
+        service: Compose service name
+        baseline: Expected container from the baseline
+        containers: Running containers of the service (several when scaled)
+    """
+    host: str
+    project: str
+    service: str
+    baseline: ContainerInfo
+    containers: List[Container] = field(default_factory=list)
+
+
+class FleetIndex:
+    """Index of running containers and baselines by compose service.
+    
+    Build one per scan: add every host entry with ``add_host()`` and the
+    baselines deployed to each host with ``add_baselines()``, then read the
+    matches and leftovers.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._running: Dict[ServiceKey, List[Container]] = {}
+        self._baselines: Dict[ServiceKey, ContainerInfo] = {}
+        self._config_files: Dict[Tuple[str, str], str] = {}
+        self._unmanaged: Dict[str, List[Container]] = {}
+        self._scanned: Set[str] = set()
+        self._filtered: Set[str] = set()
+    
+    @classmethod
+    def build(
+        cls,
+        results: Union[Dict[str, Any], Iterable[Dict[str, Any]]],
+        baselines: Dict[str, Dict[str, List[ContainerInfo]]]
+    ) -> 'FleetIndex':
+        """Build an index from a scan and per-host baselines.
+        
+        Args:
+            results: ``inspect_multiple_hosts()`` result, or an iterable of
+                host entries such as ``iter_hosts()``
+            baselines: Host to the ``BaselineLoader.load()`` result for the
+                endpoint deployed on that host
+        
+        Returns:
+            Populated FleetIndex
+        """
+        index = cls()
+        for entry in results['hosts'] if isinstance(results, dict) else results:
+            index.add_host(entry)
+        for host, stacks in baselines.items():
+            index.add_baselines(host, stacks)
+        return index
+    
+    def add_host(self, entry: Dict[str, Any]) -> None:
+        """Index the containers of one host entry.
+        
+        Hosts that failed to scan are skipped, so their baselines are not
+        reported as missing; neither are those of hosts scanned with
+        ``filters``.
+        
+        Args:
+            entry: Per-host result in the ``inspect_multiple_hosts()`` format
+        """
+        if 'error' in entry:
+            return
+        
+        host = entry['host']
+        self._scanned.add(host)
+        if entry.get('filters'):
+            self._filtered.add(host)
+        for container in entry.get('containers', ()):
+            self.add_container(host, container)
+    
+    def add_container(self, host: str, container: Container) -> None:
+        """Index one running container.
+        
+        Args:
+            host: Host the container runs on
+            container: ContainerInfo or its ``to_dict()`` form
+        """
+        self._scanned.add(host)
+        labels = _labels(container)
+        project = labels.get(PROJECT_LABEL)
+        service = labels.get(SERVICE_LABEL)
+        if not project or not service:
+            self._unmanaged.setdefault(host, []).append(container)
+            return
+        
+        self._running.setdefault((host, project, service), []).append(container)
+        if CONFIG_FILES_LABEL in labels:
+            self._config_files[(host, project)] = labels[CONFIG_FILES_LABEL]
+    
+    def add_baselines(
+        self,
+        host: str,
+        baselines: Union[Dict[str, List[ContainerInfo]], Iterable[ContainerInfo]]
+    ) -> None:
+        """Index the baselines expected on a host.
+        
+        Args:
+            host: Host the baselines are deployed to
+            baselines: ``BaselineLoader.load()`` result, or expected
+                containers carrying compose labels
+        """
+        if isinstance(baselines, dict):
+            baselines = (c for containers in baselines.values() for c in containers)
+        for baseline in baselines:
+            labels = baseline.labels
+            key = (host, labels[PROJECT_LABEL], labels[SERVICE_LABEL])
+            self._baselines[key] = baseline
+    
+    def containers(self, host: str, project: str, service: str) -> List[Container]:
+        """Return the running containers of a service (empty if none)."""
+        return self._running.get((host, project, service), [])
+    
+    def baseline(self, host: str, project: str, service: str) -> Optional[ContainerInfo]:
+        """Return the baseline of a service, or None if it has none."""
+        return self._baselines.get((host, project, service))
+    
+    def baseline_for(self, host: str, container: Container) -> Optional[ContainerInfo]:
+        """Return the baseline a running container should match.
+        
+        Args:
+            host: Host the container runs on
+            container: ContainerInfo or its ``to_dict()`` form
+        
+        Returns:
+            The baseline, or None for unexpected and unmanaged containers
+        """
+        labels = _labels(container)
+        return self._baselines.get(
+            (host, labels.get(PROJECT_LABEL), labels.get(SERVICE_LABEL))
+        )
+    
+    def config_files(self, host: str, project: str) -> Optional[str]:
+        """Return the compose files a running project was deployed from.
+        
+        Returns:
+            Value of the ``com.docker.compose.project.config_files`` label,
+            or None if no container of the project carries it
+        """
+        return self._config_files.get((host, project))
+    
+    def matches(self) -> Iterator[ServiceMatch]:
+        """Yield the services that have both a baseline and containers."""
+        for key in sorted(self._baselines.keys() & self._running.keys()):
+            yield ServiceMatch(*key, self._baselines[key], self._running[key])
+    
+    def missing(self) -> List[ServiceKey]:
+        """Return baselines with no running container on a scanned host."""
+        return sorted(
+            key for key in self._baselines.keys() - self._running.keys()
+            if key[0] in self._scanned and key[0] not in self._filtered
+        )
+    
+    def unexpected(self) -> List[ServiceKey]:
+        """Return running compose services that have no baseline."""
+        return sorted(self._running.keys() - self._baselines.keys())
+    
+    def unmanaged(self) -> Dict[str, List[Container]]:
+        """Return containers not created by compose, by host."""
+        return self._unmanaged
+    
+    def report(self) -> Dict[str, Any]:
+        """Summarize the matching as a JSON-serializable dictionary.
+        
+        Returns:
+            Dictionary with the number of ``matched`` services and lists of
+            ``missing``, ``unexpected`` and ``unmanaged`` entries
+        """
+        def service(key: ServiceKey) -> Dict[str, Any]:
+            host, project, name = key
+            entry = {'host': host, 'project': project, 'service': name}
+            config_files = self._config_files.get((host, project))
+            if config_files:
+                entry['config_files'] = config_files
+            return entry
+        
+        return {
+            'matched': len(self._baselines.keys() & self._running.keys()),
+            'missing': [service(key) for key in self.missing()],
+            'unexpected': [service(key) for key in self.unexpected()],
+            'unmanaged': [
+                {'host': host, 'name': _name(container)}
+                for host in sorted(self._unmanaged)
+                for container in self._unmanaged[host]
+            ]
+        }
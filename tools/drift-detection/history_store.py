@@ -0,0 +1,335 @@
+"""SQLite index of container field changes over time.
+
+Each recorded scan is compared with the last known state of its hosts, and
+only the fields that changed are written, one row per field, keyed by
+host, container name, field path and scan time. Questions such as "when
+did PLEX_CLAIM change on ct-media-01" or "what did this container look like
+last Tuesday" are then answered from an index instead of by re-reading
+archived scan files.
+
+Containers are stored as flattened fields, two levels deep: top-level
+fields such as ``image`` are one path each, and the keys of the dictionary
+fields (``labels``, ``environment``, ``networks``, ``ports``) get a path
+each, e.g. ``environment/PLEX_CLAIM`` or ``ports/32400/tcp``. Deeper values
+and lists (such as ``volumes``) are stored whole. A removed field or
+container is recorded as a NULL value.
+
+The SHA-256 of each container's canonical JSON is kept alongside its current
+fields, so a rescan only flattens and compares the containers whose hash
+changed.
+
+Hosts that failed to scan, or are missing from a scan, keep their previous
+state: their containers are not marked as removed. Neither are containers
+missing from a filtered scan (a host entry with ``filters``), which only
+saw part of the host.
+"""
+
+import hashlib
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from docker_inspector import canonical_json, loads_json
+
+
+logger = logging.getLogger(__name__)
+
+HISTORY_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS changes (
+    id INTEGER PRIMARY KEY,
+    host TEXT NOT NULL,
+    container TEXT NOT NULL,
+    path TEXT NOT NULL,
+    scanned_at TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS changes_field
+    ON changes (host, container, path, scanned_at);
+CREATE INDEX IF NOT EXISTS changes_time ON changes (scanned_at);
+CREATE TABLE IF NOT EXISTS current (
+    host TEXT NOT NULL,
+    container TEXT NOT NULL,
+    path TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (host, container, path)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS digests (
+    host TEXT NOT NULL,
+    container TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (host, container)
+) WITHOUT ROWID;
+"""
+
+# Dictionary fields whose keys are tracked individually
+_KEYED_FIELDS = frozenset({'labels', 'environment', 'networks', 'ports'})
+
+
+def flatten_container(container: Dict[str, Any]) -> Dict[str, str]:
+    """Flatten a container into ``{path: canonical JSON value}``.
+    
+    Args:
+        container: Container in the ``ContainerInfo.to_dict()`` format
+    
+    Returns:
+        Field paths mapped to their JSON-encoded values
+    """
+    fields = {}
+    for key, value in container.items():
+        if key in _KEYED_FIELDS and isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                fields[f"{key}/{sub_key}"] = canonical_json(sub_value).decode()
+        else:
+            fields[key] = canonical_json(value).decode()
+    return fields
+
+
+def unflatten_container(fields: Dict[str, str]) -> Dict[str, Any]:
+    """Rebuild a container dictionary from ``flatten_container()`` output."""
+    container: Dict[str, Any] = {key: {} for key in _KEYED_FIELDS}
+    for path, value in fields.items():
+        key, _, sub_key = path.partition('/')
+        if sub_key and key in _KEYED_FIELDS:
+            container[key][sub_key] = loads_json(value)
+        else:
+            container[key] = loads_json(value)
+    return container
+
+
+class HistoryStore:
+    """Field-level change history of every scanned container.
+    
+    A store holds one SQLite connection and must only be used from the
+    thread that created it.
+    """
+    
+    def __init__(self, db_path: Union[str, Path]) -> None:
+        """Open (and if needed create) the history database.
+        
+        Args:
+            db_path: SQLite database file, or ``':memory:'``
+        """
+        self.db_path = str(db_path)
+        if self.db_path != ':memory:':
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f'PRAGMA user_version={HISTORY_SCHEMA_VERSION}')
+    
+    def _current_fields(self, host: str, container: str) -> Dict[str, str]:
+        return dict(self._conn.execute(
+            'SELECT path, value FROM current WHERE host = ? AND container = ?',
+            (host, container)
+        ))
+    
+    def record_host(
+        self,
+        entry: Dict[str, Any],
+        timestamp: Optional[str] = None
+    ) -> int:
+        """Record one host entry in the ``inspect_multiple_hosts()`` format.
+        
+        Hosts must be recorded in chronological order.
+        
+        Args:
+            entry: Per-host result dictionary
+            timestamp: Scan time (defaults to the entry's ``timestamp``, then
+                now)
+        
+        Returns:
+            Number of field changes written
+        """
+        if 'error' in entry:
+            return 0
+        
+        host = entry['host']
+        scanned_at = timestamp or entry.get('timestamp') or datetime.utcnow().isoformat()
+        previous = dict(self._conn.execute(
+            'SELECT container, digest FROM digests WHERE host = ?', (host,)
+        ))
+        
+        rows: List[Tuple[str, str, str, str, Optional[str]]] = []
+        digests: List[Tuple[str, str, str]] = []
+        seen = set()
+        for container in entry.get('containers', ()):
+            name = container['name']
+            seen.add(name)
+            digest = hashlib.sha256(canonical_json(container)).hexdigest()
+            if previous.get(name) == digest:
+                continue
+            digests.append((host, name, digest))
+            
+            old_fields = self._current_fields(host, name) if name in previous else {}
+            new_fields = flatten_container(container)
+            for path, value in new_fields.items():
+                if old_fields.get(path) != value:
+                    rows.append((host, name, path, scanned_at, value))
+            for path in old_fields.keys() - new_fields.keys():
+                rows.append((host, name, path, scanned_at, None))
+        
+        # A filtered scan says nothing about containers outside the filter
+        removed = set() if entry.get('filters') else previous.keys() - seen
+        for name in removed:
+            for path in self._current_fields(host, name):
+                rows.append((host, name, path, scanned_at, None))
+        
+        if not rows:
+            return 0
+        
+        with self._conn:
+            self._conn.executemany(
+                'INSERT INTO changes (host, container, path, scanned_at, value) '
+                'VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+            self._conn.executemany(
+                'DELETE FROM current WHERE host = ? AND container = ? AND path = ?',
+                [(h, c, p) for h, c, p, _, v in rows if v is None]
+            )
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO current (host, container, path, value) '
+                'VALUES (?, ?, ?, ?)',
+                [(h, c, p, v) for h, c, p, _, v in rows if v is not None]
+            )
+            self._conn.executemany(
+                'DELETE FROM digests WHERE host = ? AND container = ?',
+                [(host, name) for name in removed]
+            )
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO digests (host, container, digest) '
+                'VALUES (?, ?, ?)',
+                digests
+            )
+        
+        logger.debug(f"Recorded {len(rows)} field change(s) for {host} at {scanned_at}")
+        return len(rows)
+    
+    def record(
+        self,
+        results: Union[Dict[str, Any], Iterable[Dict[str, Any]]],
+        timestamp: Optional[str] = None
+    ) -> int:
+        """Record a multi-host scan.
+        
+        Args:
+            results: ``inspect_multiple_hosts()`` result, or an iterable of
+                host entries such as ``iter_hosts()``
+            timestamp: Scan time applied to every host (defaults to each
+                entry's own ``timestamp``)
+        
+        Returns:
+            Number of field changes written
+        """
+        entries = results['hosts'] if isinstance(results, dict) else results
+        return sum(self.record_host(entry, timestamp) for entry in entries)
+    
+    def field_history(
+        self,
+        host: str,
+        container: str,
+        path: str
+    ) -> List[Tuple[str, Any]]:
+        """Return every value a field has had.
+        
+        Args:
+            host: Host name
+            container: Container name
+            path: Field path, e.g. ``environment/PLEX_CLAIM``
+        
+        Returns:
+            List of (scan time, value) tuples, oldest first; the value is
+            None when the field or container was removed
+        """
+        rows = self._conn.execute(
+            'SELECT scanned_at, value FROM changes '
+            'WHERE host = ? AND container = ? AND path = ? ORDER BY id',
+            (host, container, path)
+        )
+        return [
+            (scanned_at, None if value is None else loads_json(value))
+            for scanned_at, value in rows
+        ]
+    
+    def changes(
+        self,
+        since: str,
+        until: Optional[str] = None,
+        host: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Return the field changes recorded in a time range.
+        
+        Args:
+            since: Earliest scan time (inclusive)
+            until: Latest scan time (inclusive; defaults to no limit)
+            host: Only return changes of this host
+        
+        Returns:
+            Change dictionaries with ``host``, ``container``, ``path``,
+            ``scanned_at`` and ``value`` keys, oldest first
+        """
+        query = ('SELECT host, container, path, scanned_at, value FROM changes '
+                 'WHERE scanned_at >= ?')
+        params: List[Any] = [since]
+        if until is not None:
+            query += ' AND scanned_at <= ?'
+            params.append(until)
+        if host is not None:
+            query += ' AND host = ?'
+            params.append(host)
+        
+        return [
+            {
+                'host': row[0],
+                'container': row[1],
+                'path': row[2],
+                'scanned_at': row[3],
+                'value': None if row[4] is None else loads_json(row[4])
+            }
+            for row in self._conn.execute(query + ' ORDER BY id', params)
+        ]
+    
+    def container_at(
+        self,
+        host: str,
+        container: str,
+        timestamp: str
+    ) -> Optional[Dict[str, Any]]:
+        """Rebuild a container's configuration as of a point in time.
+        
+        Args:
+            host: Host name
+            container: Container name
+            timestamp: ISO timestamp; the last scan at or before it is used
+        
+        Returns:
+            Container in the ``ContainerInfo.to_dict()`` format, or None if
+            the container did not exist at that time
+        """
+        # SQLite returns the bare columns of the row holding MAX(id)
+        rows = self._conn.execute(
+            'SELECT path, value, MAX(id) FROM changes '
+            'WHERE host = ? AND container = ? AND scanned_at <= ? GROUP BY path',
+            (host, container, timestamp)
+        )
+        fields = {path: value for path, value, _ in rows if value is not None}
+        return unflatten_container(fields) if fields else None
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+    
+    def __enter__(self) -> 'HistoryStore':
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
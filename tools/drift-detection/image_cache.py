@@ -0,0 +1,176 @@
+"""Cross-host cache of image configurations.
+
+A container's ``Config.Env`` and ``Config.Labels`` hold everything baked into
+its image (``PATH``, ``LANG``, s6-overlay settings, OCI labels) next to what
+the container was actually given. Subtracting the image's own defaults
+leaves only the settings a deployment is responsible for, which is what a
+drift report should show.
+
+Image IDs are content hashes, so an image's configuration never changes and
+cached entries never go stale. One cache serves every host: an image pulled
+on ten hosts is inspected once. Entries are kept in memory and, with a
+``cache_dir``, in one small JSON file per image; the least recently used
+entries are evicted beyond ``max_entries``.
+"""
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from docker_inspector import loads_json
+from output import dumps_json
+from utils import write_atomic
+
+
+logger = logging.getLogger(__name__)
+
+# {'env': {name: value}, 'labels': {name: value}}
+ImageDefaults = Dict[str, Dict[str, str]]
+
+
+def parse_image_config(attrs: Dict[str, Any]) -> ImageDefaults:
+    """Extract the default environment and labels of an image.
+    
+    Args:
+        attrs: Decoded ``GET /images/{id}/json`` response
+    
+    Returns:
+        Dictionary with ``env`` and ``labels`` mappings
+    """
+    config = attrs.get('Config') or {}
+    env = {}
+    for env_var in config.get('Env') or ():
+        key, sep, value = env_var.partition('=')
+        if sep:
+            env[key] = value
+    return {'env': env, 'labels': dict(config.get('Labels') or {})}
+
+
+class ImageConfigCache:
+    """LRU cache of image defaults keyed by image ID.
+    
+    A cache instance can be shared by threads scanning different hosts.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_entries: int = 1024
+    ) -> None:
+        """Initialize the image cache.
+        
+        Args:
+            cache_dir: Directory holding one file per image (None keeps
+                entries in memory only)
+            max_entries: Images kept in memory and on disk
+        
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, ImageDefaults]' = OrderedDict()
+        self._lock = threading.Lock()
+        # Number of files in cache_dir, counted on first write
+        self._file_count: Optional[int] = None
+    
+    def _path(self, image_id: str) -> Path:
+        return self.cache_dir / f"{re.sub(r'[^A-Za-z0-9._-]', '_', image_id)}.json"
+    
+    def _remember(self, image_id: str, defaults: ImageDefaults) -> None:
+        with self._lock:
+            self._entries[image_id] = defaults
+            self._entries.move_to_end(image_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def get(self, image_id: str) -> Optional[ImageDefaults]:
+        """Return the defaults of an image, or None if it is not cached.
+        
+        Args:
+            image_id: Image ID, e.g. ``sha256:3f57d9401f8d...``
+        """
+        with self._lock:
+            defaults = self._entries.get(image_id)
+            if defaults is not None:
+                self._entries.move_to_end(image_id)
+                return defaults
+        
+        if self.cache_dir is None:
+            return None
+        
+        path = self._path(image_id)
+        try:
+            with open(path, 'rb') as f:
+                defaults = loads_json(f.read())
+            # The file's mtime orders disk eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable image cache file {path}: {e}")
+            return None
+        
+        self._remember(image_id, defaults)
+        return defaults
+    
+    def missing(self, image_ids: Iterable[str]) -> List[str]:
+        """Return the distinct image IDs that are not cached, in input order."""
+        return [
+            image_id for image_id in dict.fromkeys(image_ids)
+            if image_id and self.get(image_id) is None
+        ]
+    
+    def put(self, image_id: str, defaults: ImageDefaults) -> None:
+        """Store the defaults of an image.
+        
+        Args:
+            image_id: Image ID
+            defaults: ``parse_image_config()`` result
+        """
+        self._remember(image_id, defaults)
+        if self.cache_dir is None:
+            return
+        
+        path = self._path(image_id)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            is_new = not path.exists()
+            write_atomic(path, dumps_json(defaults))
+        except OSError as e:
+            logger.warning(f"Failed to write image cache file {path}: {e}")
+            return
+        
+        with self._lock:
+            if self._file_count is None:
+                self._file_count = sum(1 for _ in self.cache_dir.glob('*.json'))
+            elif is_new:
+                self._file_count += 1
+            if self._file_count > self.max_entries:
+                self._evict_files()
+    
+    def _evict_files(self) -> None:
+        """Delete the least recently used files beyond ``max_entries``."""
+        files = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        files.sort()
+        
+        excess = len(files) - self.max_entries
+        for _, path in files[:max(excess, 0)]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._file_count = min(len(files), self.max_entries)
+        logger.debug(f"Evicted {max(excess, 0)} image(s) from {self.cache_dir}")
@@ -0,0 +1,170 @@
+"""Persistent inspection cache for incremental host scans.
+
+Most containers do not change between scheduled scans. The cache keeps the
+last ``ContainerInfo`` for every container on a host, keyed by a cheap
+fingerprint taken from the ``/containers/json`` listing, so a scan only
+issues full inspects for containers that are new or have changed. A
+container cached with its image defaults subtracted only serves scans that
+subtract them too, and the other way round.
+"""
+
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from docker_inspector import ContainerInfo, loads_json
+from utils import write_atomic
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 2
+
+
+def list_entry_fingerprint(entry: Dict[str, Any]) -> str:
+    """Build the cache fingerprint for a ``/containers/json`` entry.
+    
+    Recreating a container changes its ID and creation time, a state change
+    (start, stop, pause) changes ``State``, a re-pulled image changes
+    ``ImageID``, ``docker rename`` changes ``Names`` and ``docker network
+    connect/disconnect`` changes the attached network IDs. A plain restart
+    keeps the fingerprint, so the cached ``started`` timestamp can lag
+    behind in that case.
+    
+    Args:
+        entry: One item of the container listing
+    
+    Returns:
+        Fingerprint string
+    """
+    networks = (entry.get('NetworkSettings') or {}).get('Networks') or {}
+    return '|'.join([
+        *(str(entry.get(key, '')) for key in ('Id', 'Created', 'State', 'ImageID')),
+        ','.join(entry.get('Names') or ()),
+        ','.join(sorted(n.get('NetworkID', '') for n in networks.values())),
+    ])
+
+
+class InspectionCache:
+    """Per-host on-disk cache of ContainerInfo keyed by list fingerprint.
+    
+    Each host is stored in its own JSON file under ``cache_dir``. A cache
+    instance can be shared by threads scanning different hosts.
+    """
+    
+    def __init__(self, cache_dir: str) -> None:
+        """Initialize inspection cache.
+        
+        Args:
+            cache_dir: Directory holding one cache file per host
+        """
+        self.cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+    
+    def _path(self, host: str) -> Path:
+        safe_host = re.sub(r'[^A-Za-z0-9._-]', '_', host)
+        return self.cache_dir / f"{safe_host}.json"
+    
+    def load(self, host: str) -> Dict[str, Dict[str, Any]]:
+        """Load cached entries for a host.
+        
+        Args:
+            host: Target host
+        
+        Returns:
+            Mapping of container ID to ``{'fingerprint', 'info'}`` entries;
+            empty if there is no usable cache file
+        """
+        path = self._path(host)
+        try:
+            with open(path, 'rb') as f:
+                data = loads_json(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+            return {}
+        
+        if data.get('version') != CACHE_FORMAT_VERSION:
+            return {}
+        
+        return data.get('containers', {})
+    
+    def lookup(
+        self,
+        host: str,
+        entries: List[Dict[str, Any]],
+        strip_image_defaults: bool = False
+    ) -> Tuple[Dict[str, ContainerInfo], List[str]]:
+        """Split listed containers into cache hits and misses.
+        
+        Args:
+            host: Target host
+            entries: Items of the host's ``/containers/json`` listing
+            strip_image_defaults: Whether the scan subtracts image defaults;
+                containers cached in the other form are misses
+        
+        Returns:
+            Tuple of (container ID to cached ContainerInfo, IDs that need a
+            full inspect)
+        """
+        cached = self.load(host)
+        
+        hits = {}
+        misses = []
+        
+        for entry in entries:
+            container_id = entry['Id']
+            cached_entry = cached.get(container_id)
+            if (cached_entry and cached_entry.get('fingerprint')
+                    == list_entry_fingerprint(entry)
+                    and cached_entry['info'].get('defaults_stripped', False)
+                    == strip_image_defaults):
+                hits[container_id] = ContainerInfo.from_dict(cached_entry['info'])
+            else:
+                misses.append(container_id)
+        
+        return hits, misses
+    
+    def update(
+        self,
+        host: str,
+        entries: List[Dict[str, Any]],
+        containers: List[ContainerInfo],
+        prune: bool = True
+    ) -> None:
+        """Store the containers from the latest scan of a host.
+        
+        With ``prune``, containers that are no longer listed are dropped;
+        pass ``prune=False`` after a filtered scan that only saw part of the
+        host. The file is written atomically so an interrupted scan never
+        leaves a corrupt cache.
+        
+        Args:
+            host: Target host
+            entries: Items of the host's ``/containers/json`` listing
+            containers: Inspected containers (cached and fresh)
+            prune: Drop cached containers missing from ``entries``
+        """
+        fingerprints = {
+            entry['Id']: list_entry_fingerprint(entry) for entry in entries
+        }
+        
+        path = self._path(host)
+        with self._lock:
+            cached = {} if prune else self.load(host)
+            cached.update(
+                (info.container_id, {
+                    'fingerprint': fingerprints[info.container_id],
+                    'info': info.to_dict()
+                })
+                for info in containers
+                if info.container_id in fingerprints
+            )
+            data = {'version': CACHE_FORMAT_VERSION, 'containers': cached}
+            
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, json.dumps(data).encode())
@@ -0,0 +1,344 @@
+"""Incremental writers for scan results.
+
+``inspect_multiple_hosts()`` returns one dictionary holding every host's
+containers. The writers here take host entries one at a time (e.g. straight
+from ``iter_hosts()``), serialize them and write them out, so a fleet scan
+never needs the whole snapshot in memory. Three formats are supported:
+
+* ``ndjson``: one compact JSON record per line. Each host contributes a
+  ``host`` record followed by one ``container`` record per container.
+* ``json``: the ``inspect_multiple_hosts()`` document, compact by default or
+  indented with ``pretty=True``.
+* ``yaml``: a multi-document YAML stream with one document per host, emitted
+  with libyaml's ``CSafeDumper`` when PyYAML was built with it.
+
+Output can be compressed with gzip or, when the ``zstandard`` package is
+installed, zstd.
+"""
+
+import gzip
+import io
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+from docker_inspector import loads_json
+
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ('json', 'ndjson', 'yaml')
+COMPRESSIONS = ('none', 'gzip', 'zstd')
+
+_SUFFIXES = {'json': '.json', 'ndjson': '.ndjson', 'yaml': '.yaml'}
+_COMPRESSION_SUFFIXES = {'none': '', 'gzip': '.gz', 'zstd': '.zst'}
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Encode a value as compact JSON, using orjson when it is installed.
+    
+    Args:
+        obj: JSON-serializable value
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def yaml_dumper() -> type:
+    """Return the fastest safe YAML dumper available.
+    
+    The dumper never emits anchors and aliases: containers on one host often
+    share identical sub-structures, and aliases would make the output harder
+    to read and diff.
+    
+    Returns:
+        Subclass of ``yaml.CSafeDumper``, or ``yaml.SafeDumper`` when libyaml
+        is not available
+    
+    Raises:
+        ValueError: If PyYAML is not installed
+    """
+    if yaml is None:
+        raise ValueError("Install the PyYAML package to write YAML output")
+    
+    base = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    return type('NoAliasDumper', (base,), {'ignore_aliases': lambda self, data: True})
+
+
+def output_path(
+    output_dir: Union[str, Path],
+    name: str,
+    output_format: str = 'ndjson',
+    compression: str = 'none'
+) -> Path:
+    """Build the output file path for a format and compression.
+    
+    Args:
+        output_dir: Directory for output files
+        name: File name without suffixes
+        output_format: One of ``OUTPUT_FORMATS``
+        compression: One of ``COMPRESSIONS``
+    
+    Returns:
+        Path such as ``<output_dir>/<name>.ndjson.gz``
+    """
+    return Path(output_dir) / (
+        f"{name}{_SUFFIXES[output_format]}{_COMPRESSION_SUFFIXES[compression]}"
+    )
+
+
+def open_compressed(path: Union[str, Path], compression: str = 'none') -> IO[bytes]:
+    """Open a file for binary writing with optional compression.
+    
+    Args:
+        path: File to create
+        compression: One of ``COMPRESSIONS``
+    
+    Returns:
+        Writable binary file object
+    
+    Raises:
+        ValueError: If the compression is unknown or unavailable
+    """
+    if compression == 'none':
+        return open(path, 'wb')
+    if compression == 'gzip':
+        return gzip.open(path, 'wb', compresslevel=6)
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ValueError("Install the zstandard package to use zstd compression")
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, 'wb'))
+    raise ValueError(
+        f"Unknown compression {compression!r}; expected one of {COMPRESSIONS}"
+    )
+
+
+def open_decompressed(path: Union[str, Path]) -> IO[bytes]:
+    """Open a file written by ``open_compressed()`` for binary reading.
+    
+    The compression is detected from the file's magic bytes.
+    
+    Raises:
+        ValueError: If the file is zstd-compressed and zstandard is missing
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+    
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(path, 'rb')
+    if magic == ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError("Install the zstandard package to read zstd files")
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'))
+        )
+    return open(path, 'rb')
+
+
+class ResultWriter:
+    """Write host entries to a file as they arrive.
+    
+    Use as a context manager, or call ``close()`` when done; the document is
+    only complete once the writer is closed.
+    
+    Attributes:
+        hosts_written: Number of host entries written
+        containers_written: Number of containers written
+    """
+    
+    def __init__(
+        self,
+        path: Union[str, Path],
+        output_format: str = 'ndjson',
+        compression: str = 'none',
+        pretty: bool = False,
+        timestamp: Optional[str] = None
+    ) -> None:
+        """Create the output file.
+        
+        Args:
+            path: File to write
+            output_format: One of ``OUTPUT_FORMATS``
+            compression: One of ``COMPRESSIONS``
+            pretty: Indent the ``json`` document (other formats ignore it)
+            timestamp: Scan timestamp for the ``json`` document (defaults to
+                now)
+        
+        Raises:
+            ValueError: If the format or compression is not supported
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unknown output format {output_format!r}; "
+                f"expected one of {OUTPUT_FORMATS}"
+            )
+        
+        self.path = Path(path)
+        self.output_format = output_format
+        self.pretty = pretty
+        self.hosts_written = 0
+        self.containers_written = 0
+        self._dumper = yaml_dumper() if output_format == 'yaml' else None
+        
+        self._file = open_compressed(self.path, compression)
+        
+        if output_format == 'json':
+            timestamp = json.dumps(timestamp or datetime.utcnow().isoformat())
+            if pretty:
+                self._file.write(
+                    f'{{\n  "timestamp": {timestamp},\n  "hosts": ['.encode()
+                )
+            else:
+                self._file.write(f'{{"timestamp":{timestamp},"hosts":['.encode())
+    
+    def _encode_ndjson(self, entry: Dict[str, Any]) -> bytes:
+        host = entry['host']
+        header = {'type': 'host'}
+        header.update(
+            (key, value) for key, value in entry.items() if key != 'containers'
+        )
+        
+        lines = [dumps_json(header)]
+        for container in entry.get('containers', ()):
+            record = {'type': 'container', 'host': host}
+            record.update(container)
+            lines.append(dumps_json(record))
+        lines.append(b'')
+        return b'\n'.join(lines)
+    
+    def _encode_json(self, entry: Dict[str, Any]) -> bytes:
+        separator = b',' if self.hosts_written else b''
+        if not self.pretty:
+            return separator + dumps_json(entry)
+        
+        body = json.dumps(entry, indent=2, ensure_ascii=False)
+        return separator + b'\n' + '\n'.join(
+            f"    {line}" for line in body.splitlines()
+        ).encode()
+    
+    def _encode_yaml(self, entry: Dict[str, Any]) -> bytes:
+        return yaml.dump(
+            entry,
+            Dumper=self._dumper,
+            explicit_start=True,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True
+        ).encode()
+    
+    def write_host(self, entry: Dict[str, Any]) -> None:
+        """Write one host entry in the ``inspect_multiple_hosts()`` format.
+        
+        Args:
+            entry: Per-host result dictionary
+        """
+        if self.output_format == 'ndjson':
+            data = self._encode_ndjson(entry)
+        elif self.output_format == 'yaml':
+            data = self._encode_yaml(entry)
+        else:
+            data = self._encode_json(entry)
+        
+        # One write per host keeps compressor overhead low
+        self._file.write(data)
+        self.hosts_written += 1
+        self.containers_written += len(entry.get('containers', ()))
+    
+    def write_hosts(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Write every host entry from an iterable, e.g. ``iter_hosts()``."""
+        for entry in entries:
+            self.write_host(entry)
+    
+    def close(self) -> None:
+        """Finish the document and close the file."""
+        if self._file.closed:
+            return
+        
+        if self.output_format == 'json':
+            if self.pretty:
+                self._file.write(b'\n  ]\n}\n' if self.hosts_written else b']\n}\n')
+            else:
+                self._file.write(b']}\n')
+        self._file.close()
+        
+        logger.info(
+            f"Wrote {self.hosts_written} host(s) and "
+            f"{self.containers_written} container(s) to {self.path}"
+        )
+    
+    def __enter__(self) -> 'ResultWriter':
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def write_results(
+    results: Dict[str, Any],
+    path: Union[str, Path],
+    output_format: str = 'ndjson',
+    compression: str = 'none',
+    pretty: bool = False
+) -> ResultWriter:
+    """Write an ``inspect_multiple_hosts()`` result dictionary.
+    
+    Args:
+        results: Multi-host results
+        path: File to write
+        output_format: One of ``OUTPUT_FORMATS``
+        compression: One of ``COMPRESSIONS``
+        pretty: Indent the ``json`` document
+    
+    Returns:
+        The closed ResultWriter, for its counters
+    """
+    with ResultWriter(
+        path,
+        output_format=output_format,
+        compression=compression,
+        pretty=pretty,
+        timestamp=results.get('timestamp')
+    ) as writer:
+        writer.write_hosts(results['hosts'])
+    return writer
+
+
+def iter_records(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Read the records of an NDJSON output file, one line at a time.
+    
+    Args:
+        path: File written with ``output_format='ndjson'`` (any compression)
+    
+    Yields:
+        ``host`` and ``container`` records in file order
+    """
+    with open_decompressed(path) as f:
+        for line in f:
+            if line.strip():
+                yield loads_json(line)
@@ -0,0 +1,185 @@
+"""Container inspection through a Proxmox node with ``pct exec``.
+
+Docker hosts running as LXC containers are often unreachable from the
+scanner's network. This module opens one SSH session to the Proxmox node and
+runs the exec collector's ``docker ps``/``docker inspect`` command inside each
+container via ``pct exec <ctid> -- docker ...``, one SSH channel per
+container, many at once. One authenticated session to the hypervisor serves
+a whole node's worth of Docker hosts.
+"""
+
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from docker_inspector import (
+    ContainerInspectionError,
+    DockerConnectionError,
+    SSHConnectionError,
+)
+from exec_collector import collect_containers
+from utils import TIMED_OUT, run_bounded
+
+if TYPE_CHECKING:
+    from connection_pool import ConnectionPool
+
+
+logger = logging.getLogger(__name__)
+
+# OpenSSH allows 10 sessions per connection by default (MaxSessions)
+DEFAULT_CT_WORKERS = 8
+
+
+def pct_docker_command(ctid: Union[int, str]) -> str:
+    """Return the Docker CLI invocation for a Proxmox container.
+    
+    Args:
+        ctid: Proxmox container ID
+    
+    Returns:
+        Shell prefix running ``docker`` inside the container
+    
+    Raises:
+        ValueError: If the container ID is not numeric
+    """
+    return f"pct exec {int(ctid)} -- docker"
+
+
+def ct_label(proxmox_host: str, ctid: Union[int, str]) -> str:
+    """Return the host label used for a container in scan results."""
+    return f"{proxmox_host}/{int(ctid)}"
+
+
+def inspect_proxmox_containers(
+    proxmox_host: str,
+    username: str,
+    ctids: List[Union[int, str]],
+    ssh_key_path: Optional[str] = None,
+    ssh_timeout: int = 10,
+    docker_timeout: int = 30,
+    all_containers: bool = False,
+    max_workers: int = DEFAULT_CT_WORKERS,
+    ct_timeout: Optional[float] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    pool: Optional['ConnectionPool'] = None,
+    jump_host: Optional[str] = None
+) -> Dict[str, Any]:
+    """Inspect Docker containers in several Proxmox LXC containers.
+    
+    Args:
+        proxmox_host: Proxmox node to SSH into
+        username: SSH username on the Proxmox node (needs ``pct`` rights)
+        ctids: Proxmox container IDs running Docker
+        ssh_key_path: Path to SSH private key
+        ssh_timeout: SSH connection timeout
+        docker_timeout: Read timeout for each container's collection
+        all_containers: Include stopped containers
+        max_workers: Containers collected at the same time, each on its own
+            SSH channel (keep below the node's sshd ``MaxSessions``)
+        ct_timeout: Seconds a container may take once started before it is
+            reported as failed (None for no deadline)
+        filters: Docker-native filters applied in every container
+        pool: ConnectionPool to borrow the SSH session from (None uses the
+            process-wide default pool)
+        jump_host: Bastion as ``[user@]host[:port]`` in front of the node
+    
+    Returns:
+        Dictionary in the ``inspect_multiple_hosts()`` format, with one entry
+        per container ID labelled ``<proxmox_host>/<ctid>`` (entries of a
+        filtered scan record their ``filters``)
+    
+    Raises:
+        ValueError: If a container ID is not numeric
+    """
+    # Container IDs end up in a shell command; only accept integers
+    ctids = [int(ctid) for ctid in ctids]
+    
+    if pool is None:
+        from connection_pool import get_default_pool
+        pool = get_default_pool()
+    
+    results = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'hosts': []
+    }
+    
+    def error_entry(ctid: int, error: str) -> Dict[str, Any]:
+        return {
+            'host': ct_label(proxmox_host, ctid),
+            'ctid': ctid,
+            'error': error,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+    
+    try:
+        inspector = pool.acquire(
+            proxmox_host,
+            username,
+            ssh_key_path=ssh_key_path,
+            connect_docker=False,
+            jump_host=jump_host,
+            ssh_timeout=ssh_timeout,
+            docker_timeout=docker_timeout,
+            collector='exec'
+        )
+    except (SSHConnectionError, DockerConnectionError) as e:
+        logger.error(f"Failed to connect to Proxmox node {proxmox_host}: {e}")
+        results['hosts'] = [error_entry(ctid, str(e)) for ctid in ctids]
+        return results
+    
+    def inspect_ct(ctid: int) -> Dict[str, Any]:
+        label = ct_label(proxmox_host, ctid)
+        try:
+            containers, _ = collect_containers(
+                inspector.ssh_client,
+                label,
+                all_containers=all_containers,
+                filters=filters,
+                timeout=docker_timeout,
+                docker_command=pct_docker_command(ctid)
+            )
+        except (DockerConnectionError, ContainerInspectionError) as e:
+            logger.error(f"Failed to inspect {label}: {e}")
+            return error_entry(ctid, str(e))
+        
+        entry = {
+            'host': label,
+            'ctid': ctid,
+            'timestamp': datetime.utcnow().isoformat(),
+            'container_count': len(containers),
+            'containers': [c.to_dict() for c in containers]
+        }
+        if filters:
+            entry['filters'] = filters
+        return entry
+    
+    try:
+        outcomes = run_bounded(
+            inspect_ct,
+            ctids,
+            max_workers=max_workers,
+            item_timeout=ct_timeout,
+            thread_name_prefix='inspect-ct'
+        )
+    except BaseException:
+        pool.release(inspector, discard=True)
+        raise
+    
+    # Abandoned channels of timed-out containers die with the session
+    timed_out = any(outcome is TIMED_OUT for outcome in outcomes)
+    pool.release(inspector, discard=timed_out)
+    
+    for ctid, outcome in zip(ctids, outcomes):
+        if outcome is TIMED_OUT:
+            logger.error(
+                f"Failed to inspect {ct_label(proxmox_host, ctid)}: "
+                f"exceeded {ct_timeout}s deadline"
+            )
+            outcome = error_entry(
+                ctid, f"Container scan exceeded {ct_timeout}s deadline"
+            )
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        results['hosts'].append(outcome)
+    
+    return results
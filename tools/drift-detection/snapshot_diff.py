@@ -0,0 +1,307 @@
+"""Field-level differences between two scan snapshots.
+
+Containers are matched by host and name (IDs change on every redeploy).
+Identical containers are skipped before any field is looked at: snapshots in
+memory are compared subtree by subtree with ``==`` (which short-circuits on
+shared, interned objects), and runs in a ``SnapshotStore`` are compared by
+their stored content hashes, so unchanged hosts and containers are never
+loaded at all. Only the containers that differ are walked field by field.
+
+A host entry with ``filters`` comes from a filtered scan that only saw part
+of the host, so containers it lacks are not reported as removed (or, on the
+old side, the other side's containers as added).
+
+All diff functions are generators and yield ``Change`` records as they are
+found. Fields in the fingerprint ignore-list (see
+``ContainerInfo.fingerprint()``) are not reported.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from docker_inspector import (
+    DEFAULT_FINGERPRINT_IGNORE,
+    compile_ignore,
+    canonical_json,
+)
+
+if TYPE_CHECKING:
+    from snapshot_store import SnapshotStore
+
+
+# Change kinds
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+UNAVAILABLE = 'unavailable'
+
+
+@dataclass(slots=True)
+class Change:
+    """One difference between two snapshots.
+    
+    Attributes:
+        host: Host the change belongs to
+        container: Container name (None for host-level changes)
+        kind: ``added``, ``removed``, ``changed``, or ``unavailable`` when
+            the host failed to scan in either snapshot
+        path: Field path inside the container, e.g. ``('environment',
+            'TZ')``; empty when a whole container was added or removed
+        old: Previous value (None when added)
+        new: Current value (None when removed)
+    """
+    host: str
+    container: Optional[str]
+    kind: str
+    path: Tuple[str, ...] = ()
+    old: Any = None
+    new: Any = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'host': self.host,
+            'container': self.container,
+            'kind': self.kind,
+            'path': '/'.join(self.path),
+            'old': self.old,
+            'new': self.new
+        }
+
+
+def _same_items(old: list, new: list) -> bool:
+    """Compare two lists ignoring order."""
+    if len(old) != len(new):
+        return False
+    return sorted(map(canonical_json, old)) == sorted(map(canonical_json, new))
+
+
+def diff_values(
+    path: Tuple[str, ...],
+    old: Any,
+    new: Any,
+    ignore: Optional[Dict[str, Any]]
+) -> Iterator[Tuple[str, Tuple[str, ...], Any, Any]]:
+    """Yield ``(kind, path, old, new)`` for the differences below a path."""
+    if old == new:
+        return
+    
+    if path == ('volumes',) and isinstance(old, list) and isinstance(new, list):
+        # Mounts are identified by their destination inside the container
+        old = {v.get('destination', ''): v for v in old}
+        new = {v.get('destination', ''): v for v in new}
+    
+    if isinstance(old, dict) and isinstance(new, dict):
+        wildcard = ignore.get('*', {}) if ignore else {}
+        for key in sorted(old.keys() | new.keys()):
+            rule = ignore.get(key, wildcard) if ignore else {}
+            if rule is None:
+                continue
+            child = path + (key,)
+            if key not in new:
+                yield REMOVED, child, old[key], None
+            elif key not in old:
+                yield ADDED, child, None, new[key]
+            else:
+                yield from diff_values(child, old[key], new[key], rule)
+        return
+    
+    if isinstance(old, list) and isinstance(new, list) and _same_items(old, new):
+        return
+    
+    yield CHANGED, path, old, new
+
+
+def diff_container(
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    host: str = '',
+    ignore: Optional[frozenset] = None
+) -> Iterator[Change]:
+    """Yield the field-level changes between two versions of a container.
+    
+    Args:
+        old: Previous container in the ``ContainerInfo.to_dict()`` format
+        new: Current container in the same format
+        host: Host name recorded on the changes
+        ignore: '/'-separated field paths to leave out (defaults to
+            ``DEFAULT_FINGERPRINT_IGNORE``)
+    
+    Yields:
+        Change records, ordered by field path
+    """
+    ignore = DEFAULT_FINGERPRINT_IGNORE if ignore is None else frozenset(ignore)
+    name = new.get('name') or old.get('name')
+    for kind, path, old_value, new_value in diff_values(
+        (), old, new, compile_ignore(ignore)
+    ):
+        yield Change(host, name, kind, path, old_value, new_value)
+
+
+def _diff_container_maps(
+    host: str,
+    old: Dict[str, Dict[str, Any]],
+    new: Dict[str, Dict[str, Any]],
+    ignore: frozenset,
+    old_filtered: bool = False,
+    new_filtered: bool = False
+) -> Iterator[Change]:
+    """Diff two ``{name: container}`` maps of one host.
+    
+    Containers missing from a filtered side are not reported.
+    """
+    for name in sorted(old.keys() | new.keys()):
+        if name not in new:
+            if not new_filtered:
+                yield Change(host, name, REMOVED, old=old[name])
+        elif name not in old:
+            if not old_filtered:
+                yield Change(host, name, ADDED, new=new[name])
+        else:
+            yield from diff_container(old[name], new[name], host, ignore)
+
+
+def _host_containers(entry: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return {c['name']: c for c in entry.get('containers', ())}
+
+
+def _filtered(entry: Optional[Dict[str, Any]]) -> bool:
+    return bool(entry and entry.get('filters'))
+
+
+def diff_host_entries(
+    old: Optional[Dict[str, Any]],
+    new: Optional[Dict[str, Any]],
+    ignore: Optional[frozenset] = None
+) -> Iterator[Change]:
+    """Yield the changes between two scans of one host.
+    
+    Args:
+        old: Previous host entry (None if the host is new)
+        new: Current host entry (None if the host is gone)
+        ignore: Field paths to leave out (defaults to
+            ``DEFAULT_FINGERPRINT_IGNORE``)
+    
+    Yields:
+        Change records; a host that failed to scan on either side yields a
+        single ``unavailable`` change instead of container changes
+    """
+    ignore = DEFAULT_FINGERPRINT_IGNORE if ignore is None else frozenset(ignore)
+    host = (new or old)['host']
+    
+    if (old and 'error' in old) or (new and 'error' in new):
+        yield Change(
+            host, None, UNAVAILABLE,
+            old=old.get('error') if old else None,
+            new=new.get('error') if new else None
+        )
+        return
+    
+    old_containers = old.get('containers', []) if old else []
+    new_containers = new.get('containers', []) if new else []
+    if old_containers == new_containers:
+        return
+    
+    yield from _diff_container_maps(
+        host, _host_containers(old or {}), _host_containers(new or {}), ignore,
+        old_filtered=_filtered(old), new_filtered=_filtered(new)
+    )
+
+
+def _host_entries(
+    results: Union[Dict[str, Any], Iterable[Dict[str, Any]]]
+) -> Iterable[Dict[str, Any]]:
+    if isinstance(results, dict):
+        return results['hosts']
+    return results
+
+
+def diff_results(
+    old: Union[Dict[str, Any], Iterable[Dict[str, Any]]],
+    new: Union[Dict[str, Any], Iterable[Dict[str, Any]]],
+    ignore: Optional[frozenset] = None
+) -> Iterator[Change]:
+    """Yield the changes between two multi-host scans.
+    
+    Only ``old`` is indexed; ``new`` is consumed one host at a time, so it
+    can be a stream such as ``iter_hosts()`` or ``SnapshotStore.iter_hosts()``.
+    
+    Args:
+        old: Previous ``inspect_multiple_hosts()`` result, or its host entries
+        new: Current result, or an iterable of its host entries
+        ignore: Field paths to leave out (defaults to
+            ``DEFAULT_FINGERPRINT_IGNORE``)
+    
+    Yields:
+        Change records, host by host in the order of ``new``; hosts only in
+        ``old`` come last
+    """
+    old_hosts = {entry['host']: entry for entry in _host_entries(old)}
+    
+    for entry in _host_entries(new):
+        yield from diff_host_entries(old_hosts.pop(entry['host'], None), entry, ignore)
+    
+    for entry in old_hosts.values():
+        yield from diff_host_entries(entry, None, ignore)
+
+
+def diff_runs(
+    store: 'SnapshotStore',
+    old_run: str,
+    new_run: str,
+    ignore: Optional[frozenset] = None
+) -> Iterator[Change]:
+    """Yield the changes between two runs of a SnapshotStore.
+    
+    Hosts whose container list hash is unchanged are skipped without
+    loading anything, and within a changed host only containers whose
+    content hash differs are loaded.
+    
+    Args:
+        store: Store holding both runs
+        old_run: Previous run ID
+        new_run: Current run ID
+        ignore: Field paths to leave out (defaults to
+            ``DEFAULT_FINGERPRINT_IGNORE``)
+    
+    Yields:
+        Change records, host by host in the order of the new run
+    
+    Raises:
+        KeyError: If a run or blob does not exist
+    """
+    ignore = DEFAULT_FINGERPRINT_IGNORE if ignore is None else frozenset(ignore)
+    old_hosts = {record['host']: record for record in store.manifest(old_run)['hosts']}
+    new_hosts = store.manifest(new_run)['hosts']
+    
+    pairs = [(old_hosts.pop(record['host'], None), record) for record in new_hosts]
+    pairs.extend((record, None) for record in old_hosts.values())
+    
+    def digests(record):
+        if record is None or 'containers' not in record:
+            return set()
+        return set(store.get(record['containers']))
+    
+    def load(container_digests):
+        return {
+            container['name']: container
+            for container in map(store.get, container_digests)
+        }
+    
+    for old, new in pairs:
+        if (old and 'error' in old) or (new and 'error' in new):
+            yield from diff_host_entries(old, new, ignore)
+            continue
+        if old and new and old.get('containers') == new.get('containers'):
+            continue
+        
+        old_digests = digests(old)
+        new_digests = digests(new)
+        yield from _diff_container_maps(
+            (new or old)['host'],
+            load(old_digests - new_digests),
+            load(new_digests - old_digests),
+            ignore,
+            old_filtered=_filtered(old),
+            new_filtered=_filtered(new)
+        )
@@ -0,0 +1,296 @@
+"""Content-addressed store for scan snapshots.
+
+Consecutive scans of a fleet are mostly identical. Instead of writing a full
+result document per run, the store hashes each container's canonical JSON
+(SHA-256) and keeps every distinct container once as a compressed blob
+under ``objects/``. A host's list of container hashes is itself stored as a
+blob, so a run is recorded as a small manifest under ``manifests/`` holding
+one hash per host. A run in which nothing changed costs one manifest of a
+few hundred bytes.
+
+Layout::
+    
+    <store_dir>/objects/ab/cdef...   zlib-compressed canonical JSON blobs
+    <store_dir>/manifests/<run_id>.json
+"""
+
+import hashlib
+import json
+import logging
+import os
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from docker_inspector import canonical_json, loads_json
+from utils import write_atomic
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class SnapshotWriter:
+    """Record one run in a SnapshotStore, host by host.
+    
+    Obtain one from ``SnapshotStore.open_run()``. Container blobs are stored
+    as hosts are written; the run only becomes visible when the manifest is
+    written on ``close()``. A run abandoned by an exception leaves no
+    manifest, and its new blobs are removed by the next ``prune()``.
+    
+    Attributes:
+        run_id: Identifier of the run being written
+        new_blobs: Number of containers not already in the store
+    """
+    
+    def __init__(self, store: 'SnapshotStore', run_id: str, timestamp: str) -> None:
+        self.store = store
+        self.run_id = run_id
+        self.new_blobs = 0
+        self._manifest: Dict[str, Any] = {
+            'version': SNAPSHOT_FORMAT_VERSION,
+            'run_id': run_id,
+            'timestamp': timestamp,
+            'hosts': []
+        }
+        self._closed = False
+    
+    def write_host(self, entry: Dict[str, Any]) -> None:
+        """Store one host entry in the ``inspect_multiple_hosts()`` format.
+        
+        Args:
+            entry: Per-host result dictionary
+        """
+        record = {key: value for key, value in entry.items() if key != 'containers'}
+        if 'containers' in entry:
+            digests = []
+            for container in entry['containers']:
+                digest, created = self.store.put(container)
+                self.new_blobs += created
+                digests.append(digest)
+            # An unchanged host resolves to the same list blob
+            record['containers'], _ = self.store.put(digests)
+        self._manifest['hosts'].append(record)
+    
+    def write_hosts(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Store every host entry from an iterable, e.g. ``iter_hosts()``."""
+        for entry in entries:
+            self.write_host(entry)
+    
+    def close(self) -> None:
+        """Write the run's manifest."""
+        if self._closed:
+            return
+        self._closed = True
+        
+        path = self.store._manifest_path(self.run_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, json.dumps(self._manifest).encode())
+        
+        logger.info(
+            f"Stored snapshot {self.run_id}: "
+            f"{len(self._manifest['hosts'])} host(s), "
+            f"{self.new_blobs} new container blob(s)"
+        )
+    
+    def __enter__(self) -> 'SnapshotWriter':
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit; the run is discarded if the block raised."""
+        if exc_type is None:
+            self.close()
+
+
+class SnapshotStore:
+    """Deduplicating on-disk history of scan results.
+    
+    A store can be shared by threads; blobs and manifests are written
+    atomically, and identical blobs written concurrently are harmless.
+    """
+    
+    def __init__(self, store_dir: Union[str, Path]) -> None:
+        """Initialize the store.
+        
+        Args:
+            store_dir: Directory holding ``objects/`` and ``manifests/``
+        """
+        self.store_dir = Path(store_dir)
+        self.objects_dir = self.store_dir / 'objects'
+        self.manifests_dir = self.store_dir / 'manifests'
+    
+    def _blob_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+    
+    def _manifest_path(self, run_id: str) -> Path:
+        return self.manifests_dir / f"{run_id}.json"
+    
+    @staticmethod
+    def digest(container: Dict[str, Any]) -> str:
+        """Return the content hash of a container dictionary.
+        
+        Args:
+            container: Container in the ``ContainerInfo.to_dict()`` format
+        
+        Returns:
+            Hex SHA-256 of the container's canonical JSON
+        """
+        return hashlib.sha256(canonical_json(container)).hexdigest()
+    
+    def put(self, value: Any) -> Tuple[str, bool]:
+        """Store a blob unless it is already present.
+        
+        Args:
+            value: JSON-serializable value, e.g. a container dictionary
+        
+        Returns:
+            Tuple of (content hash, whether a new blob was written)
+        """
+        data = canonical_json(value)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if path.exists():
+            return digest, False
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, zlib.compress(data))
+        return digest, True
+    
+    def get(self, digest: str) -> Any:
+        """Load a blob.
+        
+        Args:
+            digest: Content hash returned by ``put()``
+        
+        Returns:
+            The stored value
+        
+        Raises:
+            KeyError: If the blob is not in the store
+        """
+        try:
+            with open(self._blob_path(digest), 'rb') as f:
+                return loads_json(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            raise KeyError(digest)
+    
+    def open_run(self, timestamp: Optional[str] = None) -> SnapshotWriter:
+        """Start recording a run.
+        
+        Args:
+            timestamp: Scan timestamp (defaults to now)
+        
+        Returns:
+            SnapshotWriter; use it as a context manager
+        """
+        now = datetime.utcnow()
+        run_id = now.strftime('%Y%m%dT%H%M%S%fZ')
+        return SnapshotWriter(self, run_id, timestamp or now.isoformat())
+    
+    def save(self, results: Dict[str, Any]) -> str:
+        """Record an ``inspect_multiple_hosts()`` result dictionary.
+        
+        Args:
+            results: Multi-host results
+        
+        Returns:
+            ID of the new run
+        """
+        with self.open_run(timestamp=results.get('timestamp')) as writer:
+            writer.write_hosts(results['hosts'])
+        return writer.run_id
+    
+    def runs(self) -> List[str]:
+        """Return the IDs of all stored runs, oldest first."""
+        if not self.manifests_dir.is_dir():
+            return []
+        return sorted(
+            path.stem for path in self.manifests_dir.glob('*.json')
+        )
+    
+    def latest(self) -> Optional[str]:
+        """Return the ID of the most recent run, or None if there is none."""
+        runs = self.runs()
+        return runs[-1] if runs else None
+    
+    def manifest(self, run_id: str) -> Dict[str, Any]:
+        """Load a run's manifest.
+        
+        Raises:
+            KeyError: If the run does not exist
+        """
+        try:
+            with open(self._manifest_path(run_id), 'rb') as f:
+                return loads_json(f.read())
+        except FileNotFoundError:
+            raise KeyError(run_id)
+    
+    def iter_hosts(self, run_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield a run's host entries one at a time.
+        
+        Args:
+            run_id: Run to load
+        
+        Yields:
+            Per-host result dictionaries with their containers restored
+        
+        Raises:
+            KeyError: If the run or one of its blobs does not exist
+        """
+        for record in self.manifest(run_id)['hosts']:
+            entry = dict(record)
+            if 'containers' in record:
+                entry['containers'] = [
+                    self.get(digest) for digest in self.get(record['containers'])
+                ]
+            yield entry
+    
+    def load(self, run_id: str) -> Dict[str, Any]:
+        """Rebuild a run's ``inspect_multiple_hosts()`` result dictionary.
+        
+        Raises:
+            KeyError: If the run or one of its blobs does not exist
+        """
+        return {
+            'timestamp': self.manifest(run_id)['timestamp'],
+            'hosts': list(self.iter_hosts(run_id))
+        }
+    
+    def prune(self, keep: int) -> int:
+        """Delete all but the newest runs and blobs no run refers to.
+        
+        Do not prune while a run is being written: its blobs are not
+        referenced until its manifest exists.
+        
+        Args:
+            keep: Number of most recent runs to keep
+        
+        Returns:
+            Number of blobs deleted
+        """
+        runs = self.runs()
+        for run_id in runs[:max(0, len(runs) - keep)]:
+            self._manifest_path(run_id).unlink()
+        
+        referenced: Set[str] = set()
+        for run_id in self.runs():
+            for record in self.manifest(run_id)['hosts']:
+                list_digest = record.get('containers')
+                if list_digest and list_digest not in referenced:
+                    referenced.add(list_digest)
+                    referenced.update(self.get(list_digest))
+        
+        deleted = 0
+        if self.objects_dir.is_dir():
+            for path in self.objects_dir.glob('*/*'):
+                if path.name.startswith('.'):
+                    continue
+                if path.parent.name + path.name not in referenced:
+                    path.unlink()
+                    deleted += 1
+        
+        logger.info(f"Pruned snapshot store to {keep} run(s), deleted {deleted} blob(s)")
+        return deleted
@@ -0,0 +1,272 @@
+"""Unit tests for async_inspector.py module."""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import patch
+
+import async_inspector
+from async_inspector import AsyncDockerInspector, _read_response
+from docker_inspector import (
+    ContainerInfo,
+    ContainerInspectionError,
+    DockerConnectionError,
+    SSHConnectionError,
+    parse_container_attrs,
+)
+
+
+def _reader(data):
+    """Build a StreamReader pre-loaded with ``data``."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def _http(status, body):
+    """Encode a Content-Length HTTP response."""
+    return (
+        f"HTTP/1.1 {status} X\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+
+
+class _FakeConnection:
+    """asyncssh connection stand-in answering requests from a route table."""
+    
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        self.channels = 0
+    
+    async def open_unix_connection(self, path):
+        self.channels += 1
+        conn = self
+        outgoing = bytearray()
+        
+        class Writer:
+            def write(self, data):
+                outgoing.extend(data)
+            
+            async def drain(self):
+                for line in bytes(outgoing).split(b'\r\n\r\n'):
+                    if line:
+                        request_path = line.split()[1].decode()
+                        conn.requests.append(request_path)
+                        status, body = conn.routes[request_path]
+                        reader.feed_data(_http(status, body))
+                reader.feed_eof()
+            
+            def close(self):
+                pass
+        
+        reader = asyncio.StreamReader()
+        return reader, Writer()
+
+
+def _payload(container_id, name):
+    return {
+        'Id': container_id,
+        'Name': f'/{name}',
+        'Created': '2024-01-01T00:00:00Z',
+        'Config': {'Image': 'nginx:latest', 'Labels': {}, 'Env': []},
+        'State': {'Status': 'running', 'StartedAt': ''},
+        'NetworkSettings': {'Networks': {}, 'Ports': {}},
+    }
+
+
+class TestReadResponse:
+    """Test suite for the async HTTP response reader."""
+    
+    def test_content_length(self):
+        """Test a Content-Length response is read exactly."""
+        async def run():
+            reader = _reader(_http(200, b'{"a": 1}') + _http(404, b'{}'))
+            return await _read_response(reader), await _read_response(reader)
+        
+        assert asyncio.run(run()) == ((200, b'{"a": 1}'), (404, b'{}'))
+    
+    def test_chunked(self):
+        """Test a chunked response is reassembled."""
+        data = (
+            b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+            b'2\r\n{"\r\n6\r\na": 1}\r\n0\r\n\r\n'
+        )
+        
+        async def run():
+            return await _read_response(_reader(data))
+        
+        assert asyncio.run(run()) == (200, b'{"a": 1}')
+    
+    def test_malformed_status(self):
+        """Test garbage on the wire raises DockerConnectionError."""
+        async def run():
+            return await _read_response(_reader(b'garbage\r\n'))
+        
+        with pytest.raises(DockerConnectionError, match="Malformed"):
+            asyncio.run(run())
+
+
+class TestAsyncDockerInspector:
+    """Test suite for AsyncDockerInspector."""
+    
+    def test_inspect_all_containers(self):
+        """Test a full host scan over a fake asyncssh connection."""
+        conn = _FakeConnection({
+            '/version': (200, b'{"ApiVersion": "1.43"}'),
+            '/v1.43/containers/json?all=0': (
+                200, json.dumps([{'Id': 'abc'}, {'Id': 'gone'}]).encode()
+            ),
+            '/v1.43/containers/abc/json': (
+                200, json.dumps(_payload('abc', 'web')).encode()
+            ),
+            '/v1.43/containers/gone/json': (404, b'{}'),
+        })
+        
+        async def run():
+            inspector = AsyncDockerInspector(host="192.168.1.100", username="root")
+            inspector.ssh_conn = conn
+            await inspector.connect_docker()
+            return await inspector.inspect_all_containers()
+        
+        results = asyncio.run(run())
+        
+        assert len(results) == 1
+        assert isinstance(results[0], ContainerInfo)
+        assert results[0].name == 'web'
+        # version + list + one pipelined channel for both inspects
+        assert conn.channels == 3
+    
+    def test_iter_containers(self):
+        """Test containers stream with failures yielded in place."""
+        conn = _FakeConnection({
+            '/v1.43/containers/json?all=0': (
+                200, json.dumps([{'Id': 'gone'}, {'Id': 'abc'}]).encode()
+            ),
+            '/v1.43/containers/gone/json': (404, b'{}'),
+            '/v1.43/containers/abc/json': (
+                200, json.dumps(_payload('abc', 'web')).encode()
+            ),
+        })
+        
+        async def run():
+            inspector = AsyncDockerInspector(host="192.168.1.100", username="root")
+            inspector.ssh_conn = conn
+            inspector.api_version = '1.43'
+            return [item async for item in inspector.iter_containers()]
+        
+        items = asyncio.run(run())
+        
+        assert isinstance(items[0], ContainerInspectionError)
+        assert items[0].container_id == 'gone'
+        assert items[1].name == 'web'
+    
+    def test_list_containers_with_filters(self):
+        """Test filters are encoded into the listing query string."""
+        query = (
+            '/v1.43/containers/json?all=1&filters='
+            '%7B%22label%22%3A+%5B%22app%3Dweb%22%5D%7D'
+        )
+        conn = _FakeConnection({query: (200, b'[{"Id": "abc"}]')})
+        
+        async def run():
+            inspector = AsyncDockerInspector(host="192.168.1.100", username="root")
+            inspector.ssh_conn = conn
+            inspector.api_version = '1.43'
+            return await inspector.list_containers(
+                all_containers=True, filters={'label': ['app=web']}
+            )
+        
+        assert asyncio.run(run()) == ['abc']
+        assert conn.requests == [query]
+    
+    def test_connect_docker_no_ssh(self):
+        """Test Docker connection without SSH connection."""
+        inspector = AsyncDockerInspector(host="192.168.1.100", username="root")
+        
+        with pytest.raises(DockerConnectionError, match="SSH connection not established"):
+            asyncio.run(inspector.connect_docker())
+    
+    def test_connect_failure(self):
+        """Test SSH failures are wrapped in SSHConnectionError."""
+        inspector = AsyncDockerInspector(host="192.168.1.100", username="root")
+        
+        async def refuse(*args, **kwargs):
+            raise OSError("Connection refused")
+        
+        with patch.object(async_inspector.asyncssh, 'connect', side_effect=refuse):
+            with pytest.raises(SSHConnectionError, match="Failed to connect"):
+                asyncio.run(inspector.connect())
+
+
+class TestAsyncInspectHost:
+    """Test suite for async inspect_host."""
+    
+    def test_filtered_scan_keeps_other_containers(self):
+        """Test containers outside a filtered scan are not recorded as removed."""
+        from history_store import HistoryStore
+        
+        web, db = (parse_container_attrs(_payload(name, name)) for name in ('web', 'db'))
+        
+        async def scan(containers, filters=None):
+            with patch.object(AsyncDockerInspector, 'connect'), \
+                    patch.object(AsyncDockerInspector, 'connect_docker'), \
+                    patch.object(AsyncDockerInspector, 'disconnect'), \
+                    patch.object(AsyncDockerInspector, 'inspect_all_containers',
+                                 return_value=containers):
+                return await async_inspector.inspect_host(
+                    "192.168.1.100", "root", filters=filters
+                )
+        
+        full = asyncio.run(scan([web, db]))
+        filtered = asyncio.run(scan([web], filters={'name': ['web']}))
+        
+        assert 'filters' not in full
+        assert filtered['filters'] == {'name': ['web']}
+        
+        store = HistoryStore(':memory:')
+        store.record_host(full, timestamp='2024-01-01T00:00:00')
+        assert store.record_host(filtered, timestamp='2024-01-01T01:00:00') == 0
+        assert store.container_at('192.168.1.100', 'db', '2024-01-01T01:00:00')
+
+
+class TestAsyncInspectMultipleHosts:
+    """Test suite for async inspect_multiple_hosts."""
+    
+    def test_order_errors_and_deadline(self):
+        """Test ordering is kept, errors are reported and slow hosts cancelled."""
+        async def fake_inspect_host(host, **kwargs):
+            if host == 'slow':
+                await asyncio.sleep(10)
+            if host == 'bad':
+                raise SSHConnectionError("Failed to connect to bad")
+            await asyncio.sleep(0.01)
+            return {'host': host, 'container_count': 0, 'containers': []}
+        
+        with patch.object(async_inspector, 'inspect_host', fake_inspect_host):
+            results = asyncio.run(async_inspector.inspect_multiple_hosts(
+                ['slow', 'ok', 'bad'], username='root', host_timeout=0.2
+            ))
+        
+        assert [h['host'] for h in results['hosts']] == ['slow', 'ok', 'bad']
+        assert "deadline" in results['hosts'][0]['error']
+        assert results['hosts'][1]['container_count'] == 0
+        assert "Failed to connect" in results['hosts'][2]['error']
+    
+    def test_iter_hosts_completion_order(self):
+        """Test hosts are yielded in the order they finish."""
+        async def fake_inspect_host(host, **kwargs):
+            await asyncio.sleep({'a': 0.2, 'b': 0.0, 'c': 0.1}[host])
+            return {'host': host, 'container_count': 0, 'containers': []}
+        
+        async def run():
+            return [
+                entry['host'] async for entry in async_inspector.iter_hosts(
+                    ['a', 'b', 'c'], username='root'
+                )
+            ]
+        
+        with patch.object(async_inspector, 'inspect_host', fake_inspect_host):
+            assert asyncio.run(run()) == ['b', 'c', 'a']
@@ -0,0 +1,297 @@
+"""Unit tests for baseline_loader.py module."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from baseline_loader import (
+    BaselineError,
+    BaselineLoader,
+    GitObjectReader,
+    interpolate,
+    parse_stack,
+)
+
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git not installed")
+
+BASE = """
+services:
+  plex:
+    image: plexinc/pms-docker:${PLEX_TAG:-latest}
+    container_name: plex
+    environment:
+      - TZ=${TZ}
+      - PLEX_CLAIM
+    labels:
+      traefik.enable: "true"
+    volumes:
+      - /opt/appdata/media/plex:/config
+      - transcode:/transcode
+    ports:
+      - "32400:32400"
+    networks:
+      - media
+  sonarr:
+    image: linuxserver/sonarr
+    environment:
+      PUID: 1000
+networks:
+  media:
+    external: true
+volumes:
+  transcode:
+"""
+
+OVERRIDE = """
+services:
+  plex:
+    environment:
+      NVIDIA_VISIBLE_DEVICES: all
+    volumes:
+      - /mnt/media:/data:ro
+      - /opt/appdata/media/plex-gpu:/config
+"""
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ['git', '-C', str(repo), '-c', 'user.name=test', '-c', 'user.email=test@example.com',
+         *args],
+        check=True, capture_output=True
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A homelab-apps repository with two stacks and an untracked .env."""
+    repo = tmp_path / 'homelab-apps'
+    media = repo / 'stacks' / 'media'
+    media.mkdir(parents=True)
+    (media / 'docker-compose.yml').write_text(BASE)
+    (media / 'docker-compose.ct-media-01.yml').write_text(OVERRIDE)
+    (repo / 'stacks' / 'dns').mkdir()
+    (repo / 'stacks' / 'dns' / 'compose.yaml').write_text(
+        "services:\n  pihole:\n    image: pihole/pihole\n"
+    )
+    (repo / 'stacks' / 'broken').mkdir()
+    (repo / 'stacks' / 'broken' / 'README.md').write_text("todo\n")
+    _git(repo, 'init', '-q')
+    _git(repo, 'add', '.')
+    _git(repo, 'commit', '-q', '-m', 'initial')
+    (media / '.env').write_text("TZ=Europe/Brussels\nPLEX_CLAIM=claim-1\n")
+    return repo
+
+
+class TestInterpolate:
+    """Test suite for compose variable substitution."""
+    
+    def test_forms(self):
+        """Test defaults, alternatives, escapes and unset variables."""
+        env = {'SET': 'x', 'EMPTY': ''}
+        
+        assert interpolate('$SET ${SET} $$SET', env) == 'x x $SET'
+        assert interpolate('${EMPTY:-d} ${EMPTY-d} ${UNSET-d}', env) == 'd  d'
+        assert interpolate('${SET:+alt}${UNSET:+alt}', env) == 'alt'
+        assert interpolate('${UNSET:-${SET}}', env) == 'x'
+        assert interpolate({'k': ['${UNSET}', 1]}, env) == {'k': ['', 1]}
+    
+    def test_required(self):
+        """Test ${VAR:?message} fails when the variable is missing."""
+        with pytest.raises(BaselineError, match="SECRET is not set: needed"):
+            interpolate('${SECRET:?needed}', {})
+
+
+class TestProjectName:
+    """Test suite for compose project naming."""
+    
+    def test_precedence_and_normalization(self):
+        """Test .env wins over name:, which wins over the directory."""
+        named = b"name: Media_Stack.v2\nservices:\n  app:\n    image: app\n"
+        unnamed = b"services:\n  app:\n    image: app\n"
+        
+        def project(documents, env):
+            return parse_stack('Media', documents, env)[0].labels[
+                'com.docker.compose.project'
+            ]
+        
+        assert project([unnamed], {}) == 'media'
+        assert project([named], {}) == 'media_stackv2'
+        assert project([named, b"name: ${SUFFIX}-media\n"], {'SUFFIX': 'X'}) == 'x-media'
+        assert project([named], {'COMPOSE_PROJECT_NAME': 'Prod'}) == 'prod'
+    
+    def test_names_derive_from_project(self):
+        """Test default container, network and volume names use the project."""
+        container = parse_stack('media', [
+            b"name: tv\nservices:\n  app:\n    image: app\n"
+            b"    volumes: [data:/data]\nvolumes:\n  data:\n"
+        ], {})[0]
+        
+        assert container.name == 'tv-app-1'
+        assert container.networks == {'tv_default': {}}
+        assert container.volumes[0]['source'] == 'tv_data'
+    
+    def test_relative_bind_sources_stay_relative(self):
+        """Test relative bind sources are normalized but not resolved."""
+        container = parse_stack('media', [
+            b"services:\n  app:\n    image: app\n    volumes:\n"
+            b"      - ./config/../data:/data\n      - ../shared:/shared\n"
+            b"      - ~/media:/media\n      - /srv//app/:/srv\n"
+        ], {})[0]
+        
+        assert [v['source'] for v in container.volumes] == [
+            './data', '../shared', '~/media', '/srv/app'
+        ]
+
+
+class TestGitObjectReader:
+    """Test suite for GitObjectReader."""
+    
+    def test_read_and_tree(self, repo):
+        """Test reading blobs and trees through one process."""
+        with GitObjectReader(repo) as reader:
+            tree = reader.tree('HEAD:stacks/media')
+            sha, object_type, data = reader.read(tree['docker-compose.yml'][1])
+            
+            assert set(tree) == {'docker-compose.yml', 'docker-compose.ct-media-01.yml'}
+            assert object_type == 'blob'
+            assert data.decode() == BASE
+            assert reader.read('HEAD:missing.yml') is None
+            assert reader.tree('HEAD:stacks/media/docker-compose.yml') is None
+    
+    def test_not_a_repository(self, tmp_path):
+        """Test a clear error outside a git repository."""
+        with GitObjectReader(tmp_path) as reader:
+            with pytest.raises(BaselineError, match="git cat-file exited"):
+                reader.read('HEAD')
+
+
+class TestBaselineLoader:
+    """Test suite for BaselineLoader."""
+    
+    def test_merged_endpoint_baseline(self, repo):
+        """Test override merging, .env substitution and normalization."""
+        with BaselineLoader(repo, endpoint='ct-media-01') as loader:
+            baselines = loader.load()
+        
+        assert sorted(baselines) == ['dns', 'media']
+        assert 'no compose file' in loader.errors['broken']
+        
+        plex, sonarr = baselines['media']
+        assert plex.name == 'plex'
+        assert plex.image == 'plexinc/pms-docker:latest'
+        assert plex.environment == {
+            'TZ': 'Europe/Brussels', 'PLEX_CLAIM': 'claim-1', 'NVIDIA_VISIBLE_DEVICES': 'all'
+        }
+        assert plex.labels == {
+            'traefik.enable': 'true',
+            'com.docker.compose.project': 'media',
+            'com.docker.compose.service': 'plex'
+        }
+        assert plex.networks == {'media': {}}
+        assert [(v['type'], v['source'], v['destination'], v['rw']) for v in plex.volumes] == [
+            ('bind', '/opt/appdata/media/plex-gpu', '/config', True),
+            ('volume', 'media_transcode', '/transcode', True),
+            ('bind', '/mnt/media', '/data', False),
+        ]
+        assert plex.ports == {'32400/tcp': [{'HostIp': '', 'HostPort': '32400'}]}
+        
+        assert sonarr.name == 'media-sonarr-1'
+        assert sonarr.environment == {'PUID': '1000'}
+        assert sonarr.networks == {'media_default': {}}
+    
+    def test_without_endpoint(self, repo):
+        """Test only the base file is used without an endpoint."""
+        with BaselineLoader(repo) as loader:
+            plex = loader.load_stack('media')[0]
+        
+        assert 'NVIDIA_VISIBLE_DEVICES' not in plex.environment
+        assert len(plex.volumes) == 2
+    
+    def test_expands_home_directory(self, repo, monkeypatch):
+        """Test a repository path starting with ~ is expanded."""
+        monkeypatch.setenv('HOME', str(repo.parent))
+        
+        with BaselineLoader('~/homelab-apps') as loader:
+            assert loader.repo_path == repo
+            assert loader.stacks() == ['broken', 'dns', 'media']
+    
+    def test_cache_reparses_only_changed_stacks(self, repo, tmp_path):
+        """Test cached stacks are reused until their blobs or .env change."""
+        cache_dir = tmp_path / 'baseline-cache'
+        with BaselineLoader(repo, 'ct-media-01', cache_dir) as loader:
+            first = loader.load()
+            assert (loader.parsed, loader.cached) == (2, 0)
+        
+        with BaselineLoader(repo, 'ct-media-01', cache_dir) as loader:
+            assert loader.load() == first
+            assert (loader.parsed, loader.cached) == (0, 2)
+        
+        (repo / 'stacks' / 'dns' / 'compose.yaml').write_text(
+            "services:\n  pihole:\n    image: pihole/pihole:2024.07\n"
+        )
+        _git(repo, 'commit', '-q', '-am', 'pin pihole')
+        (repo / 'stacks' / 'media' / '.env').write_text("TZ=UTC\n")
+        
+        with BaselineLoader(repo, 'ct-media-01', cache_dir) as loader:
+            baselines = loader.load()
+            assert (loader.parsed, loader.cached) == (2, 0)
+        assert baselines['dns'][0].image == 'pihole/pihole:2024.07'
+        assert baselines['media'][0].environment['TZ'] == 'UTC'
+    
+    def test_env_file(self, repo, tmp_path):
+        """Test env_file variables are merged under environment and cached safely."""
+        app = repo / 'stacks' / 'app'
+        app.mkdir()
+        (app / 'compose.yaml').write_text(
+            "services:\n"
+            "  web:\n"
+            "    image: web\n"
+            "    env_file:\n"
+            "      - app.env\n"
+            "      - path: ./local.env\n"
+            "        required: false\n"
+            "    environment:\n"
+            "      MODE: prod\n"
+            "  worker:\n"
+            "    image: worker\n"
+            "    env_file: secrets.env\n"
+        )
+        (app / 'app.env').write_text("MODE=dev\nDB_HOST=db\n")
+        _git(repo, 'add', '.')
+        _git(repo, 'commit', '-q', '-m', 'app')
+        # Read from the commit, not the working tree
+        (app / 'app.env').unlink()
+        cache_dir = tmp_path / 'baseline-cache'
+        
+        with BaselineLoader(repo, cache_dir=cache_dir) as loader:
+            with pytest.raises(BaselineError, match="env_file secrets.env of service worker"):
+                loader.load_stack('app')
+        
+        (app / 'secrets.env').write_text("TOKEN=1\n")
+        with BaselineLoader(repo, cache_dir=cache_dir) as loader:
+            web, worker = loader.load_stack('app')
+        assert web.environment == {'MODE': 'prod', 'DB_HOST': 'db'}
+        assert worker.environment == {'TOKEN': '1'}
+        
+        (app / 'local.env').write_text("DB_HOST=localhost\n")
+        with BaselineLoader(repo, cache_dir=cache_dir) as loader:
+            web, _ = loader.load_stack('app')
+            assert (loader.parsed, loader.cached) == (1, 0)
+        assert web.environment == {'MODE': 'prod', 'DB_HOST': 'localhost'}
+        
+        with BaselineLoader(repo, cache_dir=cache_dir) as loader:
+            assert loader.load_stack('app')[0] == web
+            assert (loader.parsed, loader.cached) == (0, 1)
+    
+    def test_missing_stacks_directory(self, tmp_path):
+        """Test a repository without stacks/ is reported."""
+        _git(tmp_path, 'init', '-q')
+        (tmp_path / 'README.md').write_text("empty\n")
+        _git(tmp_path, 'add', '.')
+        _git(tmp_path, 'commit', '-q', '-m', 'initial')
+        
+        with BaselineLoader(tmp_path) as loader:
+            with pytest.raises(BaselineError, match="No stacks/ directory"):
+                loader.load()
@@ -3,7 +3,7 @@
 import os
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from config import Config, load_config
 
 
@@ -42,6 +42,52 @@ class TestConfig:
         assert config.output_format == 'yaml'
         assert config.log_level == 'DEBUG'
     
+    def test_scan_concurrency_settings(self, monkeypatch):
+        """Test parsing of host concurrency and deadline settings."""
+        monkeypatch.setenv('TARGET_HOSTS', '10.0.0.1')
+        monkeypatch.delenv('HOST_TIMEOUT', raising=False)
+        
+        config = Config()
+        
+        assert config.max_parallel_hosts == 4
+        assert config.host_timeout is None
+        
+        monkeypatch.setenv('MAX_PARALLEL_HOSTS', '8')
+        monkeypatch.setenv('HOST_TIMEOUT', '120')
+        
+        config = Config()
+        
+        assert config.max_parallel_hosts == 8
+        assert config.host_timeout == 120.0
+    
+    def test_container_filters_parsing(self, monkeypatch):
+        """Test CONTAINER_FILTERS is parsed into Docker filter lists."""
+        monkeypatch.setenv('TARGET_HOSTS', '10.0.0.1')
+        monkeypatch.setenv(
+            'CONTAINER_FILTERS',
+            'label=com.docker.compose.project=media, label=tier=web,status=running,bogus'
+        )
+        
+        config = Config()
+        
+        assert config.container_filters == {
+            'label': ['com.docker.compose.project=media', 'tier=web'],
+            'status': ['running'],
+        }
+    
+    def test_proxmox_settings(self, monkeypatch):
+        """Test parsing of the Proxmox node and container IDs."""
+        monkeypatch.delenv('TARGET_HOSTS', raising=False)
+        monkeypatch.setenv('PROXMOX_HOST', '192.168.50.10')
+        monkeypatch.setenv('PROXMOX_CTIDS', '101, 102,')
+        
+        config = Config()
+        
+        assert config.proxmox_host == '192.168.50.10'
+        assert config.proxmox_ctids == [101, 102]
+        # Proxmox containers alone are enough to scan something
+        config.validate()
+    
     def test_target_hosts_parsing(self, monkeypatch):
         """Test parsing of comma-separated target hosts."""
         monkeypatch.setenv('TARGET_HOSTS', '  host1, host2 ,  host3  ')
@@ -149,6 +195,26 @@ class TestConfigValidation:
         with pytest.raises(ValueError, match="DOCKER_TIMEOUT must be positive"):
             config.validate()
     
+    def test_validate_zero_max_parallel_hosts(self, monkeypatch):
+        """Test validation fails with zero host concurrency."""
+        monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
+        monkeypatch.setenv('MAX_PARALLEL_HOSTS', '0')
+        
+        config = Config()
+        
+        with pytest.raises(ValueError, match="MAX_PARALLEL_HOSTS must be positive"):
+            config.validate()
+    
+    def test_validate_negative_host_timeout(self, monkeypatch):
+        """Test validation fails with a negative host deadline."""
+        monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
+        monkeypatch.setenv('HOST_TIMEOUT', '-5')
+        
+        config = Config()
+        
+        with pytest.raises(ValueError, match="HOST_TIMEOUT must be positive"):
+            config.validate()
+    
     def test_validate_invalid_output_format(self, monkeypatch):
         """Test validation fails with invalid output format."""
         monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
@@ -156,9 +222,112 @@ class TestConfigValidation:
         
         config = Config()
         
-        with pytest.raises(ValueError, match="OUTPUT_FORMAT must be 'json' or 'yaml'"):
+        with pytest.raises(ValueError, match="OUTPUT_FORMAT must be 'json', 'ndjson' or 'yaml'"):
+            config.validate()
+    
+    def test_fingerprint_ignore(self, monkeypatch):
+        """Test parsing of extra fingerprint ignore paths."""
+        monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
+        monkeypatch.setenv(
+            'FINGERPRINT_IGNORE', 'labels/com.docker.compose.config-hash, ports'
+        )
+        
+        config = Config()
+        
+        assert config.fingerprint_ignore == [
+            'labels/com.docker.compose.config-hash', 'ports'
+        ]
+    
+    def test_snapshot_settings(self, monkeypatch):
+        """Test snapshot directory expansion and retention validation."""
+        monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
+        monkeypatch.setenv('SNAPSHOT_DIR', '~/snapshots')
+        monkeypatch.setenv('SNAPSHOT_KEEP', '-1')
+        
+        config = Config()
+        
+        assert config.snapshot_dir == os.path.expanduser('~/snapshots')
+        with pytest.raises(ValueError, match="SNAPSHOT_KEEP must not be negative"):
+            config.validate()
+    
+    def test_validate_invalid_jump_host(self, monkeypatch):
+        """Test a malformed JUMP_HOST fails at config load."""
+        monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
+        monkeypatch.delenv('SSH_KEY_PATH', raising=False)
+        monkeypatch.setenv('JUMP_HOST', 'bastion:ssh')
+        
+        with pytest.raises(ValueError, match="JUMP_HOST is invalid"):
+            Config().validate()
+        
+        monkeypatch.setenv('JUMP_HOST', 'ops@bastion:2222')
+        Config().validate()
+    
+    def test_history_db(self, monkeypatch):
+        """Test the history database path is optional and expanded."""
+        monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
+        monkeypatch.delenv('HISTORY_DB', raising=False)
+        
+        assert Config().history_db is None
+        
+        monkeypatch.setenv('HISTORY_DB', '~/history.db')
+        assert Config().history_db == os.path.expanduser('~/history.db')
+    
+    def test_image_defaults(self, monkeypatch):
+        """Test image default subtraction is opt-in with a positive cache size."""
+        monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
+        monkeypatch.delenv('STRIP_IMAGE_DEFAULTS', raising=False)
+        monkeypatch.delenv('IMAGE_CACHE_SIZE', raising=False)
+        
+        config = Config()
+        assert config.strip_image_defaults is False
+        assert config.image_cache_size == 1024
+        
+        monkeypatch.setenv('STRIP_IMAGE_DEFAULTS', 'true')
+        monkeypatch.setenv('IMAGE_CACHE_SIZE', '0')
+        config = Config()
+        assert config.strip_image_defaults is True
+        with pytest.raises(ValueError, match="IMAGE_CACHE_SIZE must be positive"):
+            config.validate()
+    
+    def test_output_settings(self, monkeypatch):
+        """Test parsing and validation of output compression and pretty mode."""
+        monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
+        monkeypatch.setenv('OUTPUT_FORMAT', 'ndjson')
+        monkeypatch.setenv('OUTPUT_COMPRESSION', 'gzip')
+        monkeypatch.setenv('OUTPUT_PRETTY', 'true')
+        
+        config = Config()
+        config.validate()
+        
+        assert config.output_format == 'ndjson'
+        assert config.output_compression == 'gzip'
+        assert config.output_pretty is True
+        
+        monkeypatch.setenv('OUTPUT_COMPRESSION', 'bz2')
+        with pytest.raises(ValueError, match="OUTPUT_COMPRESSION must be"):
+            Config().validate()
+    
+    
+    def test_validate_invalid_collector(self, monkeypatch):
+        """Test validation fails with an unknown collector."""
+        monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
+        monkeypatch.setenv('COLLECTOR', 'rsync')
+        
+        config = Config()
+        
+        with pytest.raises(ValueError, match="COLLECTOR must be 'api' or 'exec'"):
+            config.validate()
+    
+    def test_validate_ctids_without_proxmox_host(self, monkeypatch):
+        """Test PROXMOX_CTIDS requires PROXMOX_HOST."""
+        monkeypatch.setenv('TARGET_HOSTS', '192.168.1.1')
+        monkeypatch.delenv('PROXMOX_HOST', raising=False)
+        monkeypatch.setenv('PROXMOX_CTIDS', '101')
+        
+        config = Config()
+        
+        with pytest.raises(ValueError, match="PROXMOX_HOST must be specified"):
             config.validate()
-
 
 class TestLoadConfig:
     """Test suite for load_config function."""
@@ -0,0 +1,307 @@
+"""Unit tests for connection_pool.py module."""
+
+import socket
+import threading
+
+import paramiko
+import pytest
+from unittest.mock import Mock, patch
+
+import connection_pool
+from connection_pool import ConnectionPool, get_default_pool, parse_jump_host
+from docker_inspector import SSHConnectionError, inspect_host
+
+
+def _fake_connect(inspector):
+    inspector.ssh_client = Mock()
+    inspector.ssh_client.get_transport.return_value.is_active.return_value = True
+
+
+def _fake_connect_docker(inspector):
+    inspector.docker_client = Mock()
+
+
+@pytest.fixture
+def fake_connections():
+    """Patch DockerInspector so connections are mocks; yield connect mock."""
+    with patch('docker_inspector.DockerInspector.connect',
+               autospec=True, side_effect=_fake_connect) as connect, \
+            patch('docker_inspector.DockerInspector.connect_docker',
+                  autospec=True, side_effect=_fake_connect_docker):
+        yield connect
+
+
+class TestConnectionPool:
+    """Test suite for ConnectionPool."""
+    
+    def test_reuses_released_connection(self, fake_connections):
+        """Test back-to-back checkouts share one SSH connection."""
+        pool = ConnectionPool()
+        
+        with pool.connection('10.0.0.1', 'root') as first:
+            pass
+        with pool.connection('10.0.0.1', 'root', container_workers=4) as second:
+            pass
+        
+        assert first is second
+        assert second.container_workers == 4
+        assert fake_connections.call_count == 1
+        second.docker_client.ping.assert_called_once()
+        assert len(pool) == 1
+    
+    def test_keyed_by_identity(self, fake_connections):
+        """Test different hosts, users and keys get separate connections."""
+        pool = ConnectionPool()
+        
+        for host, user, key in [('a', 'root', None), ('b', 'root', None),
+                                ('a', 'admin', None), ('a', 'root', '/k')]:
+            with pool.connection(host, user, ssh_key_path=key):
+                pass
+        
+        assert fake_connections.call_count == 4
+        assert len(pool) == 4
+    
+    def test_concurrent_checkouts_are_exclusive(self, fake_connections):
+        """Test a checked-out connection is not handed out twice."""
+        pool = ConnectionPool()
+        
+        with pool.connection('10.0.0.1', 'root') as first:
+            with pool.connection('10.0.0.1', 'root') as second:
+                assert first is not second
+        
+        assert len(pool) == 2
+    
+    def test_lru_eviction(self, fake_connections):
+        """Test the least recently used idle connection is closed when full."""
+        pool = ConnectionPool(max_size=2)
+        inspectors = []
+        for host in ['a', 'b', 'c']:
+            with pool.connection(host, 'root') as inspector:
+                inspectors.append(inspector)
+        
+        assert len(pool) == 2
+        assert inspectors[0].ssh_client is None
+        assert inspectors[2].ssh_client is not None
+    
+    def test_max_size_zero_disables_pooling(self, fake_connections):
+        """Test a zero-size pool closes every connection after use."""
+        pool = ConnectionPool(max_size=0)
+        
+        with pool.connection('10.0.0.1', 'root') as inspector:
+            pass
+        
+        assert len(pool) == 0
+        assert inspector.ssh_client is None
+    
+    def test_idle_timeout_and_lifetime(self, fake_connections):
+        """Test idle and over-age connections are not reused."""
+        pool = ConnectionPool(idle_timeout=10, max_lifetime=100)
+        
+        with patch('connection_pool.time.monotonic', return_value=0):
+            with pool.connection('10.0.0.1', 'root') as first:
+                pass
+        with patch('connection_pool.time.monotonic', return_value=11):
+            with pool.connection('10.0.0.1', 'root') as second:
+                pass
+        
+        assert second is not first
+        assert first.ssh_client is None
+        
+        with patch('connection_pool.time.monotonic', return_value=90):
+            with pool.connection('10.0.0.1', 'root') as third:
+                pass
+        with patch('connection_pool.time.monotonic', return_value=112):
+            with pool.connection('10.0.0.1', 'root') as fourth:
+                pass
+        
+        assert third is not second
+        assert fourth is not third
+    
+    def test_dead_connection_replaced(self, fake_connections):
+        """Test a connection failing its health check is reconnected."""
+        pool = ConnectionPool()
+        
+        with pool.connection('10.0.0.1', 'root') as first:
+            pass
+        first.docker_client.ping.side_effect = OSError("broken pipe")
+        
+        with pool.connection('10.0.0.1', 'root') as second:
+            pass
+        
+        assert second is not first
+        assert first.ssh_client is None
+    
+    def test_failed_scan_discards_connection(self, fake_connections):
+        """Test an exception in the block closes the connection."""
+        pool = ConnectionPool()
+        
+        with pytest.raises(RuntimeError):
+            with pool.connection('10.0.0.1', 'root') as inspector:
+                raise RuntimeError("scan failed")
+        
+        assert len(pool) == 0
+        assert inspector.ssh_client is None
+    
+    def test_connect_failure_propagates(self):
+        """Test SSH errors surface and nothing is pooled."""
+        pool = ConnectionPool()
+        
+        with patch('docker_inspector.DockerInspector.connect',
+                   side_effect=SSHConnectionError("refused")):
+            with pytest.raises(SSHConnectionError):
+                pool.acquire('10.0.0.1', 'root')
+        
+        assert len(pool) == 0
+    
+    def test_close_all(self, fake_connections):
+        """Test close_all closes idle connections."""
+        pool = ConnectionPool()
+        with pool.connection('10.0.0.1', 'root') as inspector:
+            pass
+        
+        pool.close_all()
+        
+        assert len(pool) == 0
+        assert inspector.ssh_client is None
+
+
+class TestInspectHostPooling:
+    """Test suite for pooled inspect_host calls."""
+    
+    def test_back_to_back_scans_reuse_connection(self, fake_connections):
+        """Test repeated inspect_host calls share the default pool."""
+        pool = ConnectionPool()
+        
+        with patch.object(connection_pool, '_default_pool', pool), \
+                patch('docker_inspector.DockerInspector.inspect_all_containers',
+                      return_value=[]):
+            assert get_default_pool() is pool
+            inspect_host('10.0.0.1', 'root')
+            inspect_host('10.0.0.1', 'root')
+        
+        assert fake_connections.call_count == 1
+        assert len(pool) == 1
+
+
+class _JumpServer(paramiko.ServerInterface):
+    """SSH server accepting a test key and direct-tcpip channels."""
+    
+    def __init__(self, key):
+        self.key = key
+        self.destinations = []
+    
+    def get_allowed_auths(self, username):
+        return 'publickey'
+    
+    def check_auth_publickey(self, username, key):
+        if key.get_base64() == self.key.get_base64():
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+    
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+    
+    def check_channel_direct_tcpip_request(self, chanid, origin, destination):
+        self.destinations.append(destination)
+        return paramiko.OPEN_SUCCEEDED
+
+
+@pytest.fixture
+def bastion(tmp_path):
+    """Yield (address, server) of a loopback bastion fronting fake targets.
+    
+    Every direct-tcpip channel opened on the bastion is served by a fresh
+    in-process SSH server speaking over that channel.
+    """
+    key = paramiko.RSAKey.generate(1024)
+    key_path = tmp_path / 'id_rsa'
+    key.write_private_key_file(str(key_path))
+    server = _JumpServer(key)
+    server.key_path = str(key_path)
+    handshakes = []
+    server.handshakes = handshakes
+    transports = []
+    
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen()
+    
+    def serve_target(transport):
+        while True:
+            chan = transport.accept(5)
+            if chan is None:
+                return
+            target = paramiko.Transport(chan)
+            target.add_server_key(key)
+            target.start_server(server=_JumpServer(key))
+            transports.append(target)
+    
+    def serve():
+        while True:
+            try:
+                sock, _ = listener.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(sock)
+            transport.add_server_key(key)
+            transport.start_server(server=server)
+            handshakes.append(transport)
+            transports.append(transport)
+            threading.Thread(
+                target=serve_target, args=(transport,), daemon=True
+            ).start()
+    
+    threading.Thread(target=serve, daemon=True).start()
+    yield f"127.0.0.1:{listener.getsockname()[1]}", server
+    
+    listener.close()
+    for transport in transports:
+        transport.close()
+
+
+class TestJumpHosts:
+    """Test suite for bastion support in the pool."""
+    
+    def test_parse_jump_host(self):
+        """Test ProxyJump-style specifications are split."""
+        assert parse_jump_host('bastion') == (None, 'bastion', None)
+        assert parse_jump_host('ops@bastion:2222') == ('ops', 'bastion', 2222)
+        for spec in ('bastion:ssh', 'ops@', 'bastion:'):
+            with pytest.raises(SSHConnectionError, match="Invalid jump host"):
+                parse_jump_host(spec)
+    
+    def test_targets_share_one_bastion_connection(self, bastion):
+        """Test several targets tunnel through a single bastion handshake."""
+        address, server = bastion
+        pool = ConnectionPool()
+        
+        try:
+            inspectors = [
+                pool.acquire(
+                    host, 'root',
+                    ssh_key_path=server.key_path,
+                    connect_docker=False,
+                    jump_host=f"ops@{address}"
+                )
+                for host in ['10.0.1.5', '10.0.2.7']
+            ]
+            
+            assert len(server.handshakes) == 1
+            assert server.destinations == [('10.0.1.5', 22), ('10.0.2.7', 22)]
+            assert all(
+                i.ssh_client.get_transport().is_active() for i in inspectors
+            )
+            assert inspectors[0].jump_client is inspectors[1].jump_client
+            
+            for inspector in inspectors:
+                pool.release(inspector)
+            
+            # Direct and tunnelled connections to one address are not shared
+            assert pool.make_key('10.0.1.5', 'root') != pool.make_key(
+                '10.0.1.5', 'root', jump_host=f"ops@{address}"
+            )
+        finally:
+            pool.close_all()
+        
+        assert len(pool) == 0
+        assert inspectors[0].jump_client.get_transport() is None
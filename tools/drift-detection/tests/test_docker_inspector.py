@@ -1,7 +1,9 @@
 """Unit tests for docker_inspector.py module."""
 
+import json
+
 import pytest
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import Mock, patch, call
 from datetime import datetime
 
 from docker_inspector import (
@@ -9,7 +11,12 @@ from docker_inspector import (
     ContainerInfo,
     SSHConnectionError,
     DockerConnectionError,
-    ContainerInspectionError
+    ContainerInspectionError,
+    inspect_host,
+    inspect_multiple_hosts,
+    iter_hosts,
+    loads_json,
+    parse_container_attrs
 )
 
 
@@ -59,6 +66,123 @@ class TestContainerInfo:
         assert result['container_id'] == "abc123"
         assert result['name'] == "test"
         assert result['started'] is None
+    
+    
+    def test_container_info_from_dict(self):
+        """Test ContainerInfo round-trips through to_dict/from_dict."""
+        info = ContainerInfo(
+            container_id="abc123",
+            name="test",
+            image="nginx:latest",
+            status="running",
+            labels={"app": "web"},
+            networks={},
+            volumes=[],
+            environment={},
+            ports={},
+            created="2024-01-01T00:00:00Z",
+            started=None
+        )
+        
+        assert ContainerInfo.from_dict(info.to_dict()) == info
+    
+    def test_container_info_from_dict_without_image_id(self):
+        """Test data written before image_id existed still loads."""
+        data = _inspect_payload_info('abc')
+        
+        assert ContainerInfo.from_dict(data).image_id == ''
+        with pytest.raises(KeyError):
+            ContainerInfo.from_dict({k: v for k, v in data.items() if k != 'name'})
+    
+    def test_container_info_is_slotted(self):
+        """Test instances carry no per-instance __dict__."""
+        info = ContainerInfo.from_dict(_inspect_payload_info('abc'))
+        
+        assert not hasattr(info, '__dict__')
+        with pytest.raises(AttributeError):
+            info.extra = 1
+    
+    def test_to_dict_is_shallow(self):
+        """Test to_dict shares nested structures instead of deep-copying."""
+        info = ContainerInfo.from_dict(
+            dict(_inspect_payload_info('abc'), labels={'app': 'web'})
+        )
+        
+        assert info.to_dict()['labels'] is info.labels
+    
+    def test_fingerprint_ignores_redeploy_fields(self):
+        """Test a redeployed container with the same config keeps its fingerprint."""
+        first = ContainerInfo.from_dict(dict(
+            _inspect_payload_info('abc'),
+            name='web',
+            networks={'app': {'IPAddress': '172.18.0.2', 'Aliases': ['web']}},
+            volumes=[{'source': '/a', 'destination': '/a'},
+                     {'source': '/b', 'destination': '/b'}]
+        ))
+        second = ContainerInfo.from_dict(dict(
+            _inspect_payload_info('def'),
+            name='web',
+            created='2024-02-01T00:00:00Z',
+            started='2024-02-01T00:00:01Z',
+            networks={'app': {'Aliases': ['web'], 'IPAddress': '172.18.0.9'}},
+            volumes=[{'destination': '/b', 'source': '/b'},
+                     {'destination': '/a', 'source': '/a'}]
+        ))
+        
+        assert first.fingerprint() == second.fingerprint()
+        
+        changed = ContainerInfo.from_dict(
+            dict(_inspect_payload_info('abc'), environment={'TZ': 'UTC'})
+        )
+        assert changed.fingerprint() != ContainerInfo.from_dict(
+            _inspect_payload_info('abc')
+        ).fingerprint()
+    
+    def test_fingerprint_custom_ignore_and_cache(self):
+        """Test a custom ignore-list and that results are cached per list."""
+        info = ContainerInfo.from_dict(
+            dict(_inspect_payload_info('abc'), labels={'hash': '1', 'app': 'web'})
+        )
+        other = ContainerInfo.from_dict(
+            dict(_inspect_payload_info('abc'), labels={'hash': '2', 'app': 'web'})
+        )
+        ignore = {'labels/hash'}
+        
+        assert info.fingerprint(ignore) == other.fingerprint(ignore)
+        assert info.fingerprint() != other.fingerprint()
+        assert info.fingerprint() == info.fingerprint()
+        assert '_fingerprint' not in info.to_dict()
+        assert info == ContainerInfo.from_dict(info.to_dict())
+    
+    def test_named_rule_keeps_wildcard_rule(self):
+        """Test a rule for one key does not replace the '*' rule for it."""
+        from docker_inspector import DEFAULT_FINGERPRINT_IGNORE
+        
+        def info(ip, aliases):
+            return ContainerInfo.from_dict(dict(
+                _inspect_payload_info('abc'),
+                networks={'media': {'IPAddress': ip, 'Aliases': aliases}}
+            ))
+        
+        ignore = DEFAULT_FINGERPRINT_IGNORE | {'networks/media/Aliases'}
+        
+        assert info('10.0.0.2', ['a']).fingerprint(ignore) == \
+            info('10.0.0.3', ['b']).fingerprint(ignore)
+    
+    def test_parsed_strings_are_interned(self):
+        """Test repeated strings are shared between parsed containers."""
+        first, second = (
+            parse_container_attrs(json.loads(json.dumps(
+                _inspect_payload(cid, cid)
+            )))
+            for cid in ('abc', 'def')
+        )
+        
+        assert first.image is second.image
+        key_a, = first.environment
+        key_b, = second.environment
+        assert key_a is key_b
+        assert first.environment['A'] is second.environment['A']
 
 
 class TestDockerInspectorInit:
@@ -76,6 +200,7 @@ class TestDockerInspectorInit:
         assert inspector.ssh_key_path is None
         assert inspector.ssh_timeout == 10
         assert inspector.docker_timeout == 30
+        assert inspector.docker_socket == "/var/run/docker.sock"
         assert inspector.ssh_client is None
         assert inspector.docker_client is None
     
@@ -94,7 +219,12 @@ class TestDockerInspectorInit:
         assert inspector.ssh_key_path == "/path/to/key"
         assert inspector.ssh_timeout == 20
         assert inspector.docker_timeout == 60
-
+    
+    
+    def test_init_unknown_collector(self):
+        """Test an unknown collector is rejected."""
+        with pytest.raises(ValueError, match="Unknown collector"):
+            DockerInspector(host="10.0.0.1", username="root", collector="ssh")
 
 class TestDockerInspectorConnect:
     """Test suite for SSH connection methods."""
@@ -139,6 +269,43 @@ class TestDockerInspectorConnect:
         call_kwargs = mock_client.connect.call_args[1]
         assert 'key_filename' not in call_kwargs
     
+    @patch('docker_inspector.paramiko.SSHClient')
+    def test_connect_through_jump_host(self, mock_ssh_client_class):
+        """Test the target is dialled over a direct-tcpip channel."""
+        mock_client = Mock()
+        mock_ssh_client_class.return_value = mock_client
+        jump_client = Mock()
+        transport = jump_client.get_transport.return_value
+        
+        inspector = DockerInspector(
+            host="10.0.1.5",
+            username="root",
+            ssh_port=2222,
+            jump_client=jump_client
+        )
+        
+        inspector.connect()
+        
+        transport.open_channel.assert_called_once_with(
+            'direct-tcpip', ("10.0.1.5", 2222), ('127.0.0.1', 0), timeout=10
+        )
+        call_kwargs = mock_client.connect.call_args[1]
+        assert call_kwargs['sock'] is transport.open_channel.return_value
+        assert call_kwargs['port'] == 2222
+    
+    @patch('docker_inspector.paramiko.SSHClient')
+    def test_connect_jump_host_down(self, mock_ssh_client_class):
+        """Test a dead bastion session raises SSHConnectionError."""
+        jump_client = Mock()
+        jump_client.get_transport.return_value.is_active.return_value = False
+        
+        inspector = DockerInspector(
+            host="10.0.1.5", username="root", jump_client=jump_client
+        )
+        
+        with pytest.raises(SSHConnectionError, match="not active"):
+            inspector.connect()
+    
     @patch('docker_inspector.paramiko.SSHClient')
     def test_connect_authentication_failure(self, mock_ssh_client_class):
         """Test SSH connection with authentication failure."""
@@ -188,29 +355,46 @@ class TestDockerInspectorConnect:
 class TestDockerInspectorDockerConnect:
     """Test suite for Docker connection methods."""
     
-    @patch('docker_inspector.docker.DockerClient')
-    def test_connect_docker_success(self, mock_docker_client_class):
-        """Test successful Docker connection."""
+    @patch('docker_inspector.create_docker_client')
+    def test_connect_docker_success(self, mock_create_client):
+        """Test successful Docker connection over the existing SSH session."""
         mock_docker = Mock()
         mock_docker.ping.return_value = True
-        mock_docker_client_class.return_value = mock_docker
+        mock_create_client.return_value = mock_docker
         
         inspector = DockerInspector(
             host="192.168.1.100",
             username="root"
         )
-        inspector.ssh_client = Mock()  # Simulate SSH connection
+        mock_ssh = Mock()
+        inspector.ssh_client = mock_ssh  # Simulate SSH connection
         
         inspector.connect_docker()
         
-        mock_docker_client_class.assert_called_once_with(
-            base_url="ssh://root@192.168.1.100",
+        mock_create_client.assert_called_once_with(
+            mock_ssh.get_transport.return_value,
+            socket_path="/var/run/docker.sock",
             timeout=30,
-            use_ssh_client=True
+            max_pool_size=10
         )
         mock_docker.ping.assert_called_once()
         assert inspector.docker_client == mock_docker
     
+    @patch('docker_inspector.create_docker_client')
+    def test_connect_docker_custom_socket(self, mock_create_client):
+        """Test Docker connection to a non-default socket path."""
+        inspector = DockerInspector(
+            host="192.168.1.100",
+            username="root",
+            docker_socket="/run/user/1000/docker.sock"
+        )
+        inspector.ssh_client = Mock()
+        
+        inspector.connect_docker()
+        
+        call_kwargs = mock_create_client.call_args[1]
+        assert call_kwargs['socket_path'] == "/run/user/1000/docker.sock"
+    
     def test_connect_docker_no_ssh(self):
         """Test Docker connection without SSH connection."""
         inspector = DockerInspector(
@@ -221,11 +405,11 @@ class TestDockerInspectorDockerConnect:
         with pytest.raises(DockerConnectionError, match="SSH connection not established"):
             inspector.connect_docker()
     
-    @patch('docker_inspector.docker.DockerClient')
-    def test_connect_docker_exception(self, mock_docker_client_class):
+    @patch('docker_inspector.create_docker_client')
+    def test_connect_docker_exception(self, mock_create_client):
         """Test Docker connection with exception."""
         from docker.errors import DockerException
-        mock_docker_client_class.side_effect = DockerException("Docker error")
+        mock_create_client.side_effect = DockerException("Docker error")
         
         inspector = DockerInspector(
             host="192.168.1.100",
@@ -242,25 +426,23 @@ class TestDockerInspectorListContainers:
     
     def test_list_containers_success(self):
         """Test successful container listing."""
-        mock_container1 = Mock()
-        mock_container1.id = "abc123"
-        mock_container2 = Mock()
-        mock_container2.id = "def456"
-        
         inspector = DockerInspector(
             host="192.168.1.100",
             username="root"
         )
         inspector.docker_client = Mock()
-        inspector.docker_client.containers.list.return_value = [
-            mock_container1,
-            mock_container2
+        inspector.docker_client.api.containers.return_value = [
+            {'Id': 'abc123'},
+            {'Id': 'def456'}
         ]
         
         result = inspector.list_containers()
         
         assert result == ["abc123", "def456"]
-        inspector.docker_client.containers.list.assert_called_once_with(all=False)
+        inspector.docker_client.api.containers.assert_called_once_with(
+            all=False, filters=None
+        )
+        inspector.docker_client.containers.get.assert_not_called()
     
     def test_list_containers_including_stopped(self):
         """Test container listing including stopped containers."""
@@ -269,11 +451,30 @@ class TestDockerInspectorListContainers:
             username="root"
         )
         inspector.docker_client = Mock()
-        inspector.docker_client.containers.list.return_value = []
+        inspector.docker_client.api.containers.return_value = []
         
         inspector.list_containers(all_containers=True)
         
-        inspector.docker_client.containers.list.assert_called_once_with(all=True)
+        inspector.docker_client.api.containers.assert_called_once_with(
+            all=True, filters=None
+        )
+    
+    def test_list_containers_with_filters(self):
+        """Test filters are pushed down to the daemon's listing call."""
+        inspector = DockerInspector(
+            host="192.168.1.100",
+            username="root"
+        )
+        inspector.docker_client = Mock()
+        inspector.docker_client.api.containers.return_value = [{'Id': 'abc123'}]
+        filters = {'label': ['com.docker.compose.project=media']}
+        
+        result = inspector.list_containers(filters=filters)
+        
+        assert result == ["abc123"]
+        inspector.docker_client.api.containers.assert_called_once_with(
+            all=False, filters=filters
+        )
     
     def test_list_containers_no_docker_client(self):
         """Test list_containers without Docker connection."""
@@ -294,7 +495,7 @@ class TestDockerInspectorListContainers:
             username="root"
         )
         inspector.docker_client = Mock()
-        inspector.docker_client.containers.list.side_effect = DockerException("Error")
+        inspector.docker_client.api.containers.side_effect = DockerException("Error")
         
         with pytest.raises(ContainerInspectionError, match="Failed to list containers"):
             inspector.list_containers()
@@ -339,7 +540,8 @@ class TestDockerInspectorInspectContainer:
             username="root"
         )
         inspector.docker_client = Mock()
-        inspector.docker_client.containers.get.return_value = mock_container
+        api = inspector.docker_client.api
+        api._get.return_value.content = json.dumps(mock_container.attrs).encode()
         
         result = inspector.inspect_container("abc123")
         
@@ -348,6 +550,10 @@ class TestDockerInspectorInspectContainer:
         assert result.image == "nginx:latest"
         assert result.status == "running"
         assert result.labels == {'app': 'web'}
+        assert result.environment == {'ENV': 'prod', 'DEBUG': 'false'}
+        api._url.assert_called_once_with('/containers/{0}/json', 'abc123')
+        # Raw payload path: no SDK Container model is built
+        inspector.docker_client.containers.get.assert_not_called()
     
     def test_inspect_container_no_docker_client(self):
         """Test inspect_container without Docker connection."""
@@ -368,10 +574,160 @@ class TestDockerInspectorInspectContainer:
             username="root"
         )
         inspector.docker_client = Mock()
-        inspector.docker_client.containers.get.side_effect = NotFound("Not found")
+        inspector.docker_client.api._raise_for_status.side_effect = NotFound(
+            "Not found"
+        )
         
         with pytest.raises(ContainerInspectionError, match="Container .* not found"):
             inspector.inspect_container("nonexistent")
+    
+    
+    def test_inspect_container_invalid_json(self):
+        """Test an undecodable response raises ContainerInspectionError."""
+        inspector = DockerInspector(host="192.168.1.100", username="root")
+        inspector.docker_client = Mock()
+        inspector.docker_client.api._get.return_value.content = b'{"Id": '
+        
+        with pytest.raises(ContainerInspectionError, match="Failed to inspect"):
+            inspector.inspect_container("abc123")
+
+
+class TestLoadsJson:
+    """Test suite for loads_json."""
+    
+    def test_decodes_bytes(self):
+        """Test raw bytes decode to the same document as the stdlib."""
+        data = b'{"Env": ["A=1"], "Labels": {"x": "\\u00e9"}, "n": null}'
+        
+        assert loads_json(data) == json.loads(data)
+    
+    def test_stdlib_fallback(self):
+        """Test decoding still works without orjson installed."""
+        with patch('docker_inspector.orjson', None):
+            assert loads_json(b'[1, 2]') == [1, 2]
+    
+    def test_invalid_raises_value_error(self):
+        """Test both decoders report errors as ValueError."""
+        with pytest.raises(ValueError):
+            loads_json(b'{')
+        with patch('docker_inspector.orjson', None):
+            with pytest.raises(ValueError):
+                loads_json(b'{')
+
+
+def _inspect_payload(container_id, name):
+    """Build a minimal container inspect payload."""
+    return {
+        'Id': container_id,
+        'Name': f'/{name}',
+        'Created': '2024-01-01T00:00:00Z',
+        'Config': {'Image': 'nginx:latest', 'Labels': {}, 'Env': ['A=1']},
+        'State': {'Status': 'running', 'StartedAt': '2024-01-01T00:01:00Z'},
+        'NetworkSettings': {'Networks': {}, 'Ports': {}},
+        'Mounts': []
+    }
+
+
+class TestDockerInspectorBulkInspection:
+    """Test suite for pipelined bulk inspection."""
+    
+    def _inspector(self):
+        inspector = DockerInspector(
+            host="192.168.1.100",
+            username="root"
+        )
+        inspector.ssh_client = Mock()
+        inspector.docker_client = Mock()
+        inspector.docker_client.api.api_version = '1.45'
+        return inspector
+    
+    @patch('docker_inspector.pipelined_get')
+    def test_inspect_containers_single_pipeline(self, mock_pipelined_get):
+        """Test all inspects are sent as one pipelined batch."""
+        import json
+        mock_pipelined_get.return_value = iter([
+            ('/v1.45/containers/abc/json', 200,
+             json.dumps(_inspect_payload('abc', 'web')).encode()),
+            ('/v1.45/containers/def/json', 200,
+             json.dumps(_inspect_payload('def', 'db')).encode()),
+        ])
+        inspector = self._inspector()
+        
+        results, failed = inspector.inspect_containers(['abc', 'def'])
+        
+        assert [c.name for c in results] == ['web', 'db']
+        assert results[0].environment == {'A': '1'}
+        assert failed == []
+        mock_pipelined_get.assert_called_once_with(
+            inspector.ssh_client.get_transport.return_value,
+            ['/v1.45/containers/abc/json', '/v1.45/containers/def/json'],
+            socket_path='/var/run/docker.sock',
+            timeout=30
+        )
+        inspector.docker_client.containers.get.assert_not_called()
+    
+    @patch('docker_inspector.pipelined_get')
+    def test_inspect_containers_partial_failure(self, mock_pipelined_get):
+        """Test containers removed between list and inspect are reported."""
+        import json
+        mock_pipelined_get.return_value = iter([
+            ('/v1.45/containers/abc/json', 404, b'{"message": "No such container"}'),
+            ('/v1.45/containers/def/json', 200,
+             json.dumps(_inspect_payload('def', 'db')).encode()),
+        ])
+        inspector = self._inspector()
+        
+        results, failed = inspector.inspect_containers(['abc', 'def'])
+        
+        assert [c.name for c in results] == ['db']
+        assert failed == ['abc']
+    
+    @patch('docker_inspector.pipelined_get')
+    def test_inspect_containers_channel_failure(self, mock_pipelined_get):
+        """Test transport failures surface as ContainerInspectionError."""
+        mock_pipelined_get.side_effect = paramiko.SSHException("channel closed")
+        inspector = self._inspector()
+        
+        with pytest.raises(ContainerInspectionError, match="Bulk inspection failed"):
+            inspector.inspect_containers(['abc'])
+    
+    @patch('docker_inspector.pipelined_get')
+    def test_inspect_all_containers_uses_list_and_bulk(self, mock_pipelined_get):
+        """Test a host scan is one list request plus one pipelined batch."""
+        import json
+        mock_pipelined_get.return_value = iter([
+            ('/v1.45/containers/abc/json', 200,
+             json.dumps(_inspect_payload('abc', 'web')).encode()),
+        ])
+        inspector = self._inspector()
+        inspector.docker_client.api.containers.return_value = [{'Id': 'abc'}]
+        
+        results = inspector.inspect_all_containers()
+        
+        assert len(results) == 1
+        inspector.docker_client.api.containers.assert_called_once_with(
+            all=False, filters=None
+        )
+        mock_pipelined_get.assert_called_once()
+    
+    @patch('docker_inspector.pipelined_get')
+    def test_iter_containers_yields_errors_in_stream(self, mock_pipelined_get):
+        """Test a failed container is yielded in place, not raised."""
+        mock_pipelined_get.return_value = iter([
+            ('/v1.45/containers/abc/json', 404, b'{"message": "No such container"}'),
+            ('/v1.45/containers/def/json', 200,
+             json.dumps(_inspect_payload('def', 'db')).encode()),
+        ])
+        inspector = self._inspector()
+        inspector.docker_client.api.containers.return_value = [
+            {'Id': 'abc'}, {'Id': 'def'}
+        ]
+        
+        items = list(inspector.iter_containers())
+        
+        assert isinstance(items[0], ContainerInspectionError)
+        assert items[0].container_id == 'abc'
+        assert items[1].name == 'db'
 
 
 class TestDockerInspectorDisconnect:
@@ -421,5 +777,463 @@ class TestDockerInspectorDisconnect:
         inspector.disconnect()  # Should not raise
 
 
+class TestDockerInspectorConcurrentInspection:
+    """Test suite for per-container concurrent inspection."""
+    
+    def _inspector(self, **kwargs):
+        inspector = DockerInspector(
+            host="192.168.1.100",
+            username="root",
+            **kwargs
+        )
+        inspector.ssh_client = Mock()
+        inspector.docker_client = Mock()
+        return inspector
+    
+    @patch('docker_inspector.create_docker_client')
+    def test_pool_sized_for_workers(self, mock_create_client):
+        """Test the channel pool is large enough for every worker."""
+        inspector = DockerInspector(
+            host="192.168.1.100",
+            username="root",
+            container_workers=32
+        )
+        inspector.ssh_client = Mock()
+        
+        inspector.connect_docker()
+        
+        assert mock_create_client.call_args[1]['max_pool_size'] == 32
+    
+    def test_inspections_overlap(self):
+        """Test containers are inspected concurrently and keep list order."""
+        import threading
+        barrier = threading.Barrier(3, timeout=5)
+        inspector = self._inspector(container_workers=3)
+        
+        def fake_inspect(container_id, image_cache=None):
+            barrier.wait()  # Deadlocks unless all three run at once
+            return Mock(name=container_id, container_id=container_id)
+        
+        with patch.object(inspector, 'inspect_container', side_effect=fake_inspect):
+            results, failed = inspector.inspect_containers_concurrently(
+                ['a', 'b', 'c']
+            )
+        
+        assert [r.container_id for r in results] == ['a', 'b', 'c']
+        assert failed == []
+    
+    def test_failures_and_timeouts_reported(self):
+        """Test failed and timed-out containers end up in the failed list."""
+        import threading
+        release = threading.Event()
+        inspector = self._inspector(container_workers=3, container_timeout=0.2)
+        
+        def fake_inspect(container_id, image_cache=None):
+            if container_id == 'gone':
+                raise ContainerInspectionError("Container gone not found")
+            if container_id == 'slow':
+                release.wait(10)
+            return Mock(container_id=container_id)
+        
+        with patch.object(inspector, 'inspect_container', side_effect=fake_inspect):
+            try:
+                results, failed = inspector.inspect_containers_concurrently(
+                    ['ok', 'gone', 'slow']
+                )
+            finally:
+                release.set()
+        
+        assert [r.container_id for r in results] == ['ok']
+        assert failed == ['gone', 'slow']
+    
+    def test_inspect_all_uses_workers(self):
+        """Test inspect_all_containers switches to the worker pool."""
+        inspector = self._inspector(container_workers=4)
+        inspector.docker_client.api.containers.return_value = [{'Id': 'abc'}]
+        
+        with patch.object(
+            inspector, 'inspect_containers_concurrently',
+            return_value=([Mock(container_id='abc')], [])
+        ) as mock_concurrent, patch.object(
+            inspector, 'inspect_containers'
+        ) as mock_bulk:
+            results = inspector.inspect_all_containers()
+        
+        assert len(results) == 1
+        mock_concurrent.assert_called_once_with(['abc'], None)
+        mock_bulk.assert_not_called()
+    
+    
+    def test_iter_containers_completion_order(self):
+        """Test containers are yielded as they finish, timeouts in-stream."""
+        import threading
+        release = threading.Event()
+        inspector = self._inspector(container_workers=2, container_timeout=0.2)
+        inspector.docker_client.api.containers.return_value = [
+            {'Id': 'slow'}, {'Id': 'fast'}
+        ]
+        
+        def fake_inspect(container_id, image_cache=None):
+            if container_id == 'slow':
+                release.wait(10)
+            return Mock(container_id=container_id)
+        
+        with patch.object(inspector, 'inspect_container', side_effect=fake_inspect):
+            try:
+                items = list(inspector.iter_containers())
+            finally:
+                release.set()
+        
+        assert items[0].container_id == 'fast'
+        assert isinstance(items[1], ContainerInspectionError)
+        assert items[1].container_id == 'slow'
+        assert "deadline" in str(items[1])
+
+
+class TestDockerInspectorCachedInspection:
+    """Test suite for incremental inspection with a cache."""
+    
+    def test_only_changed_containers_inspected(self, tmp_path):
+        """Test cached containers are reused and only misses are inspected."""
+        from inspection_cache import InspectionCache
+        
+        inspector = DockerInspector(host="192.168.1.100", username="root")
+        inspector.ssh_client = Mock()
+        inspector.docker_client = Mock()
+        entries = [
+            {'Id': 'abc', 'Created': 1, 'State': 'running', 'ImageID': 'i1'},
+            {'Id': 'def', 'Created': 2, 'State': 'running', 'ImageID': 'i1'},
+        ]
+        inspector.docker_client.api.containers.return_value = entries
+        cache = InspectionCache(str(tmp_path))
+        
+        def fake_bulk(container_ids, image_cache=None):
+            return [
+                ContainerInfo.from_dict(_inspect_payload_info(cid))
+                for cid in container_ids
+            ], []
+        
+        with patch.object(inspector, 'inspect_containers', side_effect=fake_bulk) as bulk:
+            first = inspector.inspect_all_containers(cache=cache)
+            bulk.assert_called_once_with(['abc', 'def'], None)
+            
+            entries[1] = dict(entries[1], State='exited')
+            bulk.reset_mock()
+            second = inspector.inspect_all_containers(cache=cache)
+            bulk.assert_called_once_with(['def'], None)
+            
+            bulk.reset_mock()
+            inspector.docker_client.api.containers.return_value = entries[:1]
+            third = inspector.inspect_all_containers(cache=cache)
+            bulk.assert_not_called()
+        
+        assert [c.container_id for c in first] == ['abc', 'def']
+        assert [c.container_id for c in second] == ['abc', 'def']
+        assert [c.container_id for c in third] == ['abc']
+    
+    
+    def test_filtered_scan_does_not_prune_cache(self, tmp_path):
+        """Test a filtered scan keeps cache entries outside the filter."""
+        inspector = DockerInspector(host="192.168.1.100", username="root")
+        inspector.docker_client = Mock()
+        entries = [{'Id': 'abc', 'Created': 1, 'State': 'running', 'ImageID': 'i1'}]
+        inspector.docker_client.api.containers.return_value = entries
+        cache = Mock()
+        cache.lookup.return_value = ({'abc': ContainerInfo.from_dict(
+            _inspect_payload_info('abc')
+        )}, [])
+        
+        inspector.inspect_all_containers(cache=cache, filters={'name': ['abc']})
+        
+        cache.lookup.assert_called_once_with(
+            "192.168.1.100", entries, strip_image_defaults=False
+        )
+        cache.update.assert_called_once()
+        assert cache.update.call_args.kwargs['prune'] is False
+
+
+def _image_payload(env, labels=None):
+    """Build a minimal image inspect payload."""
+    return json.dumps({'Config': {'Env': env, 'Labels': labels}}).encode()
+
+
+class TestImageDefaultSubtraction:
+    """Test suite for subtracting image defaults with an ImageConfigCache."""
+    
+    def _payload(self, container_id, name):
+        payload = _inspect_payload(container_id, name)
+        payload['Image'] = 'sha256:img'
+        payload['Config']['Env'] = ['PATH=/usr/bin', 'TZ=UTC', 'LANG=C.UTF-8']
+        payload['Config']['Labels'] = {'maintainer': 'nginx', 'app': name}
+        return json.dumps(payload).encode()
+    
+    def _inspector(self, host="192.168.1.100"):
+        inspector = DockerInspector(host=host, username="root")
+        inspector.ssh_client = Mock()
+        inspector.docker_client = Mock()
+        inspector.docker_client.api.api_version = '1.45'
+        inspector.docker_client.api.containers.return_value = [
+            {'Id': 'abc', 'ImageID': 'sha256:img'},
+            {'Id': 'def', 'ImageID': 'sha256:img'},
+        ]
+        return inspector
+    
+    def test_parse_subtracts_equal_values(self):
+        """Test only values that differ from the image are kept."""
+        image_defaults = {
+            'env': {'PATH': '/usr/bin', 'LANG': 'en_US.UTF-8'},
+            'labels': {'maintainer': 'nginx'}
+        }
+        
+        info = parse_container_attrs(
+            json.loads(self._payload('abc', 'web')), image_defaults
+        )
+        
+        assert info.environment == {'TZ': 'UTC', 'LANG': 'C.UTF-8'}
+        assert info.labels == {'app': 'web'}
+        assert info.image_id == 'sha256:img'
+    
+    @patch('docker_inspector.pipelined_get')
+    def test_images_fetched_once_across_hosts(self, mock_pipelined_get):
+        """Test each image is inspected once, then served from the cache."""
+        from image_cache import ImageConfigCache
+        
+        def fake_pipelined_get(transport, paths, **kwargs):
+            for path in paths:
+                if '/images/' in path:
+                    yield path, 200, _image_payload(
+                        ['PATH=/usr/bin', 'LANG=C.UTF-8'], {'maintainer': 'nginx'}
+                    )
+                else:
+                    container_id = path.split('/')[3]
+                    yield path, 200, self._payload(container_id, container_id)
+        
+        mock_pipelined_get.side_effect = fake_pipelined_get
+        image_cache = ImageConfigCache()
+        
+        first = self._inspector().inspect_all_containers(image_cache=image_cache)
+        batches = [c.args[1] for c in mock_pipelined_get.call_args_list]
+        assert batches == [
+            ['/v1.45/images/sha256:img/json'],
+            ['/v1.45/containers/abc/json', '/v1.45/containers/def/json'],
+        ]
+        
+        mock_pipelined_get.reset_mock()
+        second = self._inspector("192.168.1.101").inspect_all_containers(
+            image_cache=image_cache
+        )
+        assert mock_pipelined_get.call_count == 1
+        
+        for info in first + second:
+            assert info.environment == {'TZ': 'UTC'}
+            assert info.labels == {'app': info.name}
+    
+    @patch('docker_inspector.pipelined_get')
+    def test_image_failure_keeps_full_config(self, mock_pipelined_get):
+        """Test containers of an image that cannot be inspected are unchanged."""
+        from image_cache import ImageConfigCache
+        
+        mock_pipelined_get.side_effect = [
+            iter([('/v1.45/images/sha256:img/json', 404, b'{}')]),
+            iter([
+                ('/v1.45/containers/abc/json', 200, self._payload('abc', 'web')),
+                ('/v1.45/containers/def/json', 200, self._payload('def', 'db')),
+            ]),
+        ]
+        image_cache = ImageConfigCache()
+        
+        results = self._inspector().inspect_all_containers(image_cache=image_cache)
+        
+        assert results[0].environment == {
+            'PATH': '/usr/bin', 'TZ': 'UTC', 'LANG': 'C.UTF-8'
+        }
+        assert image_cache.get('sha256:img') is None
+    
+    def test_inspect_container_fetches_missing_image(self):
+        """Test a single inspect looks up the image on a cache miss."""
+        from image_cache import ImageConfigCache
+        
+        inspector = self._inspector()
+        api = inspector.docker_client.api
+        api._get.side_effect = [
+            Mock(content=self._payload('abc', 'web')),
+            Mock(content=_image_payload(['PATH=/usr/bin'])),
+        ]
+        image_cache = ImageConfigCache()
+        
+        info = inspector.inspect_container('abc', image_cache)
+        
+        assert info.environment == {'TZ': 'UTC', 'LANG': 'C.UTF-8'}
+        assert api._url.call_args_list[1] == call('/images/{0}/json', 'sha256:img')
+        assert image_cache.get('sha256:img') == {
+            'env': {'PATH': '/usr/bin'}, 'labels': {}
+        }
+
+
+class TestDockerInspectorExecCollector:
+    """Test suite for the exec collector mode."""
+    
+    @patch('exec_collector.collect_containers')
+    def test_inspect_all_uses_exec(self, mock_collect):
+        """Test the exec collector bypasses the Docker API entirely."""
+        inspector = DockerInspector(
+            host="192.168.1.100", username="root", collector="exec"
+        )
+        inspector.ssh_client = Mock()
+        info = ContainerInfo.from_dict(_inspect_payload_info('abc'))
+        mock_collect.return_value = ([info], [])
+        
+        results = inspector.inspect_all_containers(
+            all_containers=True, filters={'name': ['abc']}
+        )
+        
+        assert results == [info]
+        mock_collect.assert_called_once_with(
+            inspector.ssh_client,
+            "192.168.1.100",
+            all_containers=True,
+            filters={'name': ['abc']},
+            timeout=30
+        )
+    
+    @patch('docker_inspector.DockerInspector.collect_containers')
+    @patch('docker_inspector.DockerInspector.connect_docker')
+    @patch('docker_inspector.DockerInspector.connect')
+    def test_inspect_host_skips_docker_connect(
+        self, mock_connect, mock_connect_docker, mock_collect
+    ):
+        """Test inspect_host only opens the SSH session in exec mode."""
+        mock_collect.return_value = []
+        
+        from connection_pool import ConnectionPool
+        
+        result = inspect_host(
+            "10.0.0.1", "root", collector="exec", pool=ConnectionPool()
+        )
+        
+        assert result['container_count'] == 0
+        mock_connect.assert_called_once()
+        mock_connect_docker.assert_not_called()
+
+def _inspect_payload_info(container_id):
+    """Build a ContainerInfo dict for a container ID."""
+    return {
+        'container_id': container_id,
+        'name': container_id,
+        'image': 'nginx:latest',
+        'status': 'running',
+        'labels': {},
+        'networks': {},
+        'volumes': [],
+        'environment': {},
+        'ports': {},
+        'created': '2024-01-01T00:00:00Z',
+        'started': None
+    }
+
+
+class TestInspectMultipleHosts:
+    """Test suite for inspect_multiple_hosts."""
+    
+    @patch('docker_inspector.inspect_host')
+    def test_results_keep_host_order(self, mock_inspect_host):
+        """Test results follow input order even when hosts finish out of order."""
+        import time
+        
+        def fake_inspect(host, **kwargs):
+            time.sleep({'a': 0.2, 'b': 0.0, 'c': 0.1}[host])
+            return {'host': host, 'container_count': 0, 'containers': []}
+        
+        mock_inspect_host.side_effect = fake_inspect
+        
+        results = inspect_multiple_hosts(
+            ['a', 'b', 'c'], username='root', max_workers=3
+        )
+        
+        assert [h['host'] for h in results['hosts']] == ['a', 'b', 'c']
+        assert 'timestamp' in results
+    
+    @patch('docker_inspector.inspect_host')
+    def test_runs_hosts_concurrently(self, mock_inspect_host):
+        """Test hosts overlap when max_workers allows it."""
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def fake_inspect(host, **kwargs):
+            barrier.wait()  # Deadlocks unless both hosts run at once
+            return {'host': host, 'container_count': 0, 'containers': []}
+        
+        mock_inspect_host.side_effect = fake_inspect
+        
+        results = inspect_multiple_hosts(['a', 'b'], username='root', max_workers=2)
+        
+        assert [h['container_count'] for h in results['hosts']] == [0, 0]
+    
+    @patch('docker_inspector.inspect_host')
+    def test_failed_host_reports_error(self, mock_inspect_host):
+        """Test an unreachable host yields an error entry, not an exception."""
+        def fake_inspect(host, **kwargs):
+            if host == 'bad':
+                raise SSHConnectionError("Failed to connect to bad")
+            return {'host': host, 'container_count': 0, 'containers': []}
+        
+        mock_inspect_host.side_effect = fake_inspect
+        
+        results = inspect_multiple_hosts(['good', 'bad'], username='root')
+        
+        assert 'error' not in results['hosts'][0]
+        assert results['hosts'][1]['host'] == 'bad'
+        assert "Failed to connect" in results['hosts'][1]['error']
+    
+    @patch('docker_inspector.inspect_host')
+    def test_host_deadline(self, mock_inspect_host):
+        """Test a stuck host is reported once its deadline passes."""
+        import threading
+        release = threading.Event()
+        
+        def fake_inspect(host, **kwargs):
+            if host == 'stuck':
+                release.wait(10)
+            return {'host': host, 'container_count': 0, 'containers': []}
+        
+        mock_inspect_host.side_effect = fake_inspect
+        
+        try:
+            results = inspect_multiple_hosts(
+                ['stuck', 'ok'], username='root', max_workers=2, host_timeout=0.2
+            )
+        finally:
+            release.set()
+        
+        assert "deadline" in results['hosts'][0]['error']
+        assert results['hosts'][1]['container_count'] == 0
+    
+    @patch('docker_inspector.inspect_host')
+    def test_iter_hosts_completion_order(self, mock_inspect_host):
+        """Test iter_hosts yields each host as soon as it is done."""
+        import threading
+        release = threading.Event()
+        
+        def fake_inspect(host, **kwargs):
+            if host == 'slow':
+                release.wait(10)
+            if host == 'bad':
+                raise SSHConnectionError("Failed to connect to bad")
+            return {'host': host, 'container_count': 0, 'containers': []}
+        
+        mock_inspect_host.side_effect = fake_inspect
+        
+        stream = iter_hosts(['slow', 'bad', 'ok'], username='root', max_workers=3)
+        try:
+            first = [next(stream), next(stream)]
+        finally:
+            release.set()
+        last = list(stream)
+        
+        assert sorted(h['host'] for h in first) == ['bad', 'ok']
+        assert [h['host'] for h in last] == ['slow']
+        assert "Failed to connect" in next(h for h in first if h['host'] == 'bad')['error']
+
+
 # Import paramiko for exception testing
 import paramiko
@@ -0,0 +1,232 @@
+"""Unit tests for drift_engine.py module."""
+
+import copy
+
+from docker_inspector import ContainerInfo
+from drift_engine import DriftEngine, drift_container
+from fleet_index import FleetIndex
+from image_cache import ImageConfigCache
+
+
+def _baseline(**overrides):
+    values = dict(
+        container_id='',
+        name='plex',
+        image='plexinc/pms-docker:latest',
+        status='',
+        labels={
+            'traefik.enable': 'true',
+            'com.docker.compose.project': 'media',
+            'com.docker.compose.service': 'plex'
+        },
+        networks={'media': {}},
+        volumes=[{'type': 'bind', 'source': '/opt/appdata/plex', 'destination': '/config',
+                  'mode': '', 'rw': True},
+                 {'type': 'volume', 'source': 'media_transcode', 'destination': '/transcode',
+                  'mode': '', 'rw': True}],
+        environment={'TZ': 'Europe/Brussels'},
+        ports={'32400/tcp': [{'HostIp': '', 'HostPort': '32400'}]},
+        created='',
+        started=None
+    )
+    values.update(overrides)
+    return ContainerInfo(**values)
+
+
+def _running(**overrides):
+    """The container compose creates from ``_baseline()``."""
+    info = _baseline(
+        container_id='abc123',
+        status='running',
+        networks={'media': {'IPAddress': '172.18.0.5'}},
+        created='2024-01-01T00:00:00Z'
+    ).to_dict()
+    info['labels'] = dict(info['labels'], **{'com.docker.compose.config-hash': 'f00'})
+    info['volumes'] = copy.deepcopy(info['volumes'])
+    info['volumes'][1]['source'] = '/var/lib/docker/volumes/media_transcode/_data'
+    info['ports'] = {'32400/tcp': [{'HostIp': '0.0.0.0', 'HostPort': '32400'},
+                                   {'HostIp': '::', 'HostPort': '32400'}]}
+    info.update(overrides)
+    return info
+
+
+def _index(running):
+    return FleetIndex.build(
+        {'hosts': [{'host': 'h1', 'containers': [running]}]},
+        {'h1': {'media': [_baseline()]}}
+    )
+
+
+class TestDriftContainer:
+    """Test suite for drift_container."""
+    
+    def test_runtime_details_are_not_drift(self):
+        """Test compose labels, volume paths and wildcard addresses are ignored."""
+        assert drift_container(_running(), _baseline()) == []
+    
+    def test_unpublished_ports_are_not_drift(self):
+        """Test ports exposed by the image but not published are ignored."""
+        running = _running()
+        running['ports'] = dict(running['ports'], **{'443/tcp': None, '80/tcp': []})
+        baseline = _baseline(ports={
+            '32400/tcp': [{'HostIp': '', 'HostPort': '32400'}], '1900/udp': None
+        })
+        
+        assert drift_container(running, baseline) == []
+    
+    def test_reports_expected_and_actual(self):
+        """Test drift records carry the expected and running values."""
+        running = _running(
+            image='plexinc/pms-docker:1.40',
+            environment={'TZ': 'UTC', 'DEBUG': '1'},
+            ports={'32400/tcp': [{'HostIp': '127.0.0.1', 'HostPort': '32400'}]}
+        )
+        running['volumes'] = running['volumes'][:1]
+        
+        changes = drift_container(running, _baseline(), 'h1')
+        
+        assert [(c.kind, c.path, c.old, c.new) for c in changes] == [
+            ('added', ('environment', 'DEBUG'), None, '1'),
+            ('changed', ('environment', 'TZ'), 'Europe/Brussels', 'UTC'),
+            ('changed', ('image',), 'plexinc/pms-docker:latest', 'plexinc/pms-docker:1.40'),
+            ('changed', ('ports', '32400/tcp'), ['32400'], ['127.0.0.1:32400']),
+            ('removed', ('volumes', '/transcode'), {'type': 'volume', 'rw': True}, None),
+        ]
+        assert {(c.host, c.container) for c in changes} == {('h1', 'plex')}
+    
+    def test_image_defaults_left_out_on_both_sides(self):
+        """Test settings equal to the image defaults are not drift."""
+        defaults = {'env': {'TZ': 'Europe/Brussels', 'PATH': '/usr/bin'},
+                    'labels': {'maintainer': 'plex'}}
+        # Scanned with image_cache: TZ matches the image and was subtracted
+        stripped = _running(environment={}, image_id='sha256:pms')
+        # Scanned without it: the image's PATH and label are still present
+        full = _running(environment={'TZ': 'Europe/Brussels', 'PATH': '/usr/bin'},
+                        image_id='sha256:pms')
+        full['labels'] = dict(full['labels'], maintainer='plex')
+        
+        assert drift_container(stripped, _baseline(), image_defaults=defaults) == []
+        assert drift_container(full, _baseline(), image_defaults=defaults) == []
+        assert [c.path for c in drift_container(stripped, _baseline())] == [
+            ('environment', 'TZ')
+        ]
+    
+    def test_home_bind_source(self):
+        """Test ~ sources are not compared, but type and mode still are."""
+        volumes = copy.deepcopy(_baseline().volumes)
+        volumes[0]['source'] = '~/plex'
+        baseline = _baseline(volumes=volumes)
+        
+        assert drift_container(_running(), baseline) == []
+        
+        engine = DriftEngine()
+        index = FleetIndex.build(
+            {'hosts': [{'host': 'h1', 'containers': [_running()]}]},
+            {'h1': {'media': [baseline]}}
+        )
+        assert list(engine.run(index)) == []
+        
+        running = _running()
+        running['volumes'] = copy.deepcopy(running['volumes'])
+        running['volumes'][0]['rw'] = False
+        assert [c.path for c in drift_container(running, baseline)] == [
+            ('volumes', '/config', 'rw')
+        ]
+    
+    def test_runtime_only_settings(self):
+        """Test image settings the baseline does not set are not drift."""
+        running = _running(environment={
+            'TZ': 'Europe/Brussels', 'PATH': '/usr/bin', 'LC_ALL': 'C', 'DEBUG': '1'
+        })
+        running['labels'] = dict(running['labels'], **{
+            'org.opencontainers.image.version': '1.40'
+        })
+        
+        assert [c.path for c in drift_container(running, _baseline())] == [
+            ('environment', 'DEBUG')
+        ]
+        assert len(drift_container(running, _baseline(), runtime_only=())) == 4
+        
+        # A value the baseline does set is still compared
+        baseline = _baseline(environment={'TZ': 'Europe/Brussels', 'PATH': '/bin'})
+        assert [(c.kind, c.path) for c in drift_container(running, baseline)] == [
+            ('added', ('environment', 'DEBUG')),
+            ('changed', ('environment', 'PATH')),
+        ]
+    
+    def test_relative_bind_source(self):
+        """Test relative sources resolve against the compose working directory."""
+        volumes = copy.deepcopy(_baseline().volumes)
+        volumes[0]['source'] = './plex'
+        baseline = _baseline(volumes=volumes)
+        running = _running()
+        running['labels'] = dict(running['labels'], **{
+            'com.docker.compose.project.working_dir': '/opt/appdata'
+        })
+        
+        assert drift_container(running, baseline) == []
+        
+        changes = drift_container(_running(), baseline)
+        assert [(c.path, c.old, c.new) for c in changes] == [
+            (('volumes', '/config', 'source'), './plex', '/opt/appdata/plex')
+        ]
+
+
+class TestDriftEngine:
+    """Test suite for DriftEngine."""
+    
+    def test_reuses_unchanged_pairs(self, tmp_path):
+        """Test a rerun reuses stored results across engine instances."""
+        cache = tmp_path / 'drift.json'
+        running = _running(environment={'TZ': 'UTC'})
+        
+        engine = DriftEngine(cache)
+        first = list(engine.run(_index(running)))
+        assert (engine.computed, engine.reused) == (1, 0)
+        
+        # A restart changes status and addresses, not the fingerprint
+        restarted = _running(environment={'TZ': 'UTC'}, status='exited')
+        engine = DriftEngine(cache)
+        assert list(engine.run(_index(restarted))) == first
+        assert (engine.computed, engine.reused) == (0, 1)
+    
+    def test_recomputes_changed_pairs(self):
+        """Test a changed container is compared again."""
+        engine = DriftEngine()
+        list(engine.run(_index(_running())))
+        
+        changes = list(engine.run(_index(_running(environment={'TZ': 'UTC'}))))
+        
+        assert (engine.computed, engine.reused) == (1, 0)
+        assert [c.path for c in changes] == [('environment', 'TZ')]
+    
+    def test_image_cache(self):
+        """Test the engine looks up the defaults of each container's image."""
+        image_cache = ImageConfigCache()
+        image_cache.put('sha256:pms', {'env': {'TZ': 'Europe/Brussels'}, 'labels': {}})
+        running = _running(environment={}, image_id='sha256:pms')
+        
+        assert list(DriftEngine(image_cache=image_cache).run(_index(running))) == []
+        assert len(list(DriftEngine().run(_index(running)))) == 1
+    
+    def test_runtime_only_change_drops_stored_results(self, tmp_path):
+        """Test results stored with other runtime_only patterns are not reused."""
+        cache = tmp_path / 'drift.json'
+        running = _running(environment={'TZ': 'Europe/Brussels', 'PATH': '/usr/bin'})
+        assert list(DriftEngine(cache).run(_index(running))) == []
+        
+        engine = DriftEngine(cache, runtime_only=())
+        changes = list(engine.run(_index(running)))
+        
+        assert (engine.computed, engine.reused) == (1, 0)
+        assert [c.path for c in changes] == [('environment', 'PATH')]
+    
+    def test_unreadable_cache(self, tmp_path):
+        """Test a corrupt cache file is ignored."""
+        cache = tmp_path / 'drift.json'
+        cache.write_text('{not json')
+        
+        engine = DriftEngine(cache)
+        
+        assert list(engine.run(_index(_running()))) == []
+        assert engine.computed == 1
@@ -0,0 +1,198 @@
+"""Unit tests for exec_collector.py module."""
+
+import gzip
+import json
+import socket
+import threading
+
+import paramiko
+import pytest
+from unittest.mock import Mock
+
+from docker_inspector import ContainerInspectionError, DockerConnectionError
+from exec_collector import build_collect_command, collect_containers
+
+
+def _payload(container_id, name):
+    return {
+        'Id': container_id,
+        'Name': f'/{name}',
+        'Created': '2024-01-01T00:00:00Z',
+        'Config': {'Image': 'nginx:latest', 'Labels': {}, 'Env': []},
+        'State': {'Status': 'running', 'StartedAt': ''},
+        'NetworkSettings': {'Networks': {}, 'Ports': {}},
+    }
+
+
+class _ExecServer(paramiko.ServerInterface):
+    """Minimal SSH server answering every exec request with canned output.
+    
+    The reply is held back until ``acked`` is set, i.e. until the client has
+    received the server's acknowledgement of the exec request: output sent
+    before the ack makes the client fail.
+    """
+    
+    def __init__(self, stdout, stderr=b'', exit_status=0):
+        self.stdout = stdout
+        self.stderr = stderr
+        self.exit_status = exit_status
+        self.commands = []
+        self.acked = threading.Event()
+    
+    def check_auth_none(self, username):
+        return paramiko.AUTH_SUCCESSFUL
+    
+    def get_allowed_auths(self, username):
+        return 'none'
+    
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+    
+    def check_channel_exec_request(self, channel, command):
+        self.commands.append(command.decode())
+        threading.Thread(target=self._reply, args=(channel,)).start()
+        return True
+    
+    def _reply(self, channel):
+        # paramiko acknowledges the exec request after the handler returns
+        if not self.acked.wait(timeout=10):
+            channel.close()
+            return
+        # One byte per packet so the gzip magic straddles reads
+        for i in range(len(self.stdout)):
+            channel.sendall(self.stdout[i:i + 1])
+        channel.sendall_stderr(self.stderr)
+        channel.send_exit_status(self.exit_status)
+        channel.close()
+
+
+@pytest.fixture
+def exec_host():
+    """Yield a factory returning (ssh_client, server) for canned output."""
+    def make(stdout, stderr=b'', exit_status=0):
+        client_sock, server_sock = socket.socketpair()
+        server = _ExecServer(stdout, stderr, exit_status)
+        server_transport = paramiko.Transport(server_sock)
+        server_transport.add_server_key(paramiko.RSAKey.generate(1024))
+        
+        thread = threading.Thread(
+            target=server_transport.start_server,
+            kwargs={'server': server}
+        )
+        thread.start()
+        
+        client_transport = paramiko.Transport(client_sock)
+        client_transport.connect()
+        client_transport.auth_none('root')
+        thread.join()
+        
+        # exec_command() returns once the server has acknowledged the request
+        open_session = client_transport.open_session
+        
+        def open_acked_session(*args, **kwargs):
+            channel = open_session(*args, **kwargs)
+            exec_command = channel.exec_command
+            
+            def exec_and_signal(command):
+                exec_command(command)
+                server.acked.set()
+            
+            channel.exec_command = exec_and_signal
+            return channel
+        
+        client_transport.open_session = open_acked_session
+        
+        created.append((client_transport, server_transport))
+        ssh_client = Mock()
+        ssh_client.get_transport.return_value = client_transport
+        return ssh_client, server
+    
+    created = []
+    yield make
+    
+    for client_transport, server_transport in created:
+        client_transport.close()
+        server_transport.close()
+
+
+class TestBuildCollectCommand:
+    """Test suite for build_collect_command."""
+    
+    def test_running_containers(self):
+        """Test the default command lists running containers and gzips."""
+        command = build_collect_command()
+        
+        assert 'docker ps -q --no-trunc)' in command
+        assert 'docker inspect $ids' in command
+        assert 'gzip -c' in command
+    
+    def test_filters_and_all(self):
+        """Test filters become quoted --filter flags."""
+        command = build_collect_command(
+            all_containers=True,
+            filters={'label': ['app=web ui'], 'status': 'exited'},
+            compress=False
+        )
+        
+        assert "ps -q --no-trunc -a --filter 'label=app=web ui' " \
+            "--filter status=exited" in command
+        assert 'gzip' not in command
+
+
+class TestCollectContainers:
+    """Test suite for collect_containers."""
+    
+    def test_gzip_output(self, exec_host):
+        """Test compressed output is detected and decompressed."""
+        body = json.dumps([_payload('abc', 'web'), _payload('def', 'db')])
+        ssh_client, server = exec_host(gzip.compress(body.encode()))
+        
+        results, failed = collect_containers(ssh_client, '10.0.0.1')
+        
+        assert [c.name for c in results] == ['web', 'db']
+        assert failed == []
+        assert len(server.commands) == 1
+    
+    def test_plain_output(self, exec_host):
+        """Test uncompressed output from hosts without gzip."""
+        body = json.dumps([_payload('abc', 'web')]).encode()
+        ssh_client, _ = exec_host(body)
+        
+        results, failed = collect_containers(ssh_client, '10.0.0.1')
+        
+        assert [c.container_id for c in results] == ['abc']
+    
+    def test_partial_inspect_failure(self, exec_host):
+        """Test containers found are kept when docker inspect exits non-zero."""
+        body = json.dumps([_payload('abc', 'web'), {'Id': 'broken'}]).encode()
+        ssh_client, _ = exec_host(
+            body, stderr=b'Error: No such object: gone', exit_status=1
+        )
+        
+        results, failed = collect_containers(ssh_client, '10.0.0.1')
+        
+        assert [c.container_id for c in results] == ['abc']
+        assert failed == ['broken']
+    
+    def test_command_failure(self, exec_host):
+        """Test a failing docker CLI raises with its stderr."""
+        ssh_client, _ = exec_host(
+            gzip.compress(b''),
+            stderr=b'docker: command not found',
+            exit_status=127
+        )
+        
+        with pytest.raises(ContainerInspectionError, match="command not found"):
+            collect_containers(ssh_client, '10.0.0.1')
+    
+    def test_truncated_gzip(self, exec_host):
+        """Test a cut-off gzip stream raises ContainerInspectionError."""
+        ssh_client, _ = exec_host(gzip.compress(b'[]' * 100)[:-6])
+        
+        with pytest.raises(ContainerInspectionError, match="Truncated"):
+            collect_containers(ssh_client, '10.0.0.1')
+    
+    def test_not_connected(self):
+        """Test collection without an SSH session."""
+        with pytest.raises(DockerConnectionError):
+            collect_containers(None, '10.0.0.1')
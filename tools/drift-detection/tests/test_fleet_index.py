@@ -0,0 +1,112 @@
+"""Unit tests for fleet_index.py module."""
+
+from docker_inspector import ContainerInfo
+from fleet_index import FleetIndex
+
+
+def _info(name, project=None, service=None, **labels):
+    if project:
+        labels['com.docker.compose.project'] = project
+        labels['com.docker.compose.service'] = service
+    return ContainerInfo(
+        container_id=f'{name}-id', name=name, image='img', status='running',
+        labels=labels, networks={}, volumes=[], environment={}, ports={},
+        created='', started=None
+    )
+
+
+def _entry(host, *containers):
+    return {
+        'host': host,
+        'container_count': len(containers),
+        'containers': [c.to_dict() for c in containers]
+    }
+
+
+def _fleet():
+    results = {'hosts': [
+        _entry(
+            'ct-media-01',
+            _info('plex', 'media', 'plex', **{
+                'com.docker.compose.project.config_files': '/data/compose/1/docker-compose.yml'
+            }),
+            _info('media-worker-1', 'media', 'worker'),
+            _info('media-worker-2', 'media', 'worker'),
+            _info('adhoc', 'scratch', 'shell'),
+            _info('portainer_agent'),
+        ),
+        {'host': 'ct-docker-01', 'error': 'Failed to connect'},
+    ]}
+    baselines = {
+        'ct-media-01': {'media': [
+            _info('plex', 'media', 'plex'),
+            _info('media-worker-1', 'media', 'worker'),
+            _info('sonarr', 'media', 'sonarr'),
+        ]},
+        'ct-docker-01': {'dns': [_info('pihole', 'dns', 'pihole')]},
+    }
+    return FleetIndex.build(results, baselines)
+
+
+class TestFleetIndex:
+    """Test suite for FleetIndex."""
+    
+    def test_matches(self):
+        """Test services are matched by host, project and service."""
+        index = _fleet()
+        
+        matches = list(index.matches())
+        
+        assert [(m.project, m.service, len(m.containers)) for m in matches] == [
+            ('media', 'plex', 1), ('media', 'worker', 2)
+        ]
+        assert matches[0].baseline.name == 'plex'
+        assert index.baseline_for('ct-media-01', matches[1].containers[1]).name == 'media-worker-1'
+        assert index.baseline_for('ct-docker-01', matches[1].containers[1]) is None
+    
+    def test_leftovers(self):
+        """Test missing, unexpected and unmanaged entries."""
+        index = _fleet()
+        
+        # pihole is not missing: its host failed to scan
+        assert index.missing() == [('ct-media-01', 'media', 'sonarr')]
+        assert index.unexpected() == [('ct-media-01', 'scratch', 'shell')]
+        assert [c['name'] for c in index.unmanaged()['ct-media-01']] == ['portainer_agent']
+    
+    def test_filtered_host_has_no_missing(self):
+        """Test a filtered scan does not report services outside the filter."""
+        index = FleetIndex()
+        index.add_host(dict(
+            _entry('ct-media-01', _info('plex', 'media', 'plex')),
+            filters={'label': ['com.docker.compose.service=plex']}
+        ))
+        index.add_baselines('ct-media-01', [
+            _info('plex', 'media', 'plex'), _info('sonarr', 'media', 'sonarr')
+        ])
+        
+        assert index.missing() == []
+        assert len(list(index.matches())) == 1
+    
+    def test_report(self):
+        """Test the serializable summary."""
+        report = _fleet().report()
+        
+        assert report == {
+            'matched': 2,
+            'missing': [{'host': 'ct-media-01', 'project': 'media', 'service': 'sonarr',
+                         'config_files': '/data/compose/1/docker-compose.yml'}],
+            'unexpected': [{'host': 'ct-media-01', 'project': 'scratch', 'service': 'shell'}],
+            'unmanaged': [{'host': 'ct-media-01', 'name': 'portainer_agent'}]
+        }
+    
+    def test_lookups_with_container_info(self):
+        """Test direct lookups and ContainerInfo containers."""
+        index = FleetIndex()
+        running = _info('plex', 'media', 'plex')
+        index.add_container('h1', running)
+        index.add_baselines('h1', [_info('plex', 'media', 'plex')])
+        
+        assert index.containers('h1', 'media', 'plex') == [running]
+        assert index.containers('h2', 'media', 'plex') == []
+        assert index.baseline('h1', 'media', 'plex').name == 'plex'
+        assert index.config_files('h1', 'media') is None
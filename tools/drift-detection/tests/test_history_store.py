@@ -0,0 +1,132 @@
+"""Unit tests for history_store.py module."""
+
+import copy
+
+from history_store import HistoryStore, flatten_container, unflatten_container
+
+
+def _container(name='plex', **overrides):
+    container = {
+        'container_id': f'{name}-id',
+        'name': name,
+        'image': 'plexinc/pms-docker:latest',
+        'status': 'running',
+        'labels': {'app': name},
+        'networks': {'media': {'IPAddress': '172.18.0.2'}},
+        'volumes': [{'type': 'bind', 'source': '/srv', 'destination': '/config',
+                     'mode': 'rw', 'rw': True}],
+        'environment': {'TZ': 'Europe/Paris', 'PLEX_CLAIM': 'claim-1'},
+        'ports': {'32400/tcp': [{'HostIp': '', 'HostPort': '32400'}]},
+        'created': '2024-01-01T00:00:00Z',
+        'started': None
+    }
+    container.update(overrides)
+    return container
+
+
+def _entry(timestamp, *containers, host='ct-media-01'):
+    return {
+        'host': host,
+        'timestamp': timestamp,
+        'container_count': len(containers),
+        'containers': list(containers)
+    }
+
+
+class TestFlatten:
+    """Test suite for container flattening."""
+    
+    def test_round_trip(self):
+        """Test keys containing '/' survive flattening."""
+        container = _container()
+        
+        fields = flatten_container(container)
+        
+        assert 'ports/32400/tcp' in fields
+        assert fields['environment/PLEX_CLAIM'] == '"claim-1"'
+        assert unflatten_container(fields) == container
+
+
+class TestHistoryStore:
+    """Test suite for HistoryStore."""
+    
+    def test_only_changes_are_stored(self, tmp_path):
+        """Test an unchanged rescan writes nothing."""
+        with HistoryStore(tmp_path / 'history.db') as store:
+            first = store.record_host(_entry('2024-01-01T00:00:00', _container()))
+            second = store.record_host(_entry('2024-01-01T01:00:00', _container()))
+        
+        assert first == len(flatten_container(_container()))
+        assert second == 0
+    
+    def test_field_history_and_point_in_time(self):
+        """Test a field's history and rebuilding past configurations."""
+        store = HistoryStore(':memory:')
+        changed = _container()
+        changed['environment'] = {'TZ': 'Europe/Paris', 'PLEX_CLAIM': 'claim-2'}
+        
+        store.record_host(_entry('2024-01-01T00:00:00', _container()))
+        assert store.record_host(_entry('2024-02-01T00:00:00', changed)) == 1
+        store.record_host(_entry('2024-03-01T00:00:00'))
+        
+        assert store.field_history('ct-media-01', 'plex', 'environment/PLEX_CLAIM') == [
+            ('2024-01-01T00:00:00', 'claim-1'),
+            ('2024-02-01T00:00:00', 'claim-2'),
+            ('2024-03-01T00:00:00', None),
+        ]
+        assert store.container_at('ct-media-01', 'plex', '2023-12-31T00:00:00') is None
+        assert store.container_at('ct-media-01', 'plex', '2024-01-15T00:00:00') == _container()
+        assert store.container_at('ct-media-01', 'plex', '2024-02-01T00:00:00') == changed
+        assert store.container_at('ct-media-01', 'plex', '2024-03-01T00:00:00') is None
+    
+    def test_removed_key(self):
+        """Test a removed label is gone from later rebuilds."""
+        store = HistoryStore(':memory:')
+        store.record_host(_entry('2024-01-01T00:00:00', _container()))
+        store.record_host(_entry('2024-01-02T00:00:00', _container(labels={})))
+        
+        assert store.container_at('ct-media-01', 'plex', '2024-01-02T00:00:00')['labels'] == {}
+        assert store.changes('2024-01-02T00:00:00') == [{
+            'host': 'ct-media-01', 'container': 'plex', 'path': 'labels/app',
+            'scanned_at': '2024-01-02T00:00:00', 'value': None
+        }]
+    
+    def test_failed_hosts_keep_state(self):
+        """Test an unreachable host does not mark its containers removed."""
+        store = HistoryStore(':memory:')
+        results = {'hosts': [_entry('2024-01-01T00:00:00', _container())]}
+        store.record(results)
+        
+        assert store.record({'hosts': [{'host': 'ct-media-01', 'error': 'timeout'}]}) == 0
+        assert store.record([_entry('2024-01-03T00:00:00', _container())]) == 0
+    
+    def test_filtered_scan_keeps_other_containers(self):
+        """Test containers outside a filtered scan are not recorded as removed."""
+        store = HistoryStore(':memory:')
+        store.record_host(_entry('2024-01-01T00:00:00', _container('plex'), _container('sonarr')))
+        
+        filtered = _entry('2024-01-01T01:00:00', _container('plex'))
+        filtered['filters'] = {'name': ['plex']}
+        assert store.record_host(filtered) == 0
+        assert store.record_host(
+            _entry('2024-01-01T02:00:00', _container('plex'), _container('sonarr'))
+        ) == 0
+        assert store.field_history('ct-media-01', 'sonarr', 'image') == [
+            ('2024-01-01T00:00:00', 'plexinc/pms-docker:latest')
+        ]
+    
+    def test_changes_filtered_by_host_and_time(self):
+        """Test the time range and host filters."""
+        store = HistoryStore(':memory:')
+        store.record([
+            _entry('2024-01-01T00:00:00', _container()),
+            _entry('2024-01-01T00:00:00', _container('db'), host='ct-db-01'),
+        ])
+        moved = copy.deepcopy(_container('db'))
+        moved['image'] = 'postgres:16'
+        store.record([_entry('2024-01-05T00:00:00', moved, host='ct-db-01')])
+        
+        assert [c['path'] for c in store.changes('2024-01-02T00:00:00')] == ['image']
+        assert store.changes('2024-01-01T00:00:00', until='2024-01-04T00:00:00',
+                             host='ct-db-01')[0]['container'] == 'db'
+        assert store.changes('2024-01-01T00:00:00', host='nowhere') == []
@@ -0,0 +1,101 @@
+"""Unit tests for image_cache.py module."""
+
+import os
+
+import pytest
+
+from image_cache import ImageConfigCache, parse_image_config
+
+
+def _defaults(value="1"):
+    return {'env': {'PATH': '/usr/bin', 'V': value}, 'labels': {}}
+
+
+class TestParseImageConfig:
+    """Test suite for parse_image_config."""
+    
+    def test_extracts_env_and_labels(self):
+        """Test Env is split into a mapping and Labels are copied."""
+        attrs = {'Config': {
+            'Env': ['PATH=/usr/bin', 'EMPTY=', 'OPTS=a=b', 'NOVALUE'],
+            'Labels': {'maintainer': 'nginx'}
+        }}
+        
+        assert parse_image_config(attrs) == {
+            'env': {'PATH': '/usr/bin', 'EMPTY': '', 'OPTS': 'a=b'},
+            'labels': {'maintainer': 'nginx'}
+        }
+    
+    def test_missing_config(self):
+        """Test images without Env or Labels yield empty mappings."""
+        assert parse_image_config({'Config': {'Env': None, 'Labels': None}}) == {
+            'env': {}, 'labels': {}
+        }
+        assert parse_image_config({}) == {'env': {}, 'labels': {}}
+
+
+class TestImageConfigCache:
+    """Test suite for ImageConfigCache."""
+    
+    def test_memory_only(self):
+        """Test entries are kept in memory without a cache directory."""
+        cache = ImageConfigCache()
+        cache.put('sha256:a', _defaults())
+        
+        assert cache.get('sha256:a') == _defaults()
+        assert cache.get('sha256:b') is None
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test a new cache reads entries written by a previous one."""
+        ImageConfigCache(tmp_path).put('sha256:a', _defaults())
+        
+        assert ImageConfigCache(tmp_path).get('sha256:a') == _defaults()
+        assert (tmp_path / 'sha256_a.json').exists()
+    
+    def test_missing_deduplicates(self, tmp_path):
+        """Test missing() lists each uncached image once, in order."""
+        cache = ImageConfigCache(tmp_path)
+        cache.put('sha256:b', _defaults())
+        
+        assert cache.missing(
+            ['sha256:c', 'sha256:b', 'sha256:a', 'sha256:c', '']
+        ) == ['sha256:c', 'sha256:a']
+    
+    def test_memory_eviction_is_lru(self):
+        """Test the least recently used entry is dropped first."""
+        cache = ImageConfigCache(max_entries=2)
+        cache.put('sha256:a', _defaults('a'))
+        cache.put('sha256:b', _defaults('b'))
+        cache.get('sha256:a')
+        cache.put('sha256:c', _defaults('c'))
+        
+        assert cache.get('sha256:a') is not None
+        assert cache.get('sha256:b') is None
+        assert cache.get('sha256:c') is not None
+    
+    def test_disk_eviction_is_lru(self, tmp_path):
+        """Test files beyond max_entries are removed oldest access first."""
+        cache = ImageConfigCache(tmp_path, max_entries=2)
+        cache.put('sha256:a', _defaults('a'))
+        cache.put('sha256:b', _defaults('b'))
+        os.utime(tmp_path / 'sha256_a.json', (1, 1))
+        os.utime(tmp_path / 'sha256_b.json', (2, 2))
+        
+        # Reading a through a fresh cache refreshes its access time
+        assert ImageConfigCache(tmp_path, max_entries=2).get('sha256:a')
+        cache.put('sha256:c', _defaults('c'))
+        
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            'sha256_a.json', 'sha256_c.json'
+        ]
+    
+    def test_unreadable_file_is_a_miss(self, tmp_path):
+        """Test a corrupt cache file is ignored."""
+        (tmp_path / 'sha256_a.json').write_bytes(b'{')
+        
+        assert ImageConfigCache(tmp_path).get('sha256:a') is None
+    
+    def test_invalid_size(self):
+        """Test a non-positive max_entries is rejected."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ImageConfigCache(max_entries=0)
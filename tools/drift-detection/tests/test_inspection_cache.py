@@ -0,0 +1,171 @@
+"""Unit tests for inspection_cache.py module."""
+
+import json
+
+from docker_inspector import ContainerInfo
+from inspection_cache import InspectionCache, list_entry_fingerprint
+
+
+def _info(container_id, name="web"):
+    return ContainerInfo(
+        container_id=container_id,
+        name=name,
+        image="nginx:latest",
+        status="running",
+        labels={"app": name},
+        networks={"bridge": {}},
+        volumes=[],
+        environment={"ENV": "prod"},
+        ports={},
+        created="2024-01-01T00:00:00Z",
+        started=None
+    )
+
+
+def _entry(container_id, state="running", image_id="sha256:1"):
+    return {
+        'Id': container_id,
+        'Created': 1704067200,
+        'State': state,
+        'ImageID': image_id,
+        'Status': 'Up 2 hours'
+    }
+
+
+class TestListEntryFingerprint:
+    """Test suite for list_entry_fingerprint."""
+    
+    def test_ignores_volatile_status_text(self):
+        """Test the human-readable uptime does not affect the fingerprint."""
+        entry = _entry('abc')
+        later = dict(entry, Status='Up 3 hours')
+        
+        assert list_entry_fingerprint(entry) == list_entry_fingerprint(later)
+    
+    def test_changes_with_state_and_image(self):
+        """Test state and image changes produce a new fingerprint."""
+        base = list_entry_fingerprint(_entry('abc'))
+        
+        assert list_entry_fingerprint(_entry('abc', state='exited')) != base
+        assert list_entry_fingerprint(_entry('abc', image_id='sha256:2')) != base
+    
+    def test_changes_with_name_and_networks(self):
+        """Test renames and network (dis)connects produce a new fingerprint."""
+        entry = dict(_entry('abc'), Names=['/web'], NetworkSettings={'Networks': {
+            'media': {'NetworkID': 'n1'}, 'bridge': {'NetworkID': 'n0'}
+        }})
+        base = list_entry_fingerprint(entry)
+        
+        assert list_entry_fingerprint(dict(entry, Names=['/web-old'])) != base
+        assert list_entry_fingerprint(dict(entry, NetworkSettings={'Networks': {
+            'bridge': {'NetworkID': 'n0'}
+        }})) != base
+
+
+class TestInspectionCache:
+    """Test suite for InspectionCache."""
+    
+    def test_empty_cache_misses_everything(self, tmp_path):
+        """Test a host with no cache file needs every container inspected."""
+        cache = InspectionCache(str(tmp_path))
+        
+        hits, misses = cache.lookup('10.0.0.1', [_entry('abc'), _entry('def')])
+        
+        assert hits == {}
+        assert misses == ['abc', 'def']
+    
+    def test_round_trip_hits_unchanged(self, tmp_path):
+        """Test unchanged containers are served from the cache."""
+        cache = InspectionCache(str(tmp_path))
+        entries = [_entry('abc'), _entry('def')]
+        cache.update('10.0.0.1', entries, [_info('abc'), _info('def', 'db')])
+        
+        hits, misses = cache.lookup(
+            '10.0.0.1', [_entry('abc'), _entry('def', state='exited'), _entry('new')]
+        )
+        
+        assert list(hits) == ['abc']
+        assert hits['abc'] == _info('abc')
+        assert misses == ['def', 'new']
+    
+    def test_rename_is_a_miss(self, tmp_path):
+        """Test a renamed container is inspected again."""
+        cache = InspectionCache(str(tmp_path))
+        entry = dict(_entry('abc'), Names=['/web'])
+        cache.update('10.0.0.1', [entry], [_info('abc')])
+        
+        hits, misses = cache.lookup('10.0.0.1', [dict(entry, Names=['/frontend'])])
+        
+        assert hits == {}
+        assert misses == ['abc']
+    
+    def test_strip_mode_mismatch_is_a_miss(self, tmp_path):
+        """Test containers cached in the other image-default form are missed."""
+        cache = InspectionCache(str(tmp_path))
+        stripped = ContainerInfo.from_dict(
+            dict(_info('def').to_dict(), defaults_stripped=True)
+        )
+        cache.update('10.0.0.1', [_entry('abc'), _entry('def')], [_info('abc'), stripped])
+        entries = [_entry('abc'), _entry('def')]
+        
+        hits, misses = cache.lookup('10.0.0.1', entries)
+        assert (list(hits), misses) == (['abc'], ['def'])
+        
+        hits, misses = cache.lookup('10.0.0.1', entries, strip_image_defaults=True)
+        assert (list(hits), misses) == (['def'], ['abc'])
+        assert hits['def'].defaults_stripped
+    
+    def test_update_drops_removed_containers(self, tmp_path):
+        """Test containers no longer listed are pruned from the cache."""
+        cache = InspectionCache(str(tmp_path))
+        cache.update('10.0.0.1', [_entry('abc'), _entry('def')],
+                     [_info('abc'), _info('def')])
+        
+        cache.update('10.0.0.1', [_entry('abc')], [_info('abc')])
+        
+        assert list(cache.load('10.0.0.1')) == ['abc']
+    
+    def test_update_without_prune_keeps_unlisted(self, tmp_path):
+        """Test a filtered scan leaves other cached containers alone."""
+        cache = InspectionCache(str(tmp_path))
+        cache.update('10.0.0.1', [_entry('abc'), _entry('def')],
+                     [_info('abc'), _info('def')])
+        
+        cache.update('10.0.0.1', [_entry('abc', state='exited')],
+                     [_info('abc')], prune=False)
+        
+        hits, misses = cache.lookup(
+            '10.0.0.1', [_entry('abc', state='exited'), _entry('def')]
+        )
+        assert list(hits) == ['abc', 'def']
+        assert misses == []
+    
+    def test_hosts_are_isolated(self, tmp_path):
+        """Test each host has its own cache file."""
+        cache = InspectionCache(str(tmp_path))
+        cache.update('10.0.0.1', [_entry('abc')], [_info('abc')])
+        
+        hits, misses = cache.lookup('10.0.0.2', [_entry('abc')])
+        
+        assert hits == {}
+        assert misses == ['abc']
+    
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """Test an unreadable cache file degrades to a full scan."""
+        (tmp_path / '10.0.0.1.json').write_text('{not json')
+        cache = InspectionCache(str(tmp_path))
+        
+        hits, misses = cache.lookup('10.0.0.1', [_entry('abc')])
+        
+        assert hits == {}
+        assert misses == ['abc']
+    
+    def test_version_mismatch_is_ignored(self, tmp_path):
+        """Test a cache from another format version is not trusted."""
+        (tmp_path / '10.0.0.1.json').write_text(json.dumps({
+            'version': 0,
+            'containers': {'abc': {'fingerprint': 'x', 'info': {}}}
+        }))
+        cache = InspectionCache(str(tmp_path))
+        
+        assert cache.load('10.0.0.1') == {}
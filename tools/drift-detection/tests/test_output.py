@@ -0,0 +1,165 @@
+"""Unit tests for output.py module."""
+
+import gzip
+import json
+
+import pytest
+from unittest.mock import patch
+
+import output
+from output import ResultWriter, iter_records, output_path, write_results
+
+
+def _results():
+    container = {
+        'container_id': 'abc',
+        'name': 'web',
+        'image': 'nginx:latest',
+        'status': 'running',
+        'labels': {'app': 'web'},
+        'networks': {},
+        'volumes': [],
+        'environment': {'TZ': 'Europe/Paris'},
+        'ports': {},
+        'created': '2024-01-01T00:00:00Z',
+        'started': None
+    }
+    return {
+        'timestamp': '2024-01-01T00:00:00',
+        'hosts': [
+            {
+                'host': '10.0.0.1',
+                'timestamp': '2024-01-01T00:00:01',
+                'container_count': 1,
+                'containers': [container]
+            },
+            {
+                'host': '10.0.0.2',
+                'error': 'Failed to connect',
+                'timestamp': '2024-01-01T00:00:02'
+            },
+        ]
+    }
+
+
+class TestOutputPath:
+    """Test suite for output_path."""
+    
+    def test_suffixes(self, tmp_path):
+        """Test the format and compression suffixes."""
+        assert output_path(tmp_path, 'scan') == tmp_path / 'scan.ndjson'
+        assert output_path(tmp_path, 'scan', 'json', 'gzip') == tmp_path / 'scan.json.gz'
+        assert output_path(tmp_path, 'scan', 'ndjson', 'zstd') == tmp_path / 'scan.ndjson.zst'
+        assert output_path(tmp_path, 'scan', 'yaml') == tmp_path / 'scan.yaml'
+
+
+class TestResultWriter:
+    """Test suite for ResultWriter."""
+    
+    def test_ndjson_records(self, tmp_path):
+        """Test each host and container becomes one line."""
+        path = tmp_path / 'scan.ndjson'
+        
+        writer = write_results(_results(), path)
+        
+        lines = path.read_bytes().splitlines()
+        assert len(lines) == 3
+        records = [json.loads(line) for line in lines]
+        assert records[0] == {
+            'type': 'host', 'host': '10.0.0.1',
+            'timestamp': '2024-01-01T00:00:01', 'container_count': 1
+        }
+        assert records[1]['type'] == 'container'
+        assert records[1]['host'] == '10.0.0.1'
+        assert records[1]['name'] == 'web'
+        assert records[2]['error'] == 'Failed to connect'
+        assert (writer.hosts_written, writer.containers_written) == (2, 1)
+    
+    def test_ndjson_gzip_round_trip(self, tmp_path):
+        """Test gzip output is detected and read back."""
+        path = tmp_path / 'scan.ndjson.gz'
+        
+        write_results(_results(), path, compression='gzip')
+        
+        assert path.read_bytes()[:2] == b'\x1f\x8b'
+        assert [r['type'] for r in iter_records(path)] == ['host', 'container', 'host']
+    
+    def test_zstd_round_trip(self, tmp_path):
+        """Test zstd output when zstandard is installed."""
+        pytest.importorskip('zstandard')
+        path = tmp_path / 'scan.ndjson.zst'
+        
+        write_results(_results(), path, compression='zstd')
+        
+        assert len(list(iter_records(path))) == 3
+    
+    def test_zstd_unavailable(self, tmp_path):
+        """Test a clear error when zstandard is missing."""
+        with patch.object(output, 'zstandard', None):
+            with pytest.raises(ValueError, match="zstandard"):
+                ResultWriter(tmp_path / 'scan.zst', compression='zstd')
+    
+    def test_pretty_json_matches_json_dump(self, tmp_path):
+        """Test pretty mode writes the same document as json.dump(indent=2)."""
+        path = tmp_path / 'scan.json'
+        results = _results()
+        
+        write_results(results, path, output_format='json', pretty=True)
+        
+        assert path.read_text() == json.dumps(results, indent=2) + '\n'
+    
+    def test_compact_json_streamed(self, tmp_path):
+        """Test hosts written one at a time form a valid compact document."""
+        path = tmp_path / 'scan.json.gz'
+        results = _results()
+        
+        with ResultWriter(
+            path, output_format='json', compression='gzip',
+            timestamp=results['timestamp']
+        ) as writer:
+            for entry in results['hosts']:
+                writer.write_host(entry)
+        
+        data = gzip.decompress(path.read_bytes())
+        assert json.loads(data) == results
+        assert b'\n  ' not in data
+    
+    def test_empty_pretty_json(self, tmp_path):
+        """Test a scan with no hosts is still a valid document."""
+        path = tmp_path / 'scan.json'
+        
+        write_results({'hosts': []}, path, output_format='json', pretty=True)
+        
+        assert json.loads(path.read_text())['hosts'] == []
+    
+    def test_yaml_documents_per_host(self, tmp_path):
+        """Test YAML output is one document per host, without aliases."""
+        yaml = pytest.importorskip('yaml')
+        path = tmp_path / 'scan.yaml'
+        results = _results()
+        container = results['hosts'][0]['containers'][0]
+        # Shared sub-structures must not turn into anchors
+        container['ports'] = container['labels']
+        
+        write_results(results, path, output_format='yaml')
+        
+        text = path.read_text()
+        assert text.count('---') == 2
+        assert '&id' not in text and '*id' not in text
+        assert list(yaml.safe_load_all(text)) == results['hosts']
+        assert text.index('host:') < text.index('container_count:')
+    
+    def test_yaml_unavailable(self, tmp_path):
+        """Test a clear error when PyYAML is missing."""
+        with patch.object(output, 'yaml', None):
+            with pytest.raises(ValueError, match="PyYAML"):
+                ResultWriter(tmp_path / 'scan.yaml', output_format='yaml')
+        
+        assert not (tmp_path / 'scan.yaml').exists()
+    
+    def test_unknown_format(self, tmp_path):
+        """Test unsupported formats are rejected before creating the file."""
+        with pytest.raises(ValueError, match="Unknown output format"):
+            ResultWriter(tmp_path / 'scan.xml', output_format='xml')
+        
+        assert not (tmp_path / 'scan.xml').exists()
@@ -0,0 +1,139 @@
+"""Unit tests for proxmox_proxy.py module."""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+from docker_inspector import (
+    ContainerInfo,
+    ContainerInspectionError,
+    SSHConnectionError,
+)
+from proxmox_proxy import inspect_proxmox_containers, pct_docker_command
+
+
+def _info(container_id):
+    return ContainerInfo(
+        container_id=container_id,
+        name=container_id,
+        image="nginx:latest",
+        status="running",
+        labels={},
+        networks={},
+        volumes=[],
+        environment={},
+        ports={},
+        created="2024-01-01T00:00:00Z",
+        started=None
+    )
+
+
+@pytest.fixture
+def pool():
+    """Yield a mock ConnectionPool handing out one SSH session."""
+    pool = Mock()
+    pool.acquire.return_value.ssh_client = Mock(name='ssh_client')
+    return pool
+
+
+class TestPctDockerCommand:
+    """Test suite for pct_docker_command."""
+    
+    def test_command(self):
+        """Test the docker CLI is wrapped in pct exec."""
+        assert pct_docker_command('101') == 'pct exec 101 -- docker'
+    
+    def test_rejects_non_numeric(self):
+        """Test a container ID cannot inject shell syntax."""
+        with pytest.raises(ValueError):
+            pct_docker_command('101; reboot')
+
+
+class TestInspectProxmoxContainers:
+    """Test suite for inspect_proxmox_containers."""
+    
+    @patch('proxmox_proxy.collect_containers')
+    def test_fans_out_over_one_session(self, mock_collect, pool):
+        """Test every CT is collected on the same session, concurrently."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+        
+        def fake_collect(ssh_client, label, **kwargs):
+            with lock:
+                active.append(label)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(label)
+            return [_info(label)], []
+        
+        mock_collect.side_effect = fake_collect
+        
+        results = inspect_proxmox_containers(
+            'pve', 'root', [101, '102', 103], max_workers=3, pool=pool
+        )
+        
+        assert [h['host'] for h in results['hosts']] == [
+            'pve/101', 'pve/102', 'pve/103'
+        ]
+        assert [h['ctid'] for h in results['hosts']] == [101, 102, 103]
+        assert all(h['container_count'] == 1 for h in results['hosts'])
+        assert max(peak) > 1
+        pool.acquire.assert_called_once()
+        assert pool.acquire.call_args.kwargs['connect_docker'] is False
+        ssh_client = pool.acquire.return_value.ssh_client
+        commands = sorted(
+            c.kwargs['docker_command'] for c in mock_collect.call_args_list
+        )
+        assert commands == [
+            'pct exec 101 -- docker',
+            'pct exec 102 -- docker',
+            'pct exec 103 -- docker',
+        ]
+        assert all(c.args[0] is ssh_client for c in mock_collect.call_args_list)
+        pool.release.assert_called_once_with(pool.acquire.return_value, discard=False)
+    
+    @patch('proxmox_proxy.collect_containers')
+    def test_failed_ct_reports_error(self, mock_collect, pool):
+        """Test one failing CT does not affect the others."""
+        def fake_collect(ssh_client, label, **kwargs):
+            if label == 'pve/102':
+                raise ContainerInspectionError("Error: No such container: 102")
+            return [], []
+        
+        mock_collect.side_effect = fake_collect
+        
+        results = inspect_proxmox_containers('pve', 'root', [101, 102], pool=pool)
+        
+        assert results['hosts'][0]['container_count'] == 0
+        assert 'No such container' in results['hosts'][1]['error']
+    
+    @patch('proxmox_proxy.collect_containers')
+    def test_ct_deadline(self, mock_collect, pool):
+        """Test a slow CT is reported and the session is not pooled."""
+        def fake_collect(ssh_client, label, **kwargs):
+            if label == 'pve/102':
+                time.sleep(0.5)
+            return [], []
+        
+        mock_collect.side_effect = fake_collect
+        
+        results = inspect_proxmox_containers(
+            'pve', 'root', [101, 102], ct_timeout=0.1, pool=pool
+        )
+        
+        assert results['hosts'][0]['container_count'] == 0
+        assert 'deadline' in results['hosts'][1]['error']
+        pool.release.assert_called_once_with(pool.acquire.return_value, discard=True)
+    
+    def test_node_unreachable(self, pool):
+        """Test an SSH failure to the node marks every CT as failed."""
+        pool.acquire.side_effect = SSHConnectionError("Connection refused")
+        
+        results = inspect_proxmox_containers('pve', 'root', [101, 102], pool=pool)
+        
+        assert [h['error'] for h in results['hosts']] == ["Connection refused"] * 2
+        pool.release.assert_not_called()
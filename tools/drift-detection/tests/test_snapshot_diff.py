@@ -0,0 +1,155 @@
+"""Unit tests for snapshot_diff.py module."""
+
+import copy
+
+from snapshot_diff import (
+    Change,
+    diff_container,
+    diff_results,
+    diff_runs,
+)
+from snapshot_store import SnapshotStore
+
+
+def _container(name, **overrides):
+    container = {
+        'container_id': f'{name}-id',
+        'name': name,
+        'image': 'nginx:latest',
+        'status': 'running',
+        'labels': {'app': name},
+        'networks': {'app': {'IPAddress': '172.18.0.2', 'Aliases': [name]}},
+        'volumes': [{'type': 'bind', 'source': '/srv', 'destination': '/data',
+                     'mode': 'rw', 'rw': True}],
+        'environment': {'TZ': 'Europe/Paris'},
+        'ports': {},
+        'created': '2024-01-01T00:00:00Z',
+        'started': None
+    }
+    container.update(overrides)
+    return container
+
+
+def _results(*hosts):
+    return {
+        'timestamp': '2024-01-01T00:00:00',
+        'hosts': [
+            {'host': host, 'container_count': len(containers),
+             'containers': list(containers)}
+            for host, containers in hosts
+        ]
+    }
+
+
+class TestDiffContainer:
+    """Test suite for diff_container."""
+    
+    def test_field_changes(self):
+        """Test env, label, image and volume changes are reported by path."""
+        old = _container('web')
+        new = _container(
+            'web',
+            image='nginx:1.27',
+            labels={},
+            environment={'TZ': 'UTC', 'DEBUG': '1'},
+            volumes=[{'type': 'bind', 'source': '/mnt', 'destination': '/data',
+                      'mode': 'rw', 'rw': True}]
+        )
+        
+        changes = [(c.kind, c.path, c.old, c.new) for c in diff_container(old, new, 'h1')]
+        
+        assert changes == [
+            ('added', ('environment', 'DEBUG'), None, '1'),
+            ('changed', ('environment', 'TZ'), 'Europe/Paris', 'UTC'),
+            ('changed', ('image',), 'nginx:latest', 'nginx:1.27'),
+            ('removed', ('labels', 'app'), 'web', None),
+            ('changed', ('volumes', '/data', 'source'), '/srv', '/mnt'),
+        ]
+    
+    def test_redeploy_fields_ignored(self):
+        """Test IDs, timestamps and addresses of a redeploy are not changes."""
+        new = _container(
+            'web',
+            container_id='other',
+            created='2024-02-01T00:00:00Z',
+            networks={'app': {'IPAddress': '172.18.0.9', 'Aliases': ['web']}}
+        )
+        
+        assert list(diff_container(_container('web'), new)) == []
+        assert [c.path for c in diff_container(
+            _container('web'), new, ignore=frozenset()
+        )] == [('container_id',), ('created',), ('networks', 'app', 'IPAddress')]
+
+
+class TestDiffResults:
+    """Test suite for diff_results and diff_runs."""
+    
+    def _snapshots(self):
+        old = _results(
+            ('h1', [_container('web'), _container('db')]),
+            ('h2', [_container('cache')]),
+            ('h3', [_container('old')]),
+        )
+        new = copy.deepcopy(old)
+        new['hosts'][0]['containers'][1]['environment']['TZ'] = 'UTC'
+        new['hosts'][1] = {'host': 'h2', 'error': 'Failed to connect'}
+        new['hosts'][2]['containers'] = [_container('fresh')]
+        return old, new
+    
+    def test_diff_results(self):
+        """Test host-by-host changes, unavailable hosts and replacements."""
+        old, new = self._snapshots()
+        
+        changes = list(diff_results(old, iter(new['hosts'])))
+        
+        assert [(c.host, c.container, c.kind) for c in changes] == [
+            ('h1', 'db', 'changed'),
+            ('h2', None, 'unavailable'),
+            ('h3', 'fresh', 'added'),
+            ('h3', 'old', 'removed'),
+        ]
+        assert changes[1].new == 'Failed to connect'
+        assert changes[0].to_dict()['path'] == 'environment/TZ'
+    
+    def test_removed_host(self):
+        """Test containers of a host missing from the new scan are removed."""
+        old = _results(('h1', [_container('web')]))
+        
+        changes = list(diff_results(old, _results()))
+        
+        assert changes == [Change('h1', 'web', 'removed', old=_container('web'))]
+    
+    def test_filtered_scan(self, tmp_path):
+        """Test containers outside a filtered scan are neither removed nor added."""
+        full = _results(('h1', [_container('web'), _container('db')]))
+        filtered = _results(('h1', [_container('web', image='nginx:1.27')]))
+        filtered['hosts'][0]['filters'] = {'name': ['web']}
+        store = SnapshotStore(tmp_path)
+        runs = [store.save(full), store.save(filtered), store.save(full)]
+        
+        for old, new, run_pair in ((full, filtered, runs[:2]), (filtered, full, runs[1:])):
+            expected = [('web', 'changed', ('image',))]
+            assert [(c.container, c.kind, c.path) for c in diff_results(old, new)] == expected
+            assert [(c.container, c.kind, c.path)
+                    for c in diff_runs(store, *run_pair)] == expected
+    
+    def test_diff_runs_matches_diff_results(self, tmp_path):
+        """Test the store-backed diff finds the same changes."""
+        old, new = self._snapshots()
+        store = SnapshotStore(tmp_path)
+        old_run = store.save(old)
+        new_run = store.save(new)
+        
+        assert list(diff_runs(store, old_run, new_run)) == list(diff_results(old, new))
+    
+    def test_diff_runs_skips_unchanged_hosts(self, tmp_path):
+        """Test unchanged hosts are compared by hash without loading blobs."""
+        store = SnapshotStore(tmp_path)
+        results = _results(('h1', [_container('web')]))
+        old_run = store.save(results)
+        new_run = store.save(results)
+        
+        for blob in store.objects_dir.glob('*/*'):
+            blob.unlink()
+        
+        assert list(diff_runs(store, old_run, new_run)) == []
@@ -0,0 +1,109 @@
+"""Unit tests for snapshot_store.py module."""
+
+import pytest
+
+from snapshot_store import SnapshotStore
+
+
+def _container(name, image='nginx:latest'):
+    return {
+        'container_id': f'{name}-id',
+        'name': name,
+        'image': image,
+        'status': 'running',
+        'labels': {'app': name},
+        'networks': {},
+        'volumes': [],
+        'environment': {},
+        'ports': {},
+        'created': '2024-01-01T00:00:00Z',
+        'started': None
+    }
+
+
+def _results(*containers, timestamp='2024-01-01T00:00:00'):
+    return {
+        'timestamp': timestamp,
+        'hosts': [
+            {
+                'host': '10.0.0.1',
+                'timestamp': timestamp,
+                'container_count': len(containers),
+                'containers': list(containers)
+            },
+            {'host': '10.0.0.2', 'error': 'Failed to connect', 'timestamp': timestamp},
+        ]
+    }
+
+
+def _blob_count(store):
+    return sum(1 for _ in store.objects_dir.glob('*/*'))
+
+
+class TestSnapshotStore:
+    """Test suite for SnapshotStore."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test a stored run loads back unchanged."""
+        store = SnapshotStore(tmp_path)
+        results = _results(_container('web'), _container('db'))
+        
+        run_id = store.save(results)
+        
+        assert store.runs() == [run_id]
+        assert store.latest() == run_id
+        assert store.load(run_id) == results
+    
+    def test_identical_runs_share_blobs(self, tmp_path):
+        """Test an unchanged scan adds only a manifest."""
+        store = SnapshotStore(tmp_path)
+        store.save(_results(_container('web'), _container('db')))
+        blobs = _blob_count(store)
+        
+        with store.open_run() as writer:
+            writer.write_hosts(_results(_container('web'), _container('db'))['hosts'])
+        
+        assert writer.new_blobs == 0
+        assert _blob_count(store) == blobs
+        assert len(store.runs()) == 2
+    
+    def test_changed_container_adds_one_blob(self, tmp_path):
+        """Test only the changed container is stored again."""
+        store = SnapshotStore(tmp_path)
+        store.save(_results(_container('web'), _container('db')))
+        
+        with store.open_run() as writer:
+            writer.write_hosts(
+                _results(_container('web', 'nginx:1.27'), _container('db'))['hosts']
+            )
+        
+        assert writer.new_blobs == 1
+    
+    def test_failed_run_leaves_no_manifest(self, tmp_path):
+        """Test a run interrupted by an exception is not recorded."""
+        store = SnapshotStore(tmp_path)
+        
+        with pytest.raises(RuntimeError):
+            with store.open_run() as writer:
+                writer.write_hosts(_results(_container('web'))['hosts'])
+                raise RuntimeError("scan aborted")
+        
+        assert store.runs() == []
+    
+    def test_prune_removes_unreferenced_blobs(self, tmp_path):
+        """Test pruning old runs deletes blobs only they referenced."""
+        store = SnapshotStore(tmp_path)
+        store.save(_results(_container('web', 'nginx:1.25')))
+        latest = store.save(_results(_container('web', 'nginx:1.27')))
+        
+        deleted = store.prune(keep=1)
+        
+        # The old container and the old host list
+        assert deleted == 2
+        assert store.runs() == [latest]
+        assert store.load(latest)['hosts'][0]['containers'][0]['image'] == 'nginx:1.27'
+    
+    def test_missing_run(self, tmp_path):
+        """Test loading an unknown run raises KeyError."""
+        with pytest.raises(KeyError):
+            SnapshotStore(tmp_path).load('nope')
@@ -0,0 +1,205 @@
+"""Unit tests for ssh_transport.py module."""
+
+import socket
+import threading
+
+import paramiko
+import pytest
+from unittest.mock import Mock
+
+from ssh_transport import (
+    STREAMLOCAL_CHANNEL_KIND,
+    ParamikoDockerAdapter,
+    StreamlocalHTTPConnectionPool,
+    open_get_stream,
+    open_streamlocal_channel,
+    pipelined_get,
+)
+
+
+class _StreamlocalServer(paramiko.ServerInterface):
+    """Minimal SSH server accepting streamlocal channels."""
+    
+    def __init__(self, accept=True):
+        self.accept = accept
+        self.kinds = []
+    
+    def check_auth_none(self, username):
+        return paramiko.AUTH_SUCCESSFUL
+    
+    def get_allowed_auths(self, username):
+        return 'none'
+    
+    def check_channel_request(self, kind, chanid):
+        self.kinds.append(kind)
+        if self.accept:
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+
+@pytest.fixture
+def ssh_pair():
+    """Yield a connected (client transport, server transport, server) triple."""
+    def make(accept=True):
+        client_sock, server_sock = socket.socketpair()
+        server = _StreamlocalServer(accept=accept)
+        server_transport = paramiko.Transport(server_sock)
+        server_transport.add_server_key(paramiko.RSAKey.generate(1024))
+        
+        thread = threading.Thread(
+            target=server_transport.start_server,
+            kwargs={'server': server}
+        )
+        thread.start()
+        
+        client_transport = paramiko.Transport(client_sock)
+        client_transport.connect()
+        client_transport.auth_none('root')
+        thread.join()
+        
+        created.append((client_transport, server_transport))
+        return client_transport, server_transport, server
+    
+    created = []
+    yield make
+    
+    for client_transport, server_transport in created:
+        client_transport.close()
+        server_transport.close()
+
+
+class TestOpenStreamlocalChannel:
+    """Test suite for open_streamlocal_channel."""
+    
+    def test_channel_round_trip(self, ssh_pair):
+        """Test data flows over an accepted streamlocal channel."""
+        client_transport, server_transport, server = ssh_pair()
+        
+        chan = open_streamlocal_channel(client_transport, timeout=5)
+        server_chan = server_transport.accept(5)
+        
+        chan.sendall(b'GET /_ping HTTP/1.1\r\n\r\n')
+        assert server_chan.recv(1024) == b'GET /_ping HTTP/1.1\r\n\r\n'
+        assert server.kinds == [STREAMLOCAL_CHANNEL_KIND]
+        
+        chan.close()
+    
+    def test_channel_refused(self, ssh_pair):
+        """Test a rejected channel raises SSHException."""
+        client_transport, _, _ = ssh_pair(accept=False)
+        
+        with pytest.raises(paramiko.SSHException):
+            open_streamlocal_channel(client_transport, timeout=5)
+    
+    def test_inactive_transport(self):
+        """Test opening a channel on a closed transport fails fast."""
+        transport = Mock()
+        transport.active = False
+        
+        with pytest.raises(paramiko.SSHException, match="not active"):
+            open_streamlocal_channel(transport)
+
+
+class TestParamikoDockerAdapter:
+    """Test suite for ParamikoDockerAdapter."""
+    
+    def test_get_connection_reuses_pool(self):
+        """Test the adapter keeps one pool per URL on the same transport."""
+        transport = Mock()
+        adapter = ParamikoDockerAdapter(transport, timeout=15, max_pool_size=4)
+        
+        pool = adapter.get_connection('http+docker://localhost/v1.45/info')
+        
+        assert isinstance(pool, StreamlocalHTTPConnectionPool)
+        assert pool.transport is transport
+        assert pool.socket_path == '/var/run/docker.sock'
+        assert adapter.get_connection('http+docker://localhost/v1.45/info') is pool
+    
+    def test_request_url_is_path_only(self):
+        """Test requests are sent with the path, not the placeholder host."""
+        adapter = ParamikoDockerAdapter(Mock())
+        request = Mock(path_url='/v1.45/containers/json?all=1')
+        
+        assert adapter.request_url(request, {}) == '/v1.45/containers/json?all=1'
+
+
+class TestPipelinedGet:
+    """Test suite for pipelined_get."""
+    
+    def test_responses_in_request_order(self, ssh_pair):
+        """Test pipelined responses (length and chunked) are split correctly."""
+        client_transport, server_transport, _ = ssh_pair()
+        received = []
+        
+        def serve():
+            chan = server_transport.accept(5)
+            reader = chan.makefile('rb')
+            for _ in range(3):
+                request_line = reader.readline()
+                while reader.readline() != b'\r\n':
+                    pass
+                path = request_line.split()[1]
+                received.append(path)
+                if path.endswith(b'/missing/json'):
+                    chan.sendall(
+                        b'HTTP/1.1 404 Not Found\r\nContent-Length: 2\r\n\r\n{}'
+                    )
+                else:
+                    chan.sendall(
+                        b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+                        b'3\r\n{"a\r\n' + b'7\r\n": "' + path[-6:-5] + b'"}\r\n'
+                        b'0\r\n\r\n'
+                    )
+        
+        server_thread = threading.Thread(target=serve)
+        server_thread.start()
+        
+        paths = ['/v1.45/containers/x/json', '/v1.45/containers/missing/json',
+                 '/v1.45/containers/y/json']
+        results = list(pipelined_get(client_transport, paths, timeout=5))
+        server_thread.join()
+        
+        assert results == [
+            (paths[0], 200, b'{"a": "x"}'),
+            (paths[1], 404, b'{}'),
+            (paths[2], 200, b'{"a": "y"}'),
+        ]
+        assert received == [p.encode() for p in paths]
+    
+    def test_no_paths_opens_no_channel(self):
+        """Test an empty batch does not touch the transport."""
+        transport = Mock()
+        
+        assert list(pipelined_get(transport, [])) == []
+        transport.assert_not_called()
+
+
+class TestOpenGetStream:
+    """Test suite for open_get_stream."""
+    
+    def test_chunked_lines_stream_until_close(self, ssh_pair):
+        """Test a chunked event stream can be read line by line."""
+        client_transport, server_transport, _ = ssh_pair()
+        
+        def serve():
+            chan = server_transport.accept(5)
+            reader = chan.makefile('rb')
+            while reader.readline() != b'\r\n':
+                pass
+            chan.sendall(
+                b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+                b'8\r\n{"a": 1}\r\n1\r\n\n\r\n'
+                b'9\r\n{"b": 2}\n\r\n'
+            )
+        
+        server_thread = threading.Thread(target=serve)
+        server_thread.start()
+        
+        chan, response = open_get_stream(client_transport, '/v1.45/events', timeout=5)
+        server_thread.join()
+        
+        assert response.status == 200
+        assert response.readline() == b'{"a": 1}\n'
+        assert response.readline() == b'{"b": 2}\n'
+        
+        chan.close()
@@ -0,0 +1,192 @@
+"""Unit tests for watcher.py module."""
+
+import json
+import queue
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from unittest.mock import Mock, patch
+
+from docker_inspector import ContainerInfo, ContainerInspectionError
+from watcher import ContainerWatcher
+
+
+def _info(container_id, status="running"):
+    return ContainerInfo(
+        container_id=container_id,
+        name=container_id,
+        image="nginx:latest",
+        status=status,
+        labels={},
+        networks={},
+        volumes=[],
+        environment={},
+        ports={},
+        created="2024-01-01T00:00:00Z",
+        started=None
+    )
+
+
+def _event(action, container_id):
+    return {'Type': 'container', 'Action': action, 'Actor': {'ID': container_id}}
+
+
+class _FakeEventResponse:
+    """HTTP response stand-in whose lines are fed from a queue."""
+    
+    def __init__(self):
+        self.lines = queue.Queue()
+    
+    def push(self, event):
+        self.lines.put(json.dumps(event).encode() + b'\n')
+    
+    def readline(self):
+        return self.lines.get(timeout=5)
+
+
+@pytest.fixture
+def inspector():
+    """Mock DockerInspector with one running container."""
+    inspector = Mock()
+    inspector.host = "192.168.1.100"
+    inspector.docker_timeout = 5
+    inspector.inspect_all_containers.return_value = [_info('abc')]
+    return inspector
+
+
+class TestContainerWatcherEvents:
+    """Test suite for applying events to the live map."""
+    
+    def test_start_event_adds_container(self, inspector):
+        """Test a started container is inspected and added."""
+        inspector.inspect_container.return_value = _info('new')
+        watcher = ContainerWatcher(inspector)
+        
+        watcher._handle_event(_event('start', 'new'))
+        
+        assert watcher.get('new') == _info('new')
+        inspector.inspect_container.assert_called_once_with('new')
+    
+    def test_destroy_removes_without_inspect(self, inspector):
+        """Test a destroyed container is dropped without an API call."""
+        watcher = ContainerWatcher(inspector)
+        watcher._containers = {'abc': _info('abc')}
+        
+        watcher._handle_event(_event('destroy', 'abc'))
+        
+        assert watcher.snapshot() == {}
+        inspector.inspect_container.assert_not_called()
+    
+    def test_die_drops_unless_all_containers(self, inspector):
+        """Test stopped containers leave the map unless all_containers is set."""
+        inspector.inspect_container.return_value = _info('abc', status='exited')
+        
+        running_only = ContainerWatcher(inspector)
+        running_only._containers = {'abc': _info('abc')}
+        running_only._handle_event(_event('die', 'abc'))
+        
+        everything = ContainerWatcher(inspector, all_containers=True)
+        everything._handle_event(_event('die', 'abc'))
+        
+        assert running_only.get('abc') is None
+        assert everything.get('abc').status == 'exited'
+    
+    def test_vanished_container_is_dropped(self, inspector):
+        """Test a container that disappears before re-inspection is removed."""
+        inspector.inspect_container.side_effect = ContainerInspectionError("gone")
+        watcher = ContainerWatcher(inspector)
+        watcher._containers = {'abc': _info('abc')}
+        
+        watcher._handle_event(_event('update', 'abc'))
+        
+        assert watcher.get('abc') is None
+    
+    def test_network_events_reinspect_container(self, inspector):
+        """Test connect/disconnect re-inspect the container they name."""
+        connected = ContainerInfo.from_dict(
+            dict(_info('abc').to_dict(), networks={'media': {}})
+        )
+        inspector.inspect_container.return_value = connected
+        watcher = ContainerWatcher(inspector)
+        watcher._containers = {'abc': _info('abc')}
+        
+        watcher._handle_event({
+            'Type': 'network', 'Action': 'connect',
+            'Actor': {'ID': 'net1', 'Attributes': {'container': 'abc', 'name': 'media'}}
+        })
+        watcher._handle_event({
+            'Type': 'network', 'Action': 'destroy', 'Actor': {'ID': 'net2'}
+        })
+        
+        assert watcher.get('abc').networks == {'media': {}}
+        inspector.inspect_container.assert_called_once_with('abc')
+    
+    def test_subscribes_to_network_events(self, inspector):
+        """Test the events query covers network connect and disconnect."""
+        inspector.docker_client.api.api_version = '1.45'
+        response = Mock(status=200)
+        with patch('watcher.open_get_stream', return_value=(Mock(), response)) as stream:
+            ContainerWatcher(inspector)._open_events()
+        
+        path = stream.call_args.args[1]
+        filters = json.loads(parse_qs(urlparse(path).query)['filters'][0])
+        assert filters['type'] == ['container', 'network']
+        assert {'connect', 'disconnect', 'start'} <= set(filters['event'])
+    
+    def test_callback_receives_changes(self, inspector):
+        """Test on_change is called with the action and new info."""
+        inspector.inspect_container.return_value = _info('abc')
+        changes = []
+        watcher = ContainerWatcher(
+            inspector, on_change=lambda *args: changes.append(args)
+        )
+        
+        watcher._handle_event(_event('update', 'abc'))
+        watcher._handle_event(_event('destroy', 'abc'))
+        
+        assert changes == [
+            ('update', 'abc', _info('abc')),
+            ('destroy', 'abc', None),
+        ]
+
+
+class TestContainerWatcherStream:
+    """Test suite for the background event stream."""
+    
+    def test_stream_updates_snapshot(self, inspector):
+        """Test events read from the stream reach the live map."""
+        response = _FakeEventResponse()
+        channel = Mock()
+        inspector.inspect_container.return_value = _info('def')
+        applied = queue.Queue()
+        
+        watcher = ContainerWatcher(
+            inspector, on_change=lambda *args: applied.put(args)
+        )
+        with patch.object(watcher, '_open_events', return_value=(channel, response)):
+            watcher.start()
+        
+        assert set(watcher.snapshot()) == {'abc'}
+        
+        response.push(_event('start', 'def'))
+        applied.get(timeout=5)
+        
+        assert set(watcher.snapshot()) == {'abc', 'def'}
+        
+        response.lines.put(b'')  # EOF, as after the channel is closed
+        watcher.stop()
+        
+        channel.close.assert_called_once()
+        assert not watcher.running
+    
+    def test_snapshot_failure_closes_channel(self, inspector):
+        """Test the event channel is released if the initial scan fails."""
+        inspector.inspect_all_containers.side_effect = ContainerInspectionError("boom")
+        channel = Mock()
+        watcher = ContainerWatcher(inspector)
+        
+        with patch.object(watcher, '_open_events', return_value=(channel, Mock())):
+            with pytest.raises(ContainerInspectionError):
+                watcher.start()
+        
+        channel.close.assert_called_once()
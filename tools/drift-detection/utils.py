@@ -0,0 +1,116 @@
+"""Helpers shared by the inspection, cache and store modules."""
+
+import os
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary file and rename."""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# Marker returned by iter_bounded for items that missed their deadline
+TIMED_OUT = object()
+
+
+def iter_bounded(
+    func: Callable[[Any], Any],
+    items: List[Any],
+    max_workers: int,
+    item_timeout: Optional[float] = None,
+    thread_name_prefix: str = 'inspect'
+) -> Iterator[Tuple[int, Any]]:
+    """Run ``func`` over ``items`` on a bounded pool with per-item deadlines.
+    
+    Outcomes are yielded as soon as each item finishes. Deadlines are
+    measured from when an item starts running, not from when it was queued.
+    Blocking paramiko/Docker calls cannot be interrupted, so workers past
+    their deadline are abandoned and left to their own socket timeouts.
+    
+    Args:
+        func: Callable applied to each item
+        items: Items to process
+        max_workers: Maximum number of items in flight
+        item_timeout: Seconds each item may run (None for no deadline)
+        thread_name_prefix: Name prefix for worker threads
+    
+    Yields:
+        ``(index, outcome)`` in completion order, where outcome is the
+        return value, the exception raised, or ``TIMED_OUT``
+    """
+    started: Dict[int, float] = {}
+    
+    def run(index: int) -> Any:
+        started[index] = time.monotonic()
+        return func(items[index])
+    
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, max_workers),
+        thread_name_prefix=thread_name_prefix
+    )
+    futures = {executor.submit(run, index): index for index in range(len(items))}
+    
+    # Only poll when there are deadlines to enforce
+    poll_interval = min(1.0, item_timeout) if item_timeout else None
+    
+    try:
+        pending = set(futures)
+        while pending:
+            done, pending = wait(
+                pending, timeout=poll_interval, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                error = future.exception()
+                yield futures[future], (
+                    error if error is not None else future.result()
+                )
+            
+            if item_timeout is None:
+                continue
+            
+            now = time.monotonic()
+            for future in list(pending):
+                index = futures[future]
+                if index in started and now - started[index] > item_timeout:
+                    pending.discard(future)
+                    yield index, TIMED_OUT
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_bounded(
+    func: Callable[[Any], Any],
+    items: List[Any],
+    max_workers: int,
+    item_timeout: Optional[float] = None,
+    thread_name_prefix: str = 'inspect'
+) -> List[Any]:
+    """Run ``func`` over ``items`` and wait for every outcome.
+    
+    See ``iter_bounded()`` for the arguments.
+    
+    Returns:
+        List aligned with ``items`` holding each return value, the exception
+        raised, or ``TIMED_OUT``
+    """
+    outcomes = dict(iter_bounded(
+        func,
+        items,
+        max_workers=max_workers,
+        item_timeout=item_timeout,
+        thread_name_prefix=thread_name_prefix
+    ))
+    return [outcomes[index] for index in range(len(items))]
@@ -0,0 +1,267 @@
+"""Event-driven container watch mode.
+
+Instead of polling ``inspect_all_containers()``, a ``ContainerWatcher``
+subscribes to the Docker ``/events`` stream over the inspector's existing
+SSH session and re-inspects only the containers that emitted lifecycle
+events, or were connected to or disconnected from a network, keeping an
+in-memory map of ``ContainerInfo`` current.
+"""
+
+import http.client
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlencode
+
+import paramiko
+
+from docker_inspector import (
+    ContainerInfo,
+    ContainerInspectionError,
+    DockerConnectionError,
+    DockerInspector,
+    loads_json,
+)
+from ssh_transport import open_get_stream
+
+
+logger = logging.getLogger(__name__)
+
+# Container events that can change inspect data
+WATCHED_ACTIONS = (
+    'create',
+    'destroy',
+    'die',
+    'pause',
+    'rename',
+    'start',
+    'unpause',
+    'update',
+)
+
+# Network events that change a container's networks; the container is named
+# in the event's ``Actor.Attributes.container``
+NETWORK_ACTIONS = (
+    'connect',
+    'disconnect',
+)
+
+ChangeCallback = Callable[[str, str, Optional[ContainerInfo]], None]
+
+
+class ContainerWatcher:
+    """Keeps a live map of a host's containers from the Docker event stream.
+    
+    The event stream is opened before the initial snapshot is taken, so no
+    change between the two is missed; events for containers already in the
+    snapshot only cause a redundant re-inspect.
+    """
+    
+    def __init__(
+        self,
+        inspector: DockerInspector,
+        all_containers: bool = False,
+        on_change: Optional[ChangeCallback] = None
+    ) -> None:
+        """Initialize container watcher.
+        
+        Args:
+            inspector: Connected DockerInspector for the host
+            all_containers: If True, keep stopped containers in the map
+            on_change: Optional callback invoked as
+                ``on_change(action, container_id, info)`` after each event;
+                ``info`` is None when the container left the map
+        """
+        self.inspector = inspector
+        self.all_containers = all_containers
+        self.on_change = on_change
+        
+        self.error: Optional[BaseException] = None
+        
+        self._containers: Dict[str, ContainerInfo] = {}
+        self._lock = threading.Lock()
+        self._channel: Optional[paramiko.Channel] = None
+        self._response: Optional[http.client.HTTPResponse] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+    
+    def _open_events(self):
+        """Subscribe to container and network events on a dedicated channel.
+        
+        Returns:
+            Tuple of (channel, HTTP response streaming the events)
+        
+        Raises:
+            DockerConnectionError: If the subscription fails
+        """
+        inspector = self.inspector
+        if not inspector.ssh_client or not inspector.docker_client:
+            raise DockerConnectionError("Docker client not initialized")
+        
+        query = urlencode({'filters': json.dumps({
+            'type': ['container', 'network'],
+            'event': list(WATCHED_ACTIONS + NETWORK_ACTIONS)
+        })})
+        path = f"/v{inspector.docker_client.api.api_version}/events?{query}"
+        
+        try:
+            channel, response = open_get_stream(
+                inspector.ssh_client.get_transport(),
+                path,
+                socket_path=inspector.docker_socket,
+                timeout=inspector.docker_timeout
+            )
+            
+        except (paramiko.SSHException, http.client.HTTPException, OSError) as e:
+            raise DockerConnectionError(
+                f"Failed to subscribe to events on {inspector.host}: {e}"
+            )
+        
+        if response.status != 200:
+            channel.close()
+            raise DockerConnectionError(
+                f"Failed to subscribe to events on {inspector.host}: "
+                f"HTTP {response.status}"
+            )
+        
+        # Events can be hours apart; only stop() ends the stream
+        channel.settimeout(None)
+        
+        return channel, response
+    
+    def start(self) -> 'ContainerWatcher':
+        """Subscribe to events, take the initial snapshot and start watching.
+        
+        Returns:
+            This watcher
+        
+        Raises:
+            DockerConnectionError: If not connected or subscription fails
+            ContainerInspectionError: If the initial snapshot fails
+        """
+        self._stopping.clear()
+        self._channel, self._response = self._open_events()
+        
+        try:
+            containers = self.inspector.inspect_all_containers(
+                all_containers=self.all_containers
+            )
+        except BaseException:
+            self._channel.close()
+            raise
+        
+        with self._lock:
+            self._containers = {c.container_id: c for c in containers}
+        
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f'watch-{self.inspector.host}',
+            daemon=True
+        )
+        self._thread.start()
+        
+        logger.info(
+            f"Watching {len(containers)} container(s) on {self.inspector.host}"
+        )
+        
+        return self
+    
+    def _run(self) -> None:
+        """Consume the event stream until stopped."""
+        try:
+            for line in iter(self._response.readline, b''):
+                if line.strip():
+                    self._handle_event(loads_json(line))
+        except Exception as e:
+            if not self._stopping.is_set():
+                logger.error(f"Event stream on {self.inspector.host} failed: {e}")
+                self.error = e
+            return
+        
+        if not self._stopping.is_set():
+            logger.warning(f"Event stream on {self.inspector.host} ended")
+    
+    def _handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply one container or network event to the live map.
+        
+        Args:
+            event: Decoded Docker event
+        """
+        action = event.get('Action') or event.get('status', '')
+        actor = event.get('Actor', {})
+        if event.get('Type') == 'network':
+            # Network create/destroy events match the filter too
+            if action not in NETWORK_ACTIONS:
+                return
+            container_id = actor.get('Attributes', {}).get('container')
+        else:
+            container_id = actor.get('ID') or event.get('id')
+        if not container_id:
+            return
+        
+        info: Optional[ContainerInfo] = None
+        
+        if action != 'destroy':
+            try:
+                info = self.inspector.inspect_container(container_id)
+            except ContainerInspectionError as e:
+                logger.debug(f"Dropping {container_id[:12]} after {action}: {e}")
+            
+            if info and not self.all_containers and info.status != 'running':
+                info = None
+        
+        with self._lock:
+            if info is None:
+                self._containers.pop(container_id, None)
+            else:
+                self._containers[container_id] = info
+        
+        logger.debug(f"Applied {action} event for {container_id[:12]}")
+        
+        if self.on_change:
+            try:
+                self.on_change(action, container_id, info)
+            except Exception as e:
+                logger.warning(f"Watch callback failed: {e}")
+    
+    def snapshot(self) -> Dict[str, ContainerInfo]:
+        """Return a copy of the current container map, keyed by ID."""
+        with self._lock:
+            return dict(self._containers)
+    
+    def get(self, container_id: str) -> Optional[ContainerInfo]:
+        """Return the current info for one container, if it is tracked."""
+        with self._lock:
+            return self._containers.get(container_id)
+    
+    @property
+    def running(self) -> bool:
+        """Whether the event stream is still being consumed."""
+        return bool(self._thread and self._thread.is_alive())
+    
+    def stop(self) -> None:
+        """Stop watching and close the event channel."""
+        self._stopping.set()
+        
+        if self._channel:
+            try:
+                self._channel.close()
+            except Exception as e:
+                logger.warning(f"Error closing event channel: {e}")
+            finally:
+                self._channel = None
+        
+        if self._thread:
+            self._thread.join(timeout=self.inspector.docker_timeout)
+            self._thread = None
+    
+    def __enter__(self):
+        """Context manager entry."""
+        if not self.running:
+            self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.stop()